@@ -58,17 +58,20 @@ function, and converted back to a letter.
 import argparse
 import sys
 from math import gcd
-from typing import Dict
+from typing import Any
 from typing import Tuple
 
 # Mersad Library
-from mersad.util import crypto_math
-from mersad.util import string_manipulation
+from mersad.util import translation_engine
 from mersad.util import type_check
+from mersad.util.alphabet import Alphabet
 from mersad.util.base_class import KWARGS_TYPE
 from mersad.util.base_class import MersadClassicalBase
+from mersad.util.table_cache import TABLE_CACHE
 from mersad.util.terminal_app_tools import MainFunctionClassical
 from mersad.util.terminal_app_tools import monoalphabetic_common_parser
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
 
 
 def main(argv: Tuple[str] = tuple(sys.argv[1:])) -> None:
@@ -109,6 +112,11 @@ class AffineCipher(MersadClassicalBase):
         - shuffle         : (optional) randomize letter sequence order.
         - seed            : (optional)(requires shuffle) specifies a seed
                             for randomizing, default seed is 0.
+        - preserve_case   : (optional) encrypt the other case of letters
+                            which aren't in alphabet and keep their case.
+        - fold_case       : (optional) encrypt the other case of letters
+                            which aren't in alphabet like alphabet letters.
+        - strip_unknown   : (optional) delete letters which aren't in alphabet.
 
     Agent uses predefined default values for each of above arguments if
     it isn't provided by the user, for above example the key and letter sequence
@@ -120,6 +128,7 @@ class AffineCipher(MersadClassicalBase):
     Default letter sequence is set to "string.printable" except "\r".
     Default shuffle is set to False.
     Default seed is set to 0.
+    Default preserve_case, fold_case and strip_unknown are set to False.
 
     Each instance has it's own unique configurations saved in
     self.configuration and can work independent from other instances.
@@ -153,7 +162,7 @@ class AffineCipher(MersadClassicalBase):
             self.configuration["key"] = kwargs["key"]
 
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
         """
         Wrap the actual encryption/decryption function for class.
 
@@ -163,8 +172,18 @@ class AffineCipher(MersadClassicalBase):
         """
         return affine_cipher_translator(text, **kwargs)
 
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE:
+        """
+        Wrap the table builder function for class.
+
+        :return     : compiled translation table.
+        :rtype      : dict
+        """
+        return affine_cipher_table(**kwargs)
 
-def affine_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+
+def affine_cipher_translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
     """
     Translate a string with Affine cipher algorithm.
 
@@ -175,10 +194,32 @@ def affine_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
         shuffle (optional)(default = False) : randomize letter sequence order.
         seed (optional)(requires shuffle)   : specify a seed for randomizing,
                                               default seed is 0.
+        preserve_case (optional)            : translate the other case of letters
+                                              which aren't in alphabet and keep
+                                              their case, default is False.
+        fold_case (optional)                : translate the other case of letters
+                                              which aren't in alphabet like
+                                              alphabet letters, default is False.
+        strip_unknown (optional)            : delete letters which aren't in
+                                              alphabet, default is False.
         decrypt (optional)(default = False) : switch for encryption/decryption mode.
     :return                                 : translated text
     :rtype                                  : str
     """
+    return translation_engine.translate(text, affine_cipher_table(**kwargs))
+
+
+def affine_cipher_table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE:
+    """
+    Create translation table of Affine cipher algorithm.
+
+    Tables are cached in the process-wide table cache, so the table
+    of a configuration is built only once.
+
+    :param kwargs                           : same as affine_cipher_translator.
+    :return                                 : compiled translation table.
+    :rtype                                  : dict
+    """
     # for sake of readability and prettifying below code
     # I will assign aliases for key, values inside kwargs.
     sequence: str = kwargs["letter_sequence"]
@@ -186,16 +227,8 @@ def affine_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
     sequence_length: int = len(sequence)
     # key alias.
     key: int = kwargs["key"]
-    # check key is not None
-    if key is None:
-        raise ValueError("ERROR: key not found, use config method to define a key.")
-    # type annotations
-    key_a: int
-    key_b: int
-    # generate partial keys.
-    key_a, key_b = divmod(key, sequence_length)
-    # validate keys.
-    _check_keys(key_a, sequence_length)
+    # validate partial keys.
+    _split_key(key, sequence_length)
     # default shuffle to False if no shuffle is defined in kwargs.
     shuffle: bool = kwargs["shuffle"] if "shuffle" in kwargs else False
     # default seed to 0 if no seed is defined in kwargs.
@@ -203,48 +236,93 @@ def affine_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
     # default decrypt to False if no decrypt is defined in kwargs.
     decrypt: bool = kwargs["decrypt"] if "decrypt" in kwargs else False
 
-    # type annotations
-    translated_sequence: Dict[str, str]
-    # blank string.
-    translated: str = ""
+    # type annotations.
+    table_key: Tuple[Any, ...] = (
+        AffineCipher,
+        sequence,
+        key,
+        shuffle,
+        seed,
+        decrypt,
+    )
+    table: TABLE_TYPE = TABLE_CACHE.fetch(
+        table_key,
+        _build_affine_cipher_table,
+        sequence,
+        key,
+        shuffle,
+        seed,
+        decrypt,
+    )
+    # case and normalization options are built from the (cached) table.
+    return translation_engine.apply_table_options(table, table_key, **kwargs)
+
+
+def _build_affine_cipher_table(
+    sequence: str, key: int, shuffle: bool, seed: int, decrypt: bool
+) -> TABLE_TYPE:
+    """
+    Build translation table of Affine cipher algorithm without caching.
+
+    :param sequence : alphabet for encryption/decryption.
+    :param key      : key for encrypt/decrypt.
+    :param shuffle  : randomize letter sequence order.
+    :param seed     : seed for randomizing.
+    :param decrypt  : switch for encryption/decryption mode.
+    :return         : compiled translation table.
+    :rtype          : dict
+    """
+    if decrypt:
+        # decryption table is the inverse of (cached) encryption table,
+        # so there is no need for mod inverse of key a.
+        return translation_engine.invert_table(
+            affine_cipher_table(
+                letter_sequence=sequence, key=key, shuffle=shuffle, seed=seed
+            )
+        )
+
+    # length of sequence is needed for mathematical calculations.
+    sequence_length: int = len(sequence)
+    # generate partial keys.
+    key_a, key_b = divmod(key, sequence_length)
 
     # shuffle letter sequence with respect to seed if shuffle is set to True.
     if shuffle:
         # shuffle sequence
-        sequence = string_manipulation.shuffle_string(sequence, seed)
+        sequence = Alphabet(sequence).shuffled(seed)
+
+    # map the letter at index i of sequence to the letter at index
+    # (i * key_a + key_b) mod length of sequence.
+    return translation_engine.compile_sequences(
+        sequence,
+        [
+            sequence[(index * key_a + key_b) % sequence_length]
+            for index in range(sequence_length)
+        ],
+    )
 
-    # create a table mapping that maps every letter in sequence to
-    # it's equivalent new letter with respect to the key and size of sequence.
-    if decrypt:
-        # find mode inverse of key a.
-        key_a_mode_inverse = crypto_math.mod_inverse(key_a, sequence_length)
-        # generate decryption letter sequence map.
-        translated_sequence = {
-            i: sequence[
-                ((sequence.index(i) - key_b) * key_a_mode_inverse) % sequence_length
-            ]
-            for i in sequence
-        }
-    else:
-        # generate encryption letter sequence map.
-        translated_sequence = {
-            i: sequence[(sequence.index(i) * key_a + key_b) % sequence_length]
-            for i in sequence
-        }
-
-    # select each letter in the text and only if it is also provided in sequence
-    # from user and replace it with new letter.
-    for letter in text:
-        if letter in sequence:
-            # get the translated letter for this letter from mapping.
-            translated_letter = translated_sequence[letter]
-        else:
-            # if the letter in the text isn't in sequence, it remains unchanged.
-            translated_letter = letter
-        # add new letter to translated string.
-        translated += translated_letter
-
-    return translated
+
+def _split_key(key: int, sequence_length: int) -> Tuple[int, int]:
+    """
+    Split key into partial keys and validate them.
+
+    :param key              : key for encrypt/decrypt.
+    :param sequence_length  : length of letter sequence.
+    :raise ValueError       : if key is None or keys are incorrect.
+    :return                 : key a and key b.
+    :rtype                  : tuple
+    """
+    # check key is not None
+    if key is None:
+        raise ValueError("ERROR: key not found, use config method to define a key.")
+    # type annotations
+    key_a: int
+    key_b: int
+    # generate partial keys.
+    key_a, key_b = divmod(key, sequence_length)
+    # validate keys.
+    _check_keys(key_a, sequence_length)
+    return key_a, key_b
 
 
 def _check_keys(key_a: int, sequence_length: int) -> None:
@@ -279,6 +357,9 @@ class AffineCipherMainFunction(MainFunctionClassical):
             letter_sequence=args.letters,
             shuffle=args.shuffle,
             seed=args.seed,
+            preserve_case=args.preserve_case,
+            fold_case=args.fold_case,
+            strip_unknown=args.strip_unknown,
         )
 
     def _custom_arguments(self) -> argparse.ArgumentParser:
@@ -60,15 +60,19 @@ last letter, and so on.
 # Python Standard Library
 import argparse
 import sys
-from typing import Dict
+from typing import Any
 from typing import Tuple
 
 # Mersad Library
-from mersad.util import string_manipulation
+from mersad.util import translation_engine
+from mersad.util.alphabet import Alphabet
 from mersad.util.base_class import KWARGS_TYPE
 from mersad.util.base_class import MersadClassicalBase
+from mersad.util.table_cache import TABLE_CACHE
 from mersad.util.terminal_app_tools import MainFunctionClassical
 from mersad.util.terminal_app_tools import monoalphabetic_common_parser
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
 
 
 def main(argv: Tuple[str] = tuple(sys.argv[1:])) -> None:
@@ -112,6 +116,11 @@ class AtbashCipher(MersadClassicalBase):
         - shuffle         : (optional) randomize letter sequence order.
         - seed            : (optional)(requires shuffle) specifies a seed
                             for randomizing, default seed is 0.
+        - preserve_case   : (optional) encrypt the other case of letters
+                            which aren't in alphabet and keep their case.
+        - fold_case       : (optional) encrypt the other case of letters
+                            which aren't in alphabet like alphabet letters.
+        - strip_unknown   : (optional) delete letters which aren't in alphabet.
 
     Agent uses predefined default values for each of above arguments if
     it isn't provided by the user, for above example the letter sequence
@@ -121,6 +130,7 @@ class AtbashCipher(MersadClassicalBase):
     Default letter sequence is set to "string.printable" except "\r".
     Default shuffle is set to False.
     Default seed is set to 0.
+    Default preserve_case, fold_case and strip_unknown are set to False.
 
     Each instance has it's own unique configurations saved in
     self.configuration and can work independent from other instances.
@@ -144,7 +154,7 @@ class AtbashCipher(MersadClassicalBase):
     """
 
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
         """
         Wrap the actual encryption/decryption function for class.
 
@@ -154,8 +164,18 @@ class AtbashCipher(MersadClassicalBase):
         """
         return atbash_cipher_translator(text, **kwargs)
 
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE:
+        """
+        Wrap the table builder function for class.
+
+        :return     : compiled translation table.
+        :rtype      : dict
+        """
+        return atbash_cipher_table(**kwargs)
+
 
-def atbash_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+def atbash_cipher_translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
     """
     Translate a string with Atbash cipher algorithm.
 
@@ -170,52 +190,74 @@ def atbash_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
         shuffle (optional)(default = False) : randomize letter sequence order.
         seed (optional)(requires shuffle)   : specify a seed for randomizing,
                                               default seed is 0.
+        preserve_case (optional)            : translate the other case of letters
+                                              which aren't in alphabet and keep
+                                              their case, default is False.
+        fold_case (optional)                : translate the other case of letters
+                                              which aren't in alphabet like
+                                              alphabet letters, default is False.
+        strip_unknown (optional)            : delete letters which aren't in
+                                              alphabet, default is False.
         decrypt (optional)(default = False) : switch for encryption/decryption mode.
     :return                                 : translated text
     :rtype                                  : str
     """
+    return translation_engine.translate(text, atbash_cipher_table(**kwargs))
+
+
+def atbash_cipher_table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE:
+    """
+    Create translation table of Atbash cipher algorithm.
+
+    Tables are cached in the process-wide table cache, so the table
+    of a configuration is built only once. Atbash is its own inverse,
+    so encryption and decryption share the same table.
+
+    :param kwargs                           : same as atbash_cipher_translator.
+    :return                                 : compiled translation table.
+    :rtype                                  : dict
+    """
     # for sake of readability and prettifying below code
     # I will assign aliases for key, values inside kwargs.
     sequence: str = kwargs["letter_sequence"]
-    # get length of letter sequence, minus 1 to be start from 0
-    sequence_length: int = len(sequence) - 1
     # default shuffle to False if no shuffle is defined in kwargs.
     shuffle: bool = kwargs["shuffle"] if "shuffle" in kwargs else False
     # default seed to 0 if no seed is defined in kwargs.
     seed: int = kwargs["seed"] if "seed" in kwargs else 0
 
-    # type annotations
-    translated_sequence: Dict[str, str]
-    # blank string.
-    translated: str = ""
+    # type annotations.
+    table_key: Tuple[Any, ...] = (AtbashCipher, sequence, shuffle, seed)
+    table: TABLE_TYPE = TABLE_CACHE.fetch(
+        table_key,
+        _build_atbash_cipher_table,
+        sequence,
+        shuffle,
+        seed,
+    )
+    # case and normalization options are built from the (cached) table.
+    return translation_engine.apply_table_options(table, table_key, **kwargs)
+
+
+def _build_atbash_cipher_table(
+    sequence: str, shuffle: bool, seed: int
+) -> TABLE_TYPE:
+    """
+    Build translation table of Atbash cipher algorithm without caching.
 
+    :param sequence : alphabet for encryption/decryption.
+    :param shuffle  : randomize letter sequence order.
+    :param seed     : seed for randomizing.
+    :return         : compiled translation table.
+    :rtype          : dict
+    """
     # shuffle letter sequence with respect to seed if shuffle is set to True.
     if shuffle:
         # shuffle sequence.
-        sequence = string_manipulation.shuffle_string(sequence, seed)
-
-    # create a table mapping that maps every letter in sequence to
-    # it's equivalent new letter with respect to the key and size of sequence.
-    translated_sequence = {
-        i: sequence[sequence_length - sequence.index(i)] for i in sequence
-    }
-
-    # type annotations
-    translated_letter: str
-
-    # select each letter in the text and only if it is also provided in sequence
-    # from user and replace it with new letter .
-    for letter in text:
-        if letter in sequence:
-            # get the translated letter for this letter from mapping
-            translated_letter = translated_sequence[letter]
-        else:
-            # if the letter in the text isn't in sequence, it remains unchanged.
-            translated_letter = letter
-        # add new letter to translated string.
-        translated += translated_letter
+        sequence = Alphabet(sequence).shuffled(seed)
 
-    return translated
+    # map every letter in sequence to the letter with the same
+    # index in the reversed sequence.
+    return translation_engine.compile_sequences(sequence, sequence[::-1])
 
 
 class AtbashCipherMainFunction(MainFunctionClassical):
@@ -224,5 +266,10 @@ class AtbashCipherMainFunction(MainFunctionClassical):
     def _config_agent(self, agent, args: argparse.Namespace) -> None:
         """Config the agent parameters in process method."""
         agent.config(
-            letter_sequence=args.letters, shuffle=args.shuffle, seed=args.seed
+            letter_sequence=args.letters,
+            shuffle=args.shuffle,
+            seed=args.seed,
+            preserve_case=args.preserve_case,
+            fold_case=args.fold_case,
+            strip_unknown=args.strip_unknown,
         )
@@ -11,14 +11,24 @@ from typing import Tuple
 from mersad.util.base_class import KWARGS_TYPE
 from mersad.util.base_class import MersadClassicalBase
 from mersad.util.terminal_app_tools import MainFunctionClassical
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
 
 def main(argv: Tuple[str] = ...) -> None: ...
 
 class AtbashCipher(MersadClassicalBase):
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str: ...
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE: ...
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE: ...
 
-def atbash_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str: ...
+def atbash_cipher_translator(
+    text: TEXT_TYPE, **kwargs: KWARGS_TYPE
+) -> TEXT_TYPE: ...
+def atbash_cipher_table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE: ...
+def _build_atbash_cipher_table(
+    sequence: str, shuffle: bool, seed: int
+) -> TABLE_TYPE: ...
 
 class AtbashCipherMainFunction(MainFunctionClassical):
     def _config_agent(self, agent: Any, args: argparse.Namespace) -> None: ...
@@ -55,18 +55,22 @@ alphabet with letters from a cipher alphabet.
 
 # Python Standard Library
 import argparse
-import string
 import sys
+from typing import Any
 from typing import Dict
 from typing import Tuple
 
 # Mersad Library
-from mersad.util import string_manipulation
-from mersad.util import type_check
+from mersad.util import translation_engine
+from mersad.util.alphabet import DEFAULT_ALPHABET
+from mersad.util.alphabet import Alphabet
 from mersad.util.base_class import KWARGS_TYPE
 from mersad.util.base_class import MersadClassicalBase
+from mersad.util.table_cache import TABLE_CACHE
 from mersad.util.terminal_app_tools import MainFunctionClassical
 from mersad.util.terminal_app_tools import monoalphabetic_common_parser
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
 
 
 def main(argv: Tuple[str] = tuple(sys.argv[1:])) -> None:
@@ -112,11 +116,17 @@ class MixalphCipher(MersadClassicalBase):
         - shuffle         : (optional) randomize letter sequence order.
         - seed            : (optional)(requires shuffle) specifies a seed
                             for randomizing, default seed is 0.
+        - preserve_case   : (optional) encrypt the other case of letters
+                            which aren't in alphabet and keep their case.
+        - fold_case       : (optional) encrypt the other case of letters
+                            which aren't in alphabet like alphabet letters.
+        - strip_unknown   : (optional) delete letters which aren't in alphabet.
 
     Default letter sequence is set to "string.printable" except "\r".
     Default sort key is set to "string.printable" except "\r".
     Default shuffle is set to False.
     Default seed is set to 0.
+    Default preserve_case, fold_case and strip_unknown are set to False.
 
     Each instance has it's own unique configurations saved in
     self.configuration and can work independent from other instances.
@@ -150,7 +160,7 @@ class MixalphCipher(MersadClassicalBase):
 
     def _init_subroutines(self) -> None:
         """Extend _defaults dictionary with default value for sort_key."""
-        self._defaults["sort_key"] = string.printable.replace("\r", "")
+        self._defaults["sort_key"] = DEFAULT_ALPHABET
 
     def _config_subroutines(self, **kwargs: KWARGS_TYPE) -> None:
         """
@@ -159,15 +169,15 @@ class MixalphCipher(MersadClassicalBase):
         :raise ValueError: if type of a dictionary value is wrong.
         """
         if "key" in kwargs and kwargs["key"] is not None:
-            type_check.type_guard(kwargs["key"], str)
-            self.configuration["key"] = kwargs["key"]
+            key: Alphabet = self._to_alphabet(kwargs["key"])
+            self._check_sequence(key, "key")
+            self.configuration["key"] = key
 
         if "sort_key" in kwargs:
-            type_check.type_guard(kwargs["sort_key"], str)
-            self.configuration["sort_key"] = kwargs["sort_key"]
+            self.configuration["sort_key"] = self._to_alphabet(kwargs["sort_key"])
 
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
         """
         Wrap the actual encryption/decryption function for class.
 
@@ -177,8 +187,18 @@ class MixalphCipher(MersadClassicalBase):
         """
         return mixalph_cipher_translator(text, **kwargs)
 
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE:
+        """
+        Wrap the table builder function for class.
+
+        :return     : compiled translation table.
+        :rtype      : dict
+        """
+        return mixalph_cipher_table(**kwargs)
+
 
-def mixalph_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+def mixalph_cipher_translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
     """
     Translate a string with Mixed Alphabet cipher algorithm.
 
@@ -214,17 +234,39 @@ def mixalph_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
         shuffle (optional)(default = False) : randomize letter sequence order.
         seed (optional)(requires shuffle)   : specify a seed for randomizing,
                                               default seed is 0.
+        preserve_case (optional)            : translate the other case of letters
+                                              which aren't in alphabet and keep
+                                              their case, default is False.
+        fold_case (optional)                : translate the other case of letters
+                                              which aren't in alphabet like
+                                              alphabet letters, default is False.
+        strip_unknown (optional)            : delete letters which aren't in
+                                              alphabet, default is False.
         decrypt (optional)(default = False) : switch for encryption/decryption mode.
     :return                                 : translated text
     :rtype                                  : str
     """
+    return translation_engine.translate(text, mixalph_cipher_table(**kwargs))
+
+
+def mixalph_cipher_table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE:
+    """
+    Create translation table of Mixed Alphabet cipher algorithm.
+
+    Tables are cached in the process-wide table cache, so the table
+    of a configuration is built only once.
+
+    :param kwargs                           : same as mixalph_cipher_translator.
+    :return                                 : compiled translation table.
+    :rtype                                  : dict
+    """
     # for sake of readability and prettifying below code
     # I will assign aliases for key, values inside kwargs.
     key_sequence: str = kwargs["key"]
     if key_sequence is None:
         raise ValueError("ERROR: key not found, use config method to define a key.")
     # default sort key to "string.printable" except "\r".
-    default_sort_key: str = string.printable.replace("\r", "")
+    default_sort_key: Alphabet = DEFAULT_ALPHABET
     sort_key: str = kwargs["sort_key"] if "sort_key" in kwargs else default_sort_key
     # default shuffle to False if no shuffle is defined in kwargs.
     shuffle: bool = kwargs["shuffle"] if "shuffle" in kwargs else False
@@ -233,62 +275,71 @@ def mixalph_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
     # default decrypt to False if no decrypt is defined in kwargs.
     decrypt: bool = kwargs["decrypt"] if "decrypt" in kwargs else False
 
-    # type annotations
-    translated_sequence: Dict[str, str]
-    # blank string.
-    translated: str = ""
+    # type annotations.
+    table_key: Tuple[Any, ...] = (
+        MixalphCipher,
+        key_sequence,
+        sort_key,
+        shuffle,
+        seed,
+        decrypt,
+    )
+    table: TABLE_TYPE = TABLE_CACHE.fetch(
+        table_key,
+        _build_mixalph_cipher_table,
+        key_sequence,
+        sort_key,
+        shuffle,
+        seed,
+        decrypt,
+    )
+    # case and normalization options are built from the (cached) table.
+    return translation_engine.apply_table_options(table, table_key, **kwargs)
+
+
+def _build_mixalph_cipher_table(
+    key_sequence: str, sort_key: str, shuffle: bool, seed: int, decrypt: bool
+) -> TABLE_TYPE:
+    """
+    Build translation table of Mixed Alphabet cipher algorithm without caching.
+
+    :param key_sequence : the letter sequence for substitution.
+    :param sort_key     : a key for sorting alphabet.
+    :param shuffle      : randomize letter sequence order.
+    :param seed         : seed for randomizing.
+    :param decrypt      : switch for encryption/decryption mode.
+    :return             : compiled translation table.
+    :rtype              : dict
+    """
+    if decrypt:
+        # decryption table is the inverse of (cached) encryption table.
+        return translation_engine.invert_table(
+            mixalph_cipher_table(
+                key=key_sequence, sort_key=sort_key, shuffle=shuffle, seed=seed
+            )
+        )
 
     # shuffle  key sequence with respect to seed if shuffle is set to True.
     if shuffle:
         # shuffle sequence.
-        key_sequence = string_manipulation.shuffle_string(key_sequence, seed)
+        key_sequence = Alphabet(key_sequence).shuffled(seed)
 
     # create sorted cipher alphabet from letter sequence
-    # first: check if every letter in key sequence is also in sort key
+    # first: map every letter of sort key to its (first) index,
+    # letters with lower indexes come closer to the left of final sorted string.
+    sort_index: Dict[str, int] = Alphabet(sort_key).indexes
+
+    # second: check if every letter in key sequence is also in sort key
     for letter in key_sequence:
-        if letter not in sort_key:
+        if letter not in sort_index:
             raise ValueError("ERROR: sort key must contain all the letters in key.")
 
-    # second: define the sorting function
-    def _sort_key(x: str) -> int:
-        """Sort key function."""
-        # returns the index of a letter in sort_key string,
-        # letters with lower indexes come closer to the left of final sorted string.
-        return sort_key.index(x)
-
     # third: sort sequence with the sorted() builtin function
-    # and custom _sort_key function
-    plain_alphabet: str = "".join(sorted(key_sequence, key=_sort_key))
+    # and index of letters in sort key
+    plain_alphabet: str = "".join(sorted(key_sequence, key=sort_index.__getitem__))
 
-    # create a table mapping that maps every letter in sequence to
-    # it's equivalent new letter.
-    if decrypt:
-        # when decrypting map sequence letters to key plain alphabet
-        translated_sequence = {
-            i: plain_alphabet[key_sequence.index(i)] for i in key_sequence
-        }
-    else:
-        # when encrypting map plain alphabet letters to key sequence letters
-        translated_sequence = {
-            i: key_sequence[plain_alphabet.index(i)] for i in plain_alphabet
-        }
-
-    # type annotations
-    translated_letter: str
-
-    # select each letter in the text and only if it is also provided in sequence
-    # from user and replace it with new letter.
-    for letter in text:
-        if letter in key_sequence:
-            # get the translated letter for this letter from mapping
-            translated_letter = translated_sequence[letter]
-        else:
-            # if the letter in the text isn't in sequence, it remains unchanged.
-            translated_letter = letter
-        # add new letter to translated string.
-        translated += translated_letter
-
-    return translated
+    # plain alphabet letters are mapped to key sequence letters.
+    return translation_engine.compile_sequences(plain_alphabet, key_sequence)
 
 
 class MixalphCipherMainFunction(MainFunctionClassical):
@@ -301,6 +352,9 @@ class MixalphCipherMainFunction(MainFunctionClassical):
             sort_key=args.sort_key,
             shuffle=args.shuffle,
             seed=args.seed,
+            preserve_case=args.preserve_case,
+            fold_case=args.fold_case,
+            strip_unknown=args.strip_unknown,
         )
 
     def _custom_arguments(self) -> argparse.ArgumentParser:
@@ -320,8 +374,8 @@ class MixalphCipherMainFunction(MainFunctionClassical):
         parser.add_argument(
             "-sk",
             "--sort_key",
-            type=str,
-            default=string.printable.replace("\r", ""),
+            type=Alphabet,
+            default=DEFAULT_ALPHABET,
             help=help_sorted_key,
         )
 
@@ -11,6 +11,8 @@ from typing import Tuple
 from mersad.util.base_class import KWARGS_TYPE
 from mersad.util.base_class import MersadClassicalBase
 from mersad.util.terminal_app_tools import MainFunctionClassical
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
 
 def main(argv: Tuple[str] = ...) -> None: ...
 
@@ -19,9 +21,17 @@ class MixalphCipher(MersadClassicalBase):
     def _init_subroutines(self) -> None: ...
     def _config_subroutines(self, **kwargs: KWARGS_TYPE) -> None: ...
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str: ...
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE: ...
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE: ...
 
-def mixalph_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str: ...
+def mixalph_cipher_translator(
+    text: TEXT_TYPE, **kwargs: KWARGS_TYPE
+) -> TEXT_TYPE: ...
+def mixalph_cipher_table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE: ...
+def _build_mixalph_cipher_table(
+    key_sequence: str, sort_key: str, shuffle: bool, seed: int, decrypt: bool
+) -> TABLE_TYPE: ...
 
 class MixalphCipherMainFunction(MainFunctionClassical):
     def _config_agent(self, agent: Any, args: argparse.Namespace) -> None: ...
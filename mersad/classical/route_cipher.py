@@ -59,16 +59,23 @@ read off following the route chosen.
 # Python Standard Library
 import argparse
 import sys
+from array import array
 from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Tuple
 
 # Mersad Library
+from mersad.util import disk_cache
+from mersad.util import string_manipulation
 from mersad.util import type_check
 from mersad.util.base_class import KWARGS_TYPE
 from mersad.util.base_class import MersadClassicalBase
+from mersad.util.table_cache import TABLE_CACHE
 from mersad.util.terminal_app_tools import MainFunctionClassical
 from mersad.util.terminal_app_tools import monoalphabetic_common_parser
+from mersad.util.translation_engine import BUFFER_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
 
 
 def main(argv: Tuple[str] = tuple(sys.argv[1:])) -> None:
@@ -152,8 +159,12 @@ class RouteCipher(MersadClassicalBase):
             type_check.type_guard(kwargs["key"], int)
             self.configuration["key"] = kwargs["key"]
         if "fill" in kwargs:
-            type_check.type_guard(kwargs["fill"], str)
-            self.configuration["fill"] = kwargs["fill"]
+            fill: KWARGS_TYPE = kwargs["fill"]
+            # byte fill letters are stored as string of letters.
+            if isinstance(fill, (bytes, bytearray)):
+                fill = string_manipulation.bytes_to_letters(fill)
+            type_check.type_guard(fill, str)
+            self.configuration["fill"] = fill
         if "route" in kwargs:
             type_check.type_guard(kwargs["route"], list)
             self.configuration["route"] = kwargs["route"]
@@ -193,7 +204,7 @@ class RouteCipher(MersadClassicalBase):
         return configurations
 
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
         """
         Wrap the actual encryption/decryption function for class.
 
@@ -203,8 +214,45 @@ class RouteCipher(MersadClassicalBase):
         """
         return route_cipher_translator(text, **kwargs)
 
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> "RouteTable":
+        """
+        Wrap the table builder function for class.
+
+        :return     : compiled route table.
+        :rtype      : RouteTable
+        """
+        return route_cipher_table(**kwargs)
+
+    @staticmethod
+    def _apply_table(text: TEXT_TYPE, table: "RouteTable") -> TEXT_TYPE:
+        """
+        Wrap the table translator function for class.
+
+        :param text     : string to be translated.
+        :param table    : compiled route table.
+        :return         : translated text
+        :rtype          : str
+        """
+        return route_cipher_transpose(text, table)
 
-def route_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+    @staticmethod
+    def _apply_table_into(
+        source: BUFFER_TYPE, destination: BUFFER_TYPE, table: "RouteTable"
+    ) -> int:
+        """
+        Wrap the buffer translator function for class.
+
+        :param source       : bytes-like data to be translated.
+        :param destination  : writable buffer, it can be same bytearray as source.
+        :param table        : compiled route table.
+        :return             : number of bytes written into destination.
+        :rtype              : int
+        """
+        return route_cipher_transpose_into(source, destination, table)
+
+
+def route_cipher_translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
     """
     Translate a string with Route cipher algorithm.
 
@@ -253,6 +301,34 @@ def route_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
     :return                                 : translated text
     :rtype                                  : str
     """
+    return route_cipher_transpose(text, route_cipher_table(**kwargs))
+
+
+class RouteTable(NamedTuple):
+    """
+    Compiled table of Route cipher algorithm.
+
+    order is a gather list, the n-th letter of translated text is the
+    letter at index order[n] of the (padded) source text.
+    """
+
+    key: int
+    fill: str
+    order: Tuple[int, ...]
+    pad: bool
+
+
+def route_cipher_table(**kwargs: KWARGS_TYPE) -> RouteTable:
+    """
+    Create translation table of Route cipher algorithm.
+
+    Tables are cached in the process-wide table cache, so the table
+    of a configuration is built only once.
+
+    :param kwargs                           : same as route_cipher_translator.
+    :return                                 : compiled route table.
+    :rtype                                  : RouteTable
+    """
     # for sake of readability and prettifying below code
     # I will assign aliases for key, values inside kwargs.
     key: int = kwargs["key"]
@@ -260,50 +336,222 @@ def route_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
         raise ValueError("ERROR: key not found, use config method to define a key.")
     # fill character.
     fill: str = kwargs["fill"] if "fill" in kwargs and kwargs["fill"] else "X"
-    if key is None:
-        raise ValueError("ERROR: key not found, use config method to define a key.")
     # route path indexes.
-    route: List[int] = kwargs["route"]
+    route: List[int] = kwargs["route"] if "route" in kwargs else None
+    if route is None:
+        raise ValueError(
+            "ERROR: route not found, use config method to define a route."
+        )
     # check rout indexes to be unique by comparing its length to set length.
     if len(route) != len(set(route)):
         raise ValueError("ERROR: route indexes must be unique.")
     # default decrypt to False if no decrypt is defined in kwargs.
     decrypt: bool = kwargs["decrypt"] if "decrypt" in kwargs else False
 
-    # store length of string.
-    # length of string is needed for mathematical calculations.
-    string_length: int = len(text)
+    return TABLE_CACHE.fetch(
+        (RouteCipher, key, fill, tuple(route), decrypt),
+        _build_route_cipher_table,
+        key,
+        fill,
+        route,
+        decrypt,
+    )
+
+
+def _build_route_cipher_table(
+    key: int, fill: str, route: List[int], decrypt: bool
+) -> RouteTable:
+    """
+    Build translation table of Route cipher algorithm without caching.
+
+    :param key      : number of columns in grid.
+    :param fill     : character to fill empty spaces in grid.
+    :param route    : route to read from.
+    :param decrypt  : switch for encryption/decryption mode.
+    :return         : compiled route table.
+    :rtype          : RouteTable
+    """
+    if decrypt:
+        # decryption places n-th letter of text in cell route[n] of grid,
+        # which is same as gathering letters with the inverse of route.
+        order: List[int] = [0] * len(route)
+        for i, j in enumerate(route):
+            order[j] = i
+        return RouteTable(key, fill, tuple(order), False)
+    # encryption gathers letters from the padded grid with route itself.
+    return RouteTable(key, fill, tuple(route), True)
+
+
+def route_cipher_transpose(text: TEXT_TYPE, table: RouteTable) -> TEXT_TYPE:
+    """
+    Translate a string with a compiled Route cipher table.
+
+    Binary data (bytes or bytearray) is transposed byte by byte, fill
+    letter is converted to its byte (latin-1) for padding binary data.
+
+    :param text     : string or binary data to be translated.
+    :param table    : compiled route table.
+    :return         : translated text, same type as text.
+    :rtype          : str, bytes or bytearray
+    """
+    # type annotations.
+    padding: TEXT_TYPE = route_cipher_padding(
+        len(text), table, isinstance(text, str)
+    )
+
+    if isinstance(text, str):
+        # add fill characters to the end of string so that the remainder
+        # of string length to key become zero.
+        text += padding
+        # gather letters based on the table order.
+        return "".join([text[index] for index in table.order])
+
+    # binary data: pad with fill byte and gather bytes based on the table order.
+    text = text + padding
+    return type(text)(map(text.__getitem__, table.order))
+
+
+def route_cipher_transpose_into(
+    source: BUFFER_TYPE, destination: BUFFER_TYPE, table: RouteTable
+) -> int:
+    """
+    Translate binary data into a preallocated buffer with a Route cipher table.
+
+    Bytes are gathered directly from source into destination, padding
+    bytes are read from fill letter without extending source. When
+    source and destination are the same bytearray, data is permuted
+    in place, any other view of destination memory (even the same
+    memoryview) is copied first.
+
+    :param source       : bytes-like data to be translated.
+    :param destination  : writable buffer at least as large as route.
+    :param table        : compiled route table.
+    :raise ValueError   : if destination is too small.
+    :return             : number of bytes written into destination.
+    :rtype              : int
+    """
+    if source is destination and isinstance(destination, bytearray):
+        return _route_transpose_inplace(destination, table)
+
+    source_view: memoryview = memoryview(source).cast("B")
+    destination_view: memoryview = memoryview(destination).cast("B")
+    if source_view.obj is destination_view.obj:
+        # gathering would overwrite source bytes before reading them.
+        source_view = memoryview(source_view.tobytes())
+    length: int = len(source_view)
+    padding: bytes = route_cipher_padding(length, table, False)
+    if len(destination_view) < len(table.order):
+        raise ValueError("ERROR: destination buffer is smaller than route.")
+
+    for i, index in enumerate(table.order):
+        destination_view[i] = (
+            source_view[index] if index < length else padding[index - length]
+        )
+    return len(table.order)
+
+
+def _route_transpose_inplace(buffer: bytearray, table: RouteTable) -> int:
+    """
+    Permute a bytearray in place with a Route cipher table.
+
+    Permutation is done cycle by cycle, so apart from the buffer only
+    a bit map of visited positions is kept in memory.
+
+    :param buffer   : bytearray to be translated.
+    :param table    : compiled route table.
+    :return         : number of bytes in translated buffer.
+    :rtype          : int
+    """
+    # extend buffer with padding before taking any view of it.
+    buffer.extend(route_cipher_padding(len(buffer), table, False))
+    order: Tuple[int, ...] = table.order
+    # one bit for each position of buffer.
+    visited: bytearray = bytearray((len(order) + 7) // 8)
+
+    for start in range(len(order)):
+        if visited[start >> 3] & (1 << (start & 7)):
+            continue
+        # follow the cycle which starts at this position.
+        first: int = buffer[start]
+        current: int = start
+        while True:
+            visited[current >> 3] |= 1 << (current & 7)
+            following: int = order[current]
+            if following == start:
+                buffer[current] = first
+                break
+            buffer[current] = buffer[following]
+            current = following
+    return len(order)
+
+
+def route_cipher_padding(length: int, table: RouteTable, text: bool) -> TEXT_TYPE:
+    """
+    Validate text length against route and create its padding.
+
+    :param length   : length of text to be translated.
+    :param table    : compiled route table.
+    :param text     : create padding for a string if True, else for bytes.
+    :raise ValueError   : if route length doesn't match text length.
+    :return         : fill letters which should be added to end of text.
+    :rtype          : str or bytes
+    """
     # get quotient and remainder of string length to key.
-    quotient, remainder = divmod(string_length, key)
+    quotient, remainder = divmod(length, table.key)
 
     # rout length must be equal to number of cells in a 2D grid of quotient x key.
     # if remainder is not zero, the grid becomes (quotient + 1) x key.
-    quotient: int = quotient if remainder == 0 else quotient + 1
-    if len(route) != (quotient * key):
+    quotient = quotient if remainder == 0 else quotient + 1
+    if len(table.order) != (quotient * table.key):
         raise ValueError("ERROR: rout length is wrong.")
 
-    if decrypt:
-        # create a 2D grid of size quotient x key [note that quotient may have been
-        # modified in last block of code, here we use the modified one].
-        grid: List[str] = ["" for i in range(quotient * key)]
-        # place string letters in grid with respect of route index.
-        for i, j in enumerate(route):
-            grid[j] = text[i]
-        translated: str = "".join(grid)
-    else:
-        # if remainder  is not zero, add fill characters to the end of string
-        # so that the remainder become zero.
-        if remainder != 0:
-            # turn string into list of letters.
-            lst: List[str] = list(text)
-            # add enough fill characters to end of list.
-            lst.extend([fill] * (key - remainder))
-            # create new string.
-            text = "".join(lst)
-        # encrypt based on the route.
-        translated: str = "".join([text[index] for index in route])
-
-    return translated
+    fill: TEXT_TYPE = table.fill if text else table.fill.encode("latin-1")
+    # if remainder is not zero, fill characters are added to the end of string
+    # so that the remainder become zero.
+    if table.pad and remainder != 0:
+        return fill * (table.key - remainder)
+    return fill[:0]
+
+
+def _encode_route_table(table: RouteTable) -> Tuple[int, bytes]:
+    """
+    Encode a route table for the disk cache.
+
+    Payload is key, pad switch and length of fill letter in utf-8,
+    followed by the gather order and the fill letter.
+
+    :param table    : compiled route table.
+    :return         : length of order and payload.
+    :rtype          : tuple
+    """
+    fill: bytes = table.fill.encode("utf-8")
+    header: array = array("I", [table.key, table.pad, len(fill)])
+    order: array = array("I", table.order)
+    return len(order), header.tobytes() + order.tobytes() + fill
+
+
+def _decode_route_table(payload: memoryview, count: int) -> RouteTable:
+    """
+    Decode a route table from the disk cache.
+
+    :param payload      : content of file after header.
+    :param count        : length of order.
+    :raise ValueError   : if payload size doesn't match its header.
+    :return             : compiled route table.
+    :rtype              : RouteTable
+    """
+    size: int = (count + 3) * 4
+    if len(payload) < size:
+        raise ValueError("ERROR: table size doesn't match its header.")
+    with payload[:size].cast("I") as words:
+        key, pad, fill_size = words[:3]
+        order: Tuple[int, ...] = tuple(words[3:])
+    if len(order) != count or len(payload) != size + fill_size:
+        raise ValueError("ERROR: table size doesn't match its header.")
+    return RouteTable(key, bytes(payload[size:]).decode("utf-8"), order, bool(pad))
+
+
+disk_cache.register_codec(3, RouteTable, _encode_route_table, _decode_route_table)
 
 
 class RouteCipherMainFunction(MainFunctionClassical):
@@ -6,12 +6,16 @@
 import argparse
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import NamedTuple
 from typing import Tuple
 
 # Mersad Library
 from mersad.util.base_class import KWARGS_TYPE
 from mersad.util.base_class import MersadClassicalBase
 from mersad.util.terminal_app_tools import MainFunctionClassical
+from mersad.util.translation_engine import BUFFER_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
 
 def main(argv: Tuple[str] = ...) -> None: ...
 
@@ -22,9 +26,39 @@ class RouteCipher(MersadClassicalBase):
         self, configurations: Dict[str, KWARGS_TYPE], **kwargs: KWARGS_TYPE
     ) -> Dict[str, KWARGS_TYPE]: ...
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str: ...
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE: ...
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> RouteTable: ...
+    @staticmethod
+    def _apply_table(text: TEXT_TYPE, table: RouteTable) -> TEXT_TYPE: ...
+    @staticmethod
+    def _apply_table_into(
+        source: BUFFER_TYPE, destination: BUFFER_TYPE, table: RouteTable
+    ) -> int: ...
+
+def route_cipher_translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE: ...
+
+class RouteTable(NamedTuple):
+    key: int
+    fill: str
+    order: Tuple[int, ...]
+    pad: bool
+
+def route_cipher_table(**kwargs: KWARGS_TYPE) -> RouteTable: ...
+def _build_route_cipher_table(
+    key: int, fill: str, route: List[int], decrypt: bool
+) -> RouteTable: ...
+def route_cipher_transpose(text: TEXT_TYPE, table: RouteTable) -> TEXT_TYPE: ...
+def route_cipher_transpose_into(
+    source: BUFFER_TYPE, destination: BUFFER_TYPE, table: RouteTable
+) -> int: ...
+def _route_transpose_inplace(buffer: bytearray, table: RouteTable) -> int: ...
+def route_cipher_padding(
+    length: int, table: RouteTable, text: bool
+) -> TEXT_TYPE: ...
 
-def route_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str: ...
+def _encode_route_table(table: RouteTable) -> Tuple[int, bytes]: ...
+def _decode_route_table(payload: memoryview, count: int) -> RouteTable: ...
 
 class RouteCipherMainFunction(MainFunctionClassical):
     def _config_agent(self, agent: Any, args: argparse.Namespace) -> None: ...
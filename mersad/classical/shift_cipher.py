@@ -57,16 +57,20 @@ fixed number of positions down the alphabet.
 # Python Standard Library
 import argparse
 import sys
-from typing import Dict
+from typing import Any
 from typing import Tuple
 
 # Mersad Library
-from mersad.util import string_manipulation
+from mersad.util import translation_engine
 from mersad.util import type_check
+from mersad.util.alphabet import Alphabet
 from mersad.util.base_class import KWARGS_TYPE
 from mersad.util.base_class import MersadClassicalBase
+from mersad.util.table_cache import TABLE_CACHE
 from mersad.util.terminal_app_tools import MainFunctionClassical
 from mersad.util.terminal_app_tools import monoalphabetic_common_parser
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
 
 
 def main(argv: Tuple[str] = tuple(sys.argv[1:])) -> None:
@@ -107,6 +111,11 @@ class ShiftCipher(MersadClassicalBase):
         - shuffle         : (optional) randomize letter sequence order.
         - seed            : (optional)(requires shuffle) specifies a seed
                             for randomizing, default seed is 0.
+        - preserve_case   : (optional) encrypt the other case of letters
+                            which aren't in alphabet and keep their case.
+        - fold_case       : (optional) encrypt the other case of letters
+                            which aren't in alphabet like alphabet letters.
+        - strip_unknown   : (optional) delete letters which aren't in alphabet.
 
     Agent uses predefined default values for each of above arguments if
     it isn't provided by the user, for above example the key and letter sequence
@@ -118,6 +127,7 @@ class ShiftCipher(MersadClassicalBase):
     Default letter sequence is set to "string.printable" except "\r".
     Default shuffle is set to False.
     Default seed is set to 0.
+    Default preserve_case, fold_case and strip_unknown are set to False.
 
     Each instance has it's own unique configurations saved in
     self.configuration and can work independent from other instances.
@@ -151,7 +161,7 @@ class ShiftCipher(MersadClassicalBase):
             self.configuration["key"] = kwargs["key"]
 
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
         """
         Wrap the actual encryption/decryption function for class.
 
@@ -161,8 +171,18 @@ class ShiftCipher(MersadClassicalBase):
         """
         return shift_cipher_translator(text, **kwargs)
 
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE:
+        """
+        Wrap the table builder function for class.
+
+        :return     : compiled translation table.
+        :rtype      : dict
+        """
+        return shift_cipher_table(**kwargs)
 
-def shift_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+
+def shift_cipher_translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
     """
     Translate a string with Shift cipher algorithm.
 
@@ -180,6 +200,10 @@ def shift_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
        from step #7.
     9. replace old letter with new letter.
 
+    Steps 5 to 8 are compiled once into a translation table by
+    shift_cipher_table function and steps 3, 4 and 9 are done for
+    the whole text in one pass by the translation engine.
+
     :param text                             : string to be translated.
     :param kwargs:
         key                                 : key for encrypt/decrypt.
@@ -187,18 +211,38 @@ def shift_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
         shuffle (optional)(default = False) : randomize letter sequence order.
         seed (optional)(requires shuffle)   : specify a seed for randomizing,
                                               default seed is 0.
+        preserve_case (optional)            : translate the other case of letters
+                                              which aren't in alphabet and keep
+                                              their case, default is False.
+        fold_case (optional)                : translate the other case of letters
+                                              which aren't in alphabet like
+                                              alphabet letters, default is False.
+        strip_unknown (optional)            : delete letters which aren't in
+                                              alphabet, default is False.
         decrypt (optional)(default = False) : switch for encryption/decryption mode.
     :return                                 : translated text
     :rtype                                  : str
     """
+    return translation_engine.translate(text, shift_cipher_table(**kwargs))
+
+
+def shift_cipher_table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE:
+    """
+    Create translation table of Shift cipher algorithm.
+
+    Tables are cached in the process-wide table cache, so the table
+    of a configuration is built only once.
+
+    :param kwargs                           : same as shift_cipher_translator.
+    :return                                 : compiled translation table.
+    :rtype                                  : dict
+    """
     # for sake of readability and prettifying below code
     # I will assign aliases for key, values inside kwargs.
     sequence: str = kwargs["letter_sequence"]
     key: int = kwargs["key"]
     if key is None:
         raise ValueError("ERROR: key not found, use config method to define a key.")
-    # length of sequence is needed for mathematical calculations.
-    key_size: int = len(sequence)
     # default shuffle to False if no shuffle is defined in kwargs.
     shuffle: bool = kwargs["shuffle"] if "shuffle" in kwargs else False
     # default seed to 0 if no seed is defined in kwargs.
@@ -206,45 +250,57 @@ def shift_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str:
     # default decrypt to False if no decrypt is defined in kwargs.
     decrypt: bool = kwargs["decrypt"] if "decrypt" in kwargs else False
 
-    # type annotations
-    translated_sequence: Dict[str, str]
-    # blank string.
-    translated: str = ""
+    # type annotations.
+    table_key: Tuple[Any, ...] = (ShiftCipher, sequence, key, shuffle, seed, decrypt)
+    table: TABLE_TYPE = TABLE_CACHE.fetch(
+        table_key,
+        _build_shift_cipher_table,
+        sequence,
+        key,
+        shuffle,
+        seed,
+        decrypt,
+    )
+    # case and normalization options are built from the (cached) table.
+    return translation_engine.apply_table_options(table, table_key, **kwargs)
+
+
+def _build_shift_cipher_table(
+    sequence: str, key: int, shuffle: bool, seed: int, decrypt: bool
+) -> TABLE_TYPE:
+    """
+    Build translation table of Shift cipher algorithm without caching.
+
+    :param sequence : alphabet for encryption/decryption.
+    :param key      : key for encrypt/decrypt.
+    :param shuffle  : randomize letter sequence order.
+    :param seed     : seed for randomizing.
+    :param decrypt  : switch for encryption/decryption mode.
+    :return         : compiled translation table.
+    :rtype          : dict
+    """
+    if decrypt:
+        # decryption table is the inverse of (cached) encryption table.
+        return translation_engine.invert_table(
+            shift_cipher_table(
+                letter_sequence=sequence, key=key, shuffle=shuffle, seed=seed
+            )
+        )
+
+    # length of sequence is needed for mathematical calculations.
+    key_size: int = len(sequence)
 
     # shuffle letter sequence with respect to seed if shuffle is set to True.
     if shuffle:
         # shuffle sequence.
-        sequence = string_manipulation.shuffle_string(sequence, seed)
+        sequence = Alphabet(sequence).shuffled(seed)
 
-    # reverse key for decryption.
-    if decrypt:
-        key *= -1
-
-    # create a table mapping that maps every letter in sequence to
-    # it's equivalent new letter with respect to the key and size of sequence.
-    translated_sequence = {
-        i: sequence[(sequence.index(i) + key) % key_size] for i in sequence
-    }
-
-    # type annotations
-    translated_letter: str
-
-    # select each letter in the text and only if it is also provided in sequence
-    # from user and replace it with new letter.
-    for letter in text:
-        if letter in sequence:
-            # below code is steps 6 to 8 all together which is actually executed
-            # in initializing the translated_sequence dictionary.
-            # get the translated letter for this letter from mapping
-            translated_letter = translated_sequence[letter]
-        else:
-            # if the letter in the text isn't in sequence, it remains unchanged.
-            translated_letter = letter
-        # step 9
-        # add new letter to translated string.
-        translated += translated_letter
-
-    return translated
+    # map every letter in sequence to the letter key positions after it,
+    # which is the sequence rotated to left by key.
+    key %= key_size
+    return translation_engine.compile_sequences(
+        sequence, sequence[key:] + sequence[:key]
+    )
 
 
 class ShiftCipherMainFunction(MainFunctionClassical):
@@ -257,6 +313,9 @@ class ShiftCipherMainFunction(MainFunctionClassical):
             letter_sequence=args.letters,
             shuffle=args.shuffle,
             seed=args.seed,
+            preserve_case=args.preserve_case,
+            fold_case=args.fold_case,
+            strip_unknown=args.strip_unknown,
         )
 
     def _custom_arguments(self) -> argparse.ArgumentParser:
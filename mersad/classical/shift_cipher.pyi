@@ -11,15 +11,23 @@ from typing import Tuple
 from mersad.util.base_class import KWARGS_TYPE
 from mersad.util.base_class import MersadClassicalBase
 from mersad.util.terminal_app_tools import MainFunctionClassical
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
 
 def main(argv: Tuple[str] = ...) -> None: ...
 
 class ShiftCipher(MersadClassicalBase):
     def _config_subroutines(self, **kwargs: KWARGS_TYPE) -> None: ...
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str: ...
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE: ...
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE: ...
 
-def shift_cipher_translator(text: str, **kwargs: KWARGS_TYPE) -> str: ...
+def shift_cipher_translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE: ...
+def shift_cipher_table(**kwargs: KWARGS_TYPE) -> TABLE_TYPE: ...
+def _build_shift_cipher_table(
+    sequence: str, key: int, shuffle: bool, seed: int, decrypt: bool
+) -> TABLE_TYPE: ...
 
 class ShiftCipherMainFunction(MainFunctionClassical):
     def _config_agent(self, agent: Any, args: argparse.Namespace) -> None: ...
@@ -58,5 +58,6 @@ __all__: List[str] = [
     "test_affine_cipher",
     "test_atbash_cipher",
     "test_mixalph_cipher",
+    "test_route_cipher",
     "test_shift_cipher",
 ]
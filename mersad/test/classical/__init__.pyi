@@ -6,4 +6,5 @@
 #   test_affine_cipher
 #   test_atbash_cipher
 #   test_mixalph_cipher
+#   test_route_cipher
 #   test_shift_cipher
@@ -50,6 +50,7 @@ from ErfanIO import ReaderIO
 # Mersad Library
 from mersad.classical.affine_cipher import AffineCipher
 from mersad.classical.affine_cipher import main as affine_main
+from mersad.util.translation_backend import BACKENDS
 
 
 class TestShiftCipher(unittest.TestCase):
@@ -148,6 +149,18 @@ class TestShiftCipher(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.agent.encrypt(self.plain_text)
 
+    @unittest.skipUnless(BACKENDS["numpy"].available(), "NumPy isn't installed.")
+    def test_preserve_case(self):
+        text = "Hail Julius Caesar, VENI vidi vici."
+        self.agent.config(key=396, letter_sequence=string.ascii_lowercase)
+        lowercase = self.agent.encrypt(text.lower())
+        expected = "".join(
+            j.upper() if i.isupper() else j for (i, j) in zip(text, lowercase)
+        )
+        self.agent.config(preserve_case=True)
+        self.assertEqual(expected, self.agent.encrypt(text))
+        self.assertEqual(text, self.agent.decrypt(expected))
+
     def test_terminal_application(self):
         # mock up terminal arguments
         args = [
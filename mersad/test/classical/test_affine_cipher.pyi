@@ -26,4 +26,5 @@ class TestShiftCipher(unittest.TestCase):
     def test_key_is_lower_than_alphabet_length(self) -> None: ...
     def test_key_and_letter_sequence_length_not_relatively_prime(self) -> None: ...
     def test_none_key(self) -> None: ...
+    def test_preserve_case(self) -> None: ...
     def test_terminal_application(self) -> None: ...
@@ -103,6 +103,17 @@ class TestShiftCipher(unittest.TestCase):
         self.agent.config(letter_sequence=alphabet, shuffle=False, seed=0)
         self.assertEqual(self.plain_text, self.agent.decrypt(self.custom_alphabet))
 
+    def test_preserve_case(self):
+        text = "Hail Julius Caesar, VENI vidi vici."
+        self.agent.config(letter_sequence=string.ascii_lowercase)
+        lowercase = self.agent.encrypt(text.lower())
+        expected = "".join(
+            j.upper() if i.isupper() else j for (i, j) in zip(text, lowercase)
+        )
+        self.agent.config(preserve_case=True)
+        self.assertEqual(expected, self.agent.encrypt(text))
+        self.assertEqual(text, self.agent.decrypt(expected))
+
     def test_terminal_application(self):
         # mock up terminal arguments
         args = [
@@ -20,4 +20,5 @@ class TestShiftCipher(unittest.TestCase):
     def test_decryption_without_shuffle(self) -> None: ...
     def test_decrypt_with_shuffle_without_seed(self) -> None: ...
     def test_decrypt_with_custom_alphabet(self) -> None: ...
+    def test_preserve_case(self) -> None: ...
     def test_terminal_application(self) -> None: ...
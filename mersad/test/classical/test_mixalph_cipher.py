@@ -144,6 +144,21 @@ class TestShiftCipher(unittest.TestCase):
         )
         self.assertEqual(self.plain_text, self.agent.decrypt(self.custom_sort_key))
 
+    def test_key_with_repeated_letters(self):
+        with self.assertRaises(ValueError):
+            self.agent.config(key="zxcvbnmlkjhgfdsaqwertyuiopz")
+
+    def test_preserve_case(self):
+        text = "Hail Julius Caesar, VENI vidi vici."
+        self.agent.config(key="zxcvbnmlkjhgfdsaqwertyuiop", sort_key="plmnkoijbhuygvcftrdxzsewaq")
+        lowercase = self.agent.encrypt(text.lower())
+        expected = "".join(
+            j.upper() if i.isupper() else j for (i, j) in zip(text, lowercase)
+        )
+        self.agent.config(preserve_case=True)
+        self.assertEqual(expected, self.agent.encrypt(text))
+        self.assertEqual(text, self.agent.decrypt(expected))
+
     def test_terminal_application(self):
         # mock up terminal arguments
         args = [
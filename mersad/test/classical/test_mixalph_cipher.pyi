@@ -24,4 +24,6 @@ class TestShiftCipher(unittest.TestCase):
     def test_none_key(self) -> None: ...
     def test_sort_key_doesnt_have_all_key_letters(self) -> None: ...
     def test_sort_key_have_more_letters_than_key(self) -> None: ...
+    def test_key_with_repeated_letters(self) -> None: ...
+    def test_preserve_case(self) -> None: ...
     def test_terminal_application(self) -> None: ...
@@ -0,0 +1,143 @@
+# mersad/test/classical/test_route_cipher.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+# Python Standard Library
+import unittest
+
+# Mersad Library
+from mersad.classical.route_cipher import RouteCipher
+
+
+class TestRouteCipher(unittest.TestCase):
+    def setUp(self) -> None:
+        # create a cipher agent
+        self.agent = RouteCipher()
+        self.route = [3, 2, 1, 0, 4, 8, 12, 13, 14, 15, 11, 7, 6, 5, 9, 10]
+        self.plain_text = "WEAREDISCOVERED"
+        self.cipher_text = "RAEWECREDXESIDOV"
+
+    def test_encrypt(self):
+        self.agent.config(key=4, route=self.route)
+        self.assertEqual(self.cipher_text, self.agent.encrypt(self.plain_text))
+
+    def test_decrypt(self):
+        self.agent.config(key=4, route=self.route)
+        self.assertEqual(self.plain_text + "X", self.agent.decrypt(self.cipher_text))
+
+    def test_custom_fill(self):
+        self.agent.config(key=4, route=self.route, fill="Z")
+        self.assertEqual("RAEWECREDZESIDOV", self.agent.encrypt(self.plain_text))
+
+    def test_temporary_route(self):
+        self.agent.config(key=4)
+        self.assertEqual(
+            self.cipher_text, self.agent.encrypt(self.plain_text, route=self.route)
+        )
+
+    def test_wrong_route_length(self):
+        self.agent.config(key=4, route=self.route[:-1])
+        with self.assertRaises(ValueError):
+            self.agent.encrypt(self.plain_text)
+
+    def test_duplicate_route_indexes(self):
+        self.agent.config(key=4, route=[0] * 16)
+        with self.assertRaises(ValueError):
+            self.agent.encrypt(self.plain_text)
+
+    def test_none_key(self):
+        self.agent.config(route=self.route)
+        with self.assertRaises(ValueError):
+            self.agent.encrypt(self.plain_text)
+
+    def test_bytes(self):
+        self.agent.config(key=4, route=self.route, fill=b"X")
+        cipher_text = self.agent.encrypt(self.plain_text.encode())
+        self.assertEqual(self.cipher_text.encode(), cipher_text)
+        self.assertEqual(
+            bytearray(self.plain_text.encode() + b"X"),
+            self.agent.decrypt(bytearray(cipher_text)),
+        )
+
+    def test_encrypt_decrypt_into(self):
+        self.agent.config(key=4, route=self.route)
+        destination = bytearray(16)
+        self.assertEqual(
+            16, self.agent.encrypt_into(self.plain_text.encode(), destination)
+        )
+        self.assertEqual(self.cipher_text.encode(), destination)
+        result = bytearray(16)
+        self.agent.decrypt_into(memoryview(destination), result)
+        self.assertEqual(self.plain_text.encode() + b"X", result)
+
+    def test_encrypt_decrypt_inplace(self):
+        self.agent.config(key=4, route=self.route)
+        buffer = bytearray(self.plain_text.encode())
+        self.agent.encrypt_inplace(buffer)
+        self.assertEqual(self.cipher_text.encode(), buffer)
+        self.agent.decrypt_inplace(buffer)
+        self.assertEqual(self.plain_text.encode() + b"X", buffer)
+
+    def test_encrypt_into_aliased_buffer(self):
+        self.agent.config(key=4, route=self.route)
+        buffer = bytearray(self.plain_text.encode() + b"\x00")
+        self.assertEqual(16, self.agent.encrypt_into(memoryview(buffer)[:15], buffer))
+        self.assertEqual(self.cipher_text.encode(), buffer)
+
+    def test_encrypt_into_same_memoryview(self):
+        self.agent.config(key=4, route=self.route)
+        view = memoryview(bytearray(self.plain_text.encode() + b"X"))
+        self.assertEqual(16, self.agent.encrypt_into(view, view))
+        self.assertEqual(self.cipher_text.encode(), view)
+
+    def test_encrypt_into_small_destination(self):
+        self.agent.config(key=4, route=self.route)
+        with self.assertRaises(ValueError):
+            self.agent.encrypt_into(self.plain_text.encode(), bytearray(15))
+
+    def test_compile(self):
+        self.agent.config(key=4, route=self.route)
+        cipher = self.agent.compile()
+        self.assertEqual(self.cipher_text, cipher.encrypt(self.plain_text))
+        self.assertEqual(self.plain_text + "X", cipher.decrypt(self.cipher_text))
+
+
+if __name__ == "__main__":
+    unittest.main()
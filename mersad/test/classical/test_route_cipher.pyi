@@ -0,0 +1,28 @@
+# Stubs for mersad.test.classical.test_route_cipher (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+from typing import Any
+
+class TestRouteCipher(unittest.TestCase):
+    agent: Any = ...
+    route: Any = ...
+    plain_text: Any = ...
+    cipher_text: Any = ...
+    def setUp(self) -> None: ...
+    def test_encrypt(self) -> None: ...
+    def test_decrypt(self) -> None: ...
+    def test_custom_fill(self) -> None: ...
+    def test_temporary_route(self) -> None: ...
+    def test_wrong_route_length(self) -> None: ...
+    def test_duplicate_route_indexes(self) -> None: ...
+    def test_none_key(self) -> None: ...
+    def test_bytes(self) -> None: ...
+    def test_encrypt_decrypt_into(self) -> None: ...
+    def test_encrypt_decrypt_inplace(self) -> None: ...
+    def test_encrypt_into_aliased_buffer(self) -> None: ...
+    def test_encrypt_into_same_memoryview(self) -> None: ...
+    def test_encrypt_into_small_destination(self) -> None: ...
+    def test_compile(self) -> None: ...
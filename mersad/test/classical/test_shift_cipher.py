@@ -50,6 +50,7 @@ from ErfanIO import ReaderIO
 # Mersad Library
 from mersad.classical.shift_cipher import ShiftCipher
 from mersad.classical.shift_cipher import main as shift_main
+from mersad.util.translation_backend import BACKENDS
 
 
 class TestShiftCipher(unittest.TestCase):
@@ -130,6 +131,122 @@ class TestShiftCipher(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.agent.encrypt(self.plain_text)
 
+    def test_encrypt_bytes(self):
+        self.agent.config(key=173, shuffle=True, seed=0)
+        self.assertEqual(
+            self.k173_sh1_s0.encode(), self.agent.encrypt(self.plain_text.encode())
+        )
+
+    def test_decrypt_bytes_with_byte_alphabet(self):
+        alphabet = string.ascii_lowercase.encode()
+        self.agent.config(key=85, letter_sequence=alphabet, shuffle=False, seed=0)
+        self.assertEqual(
+            bytearray(self.plain_text.encode()),
+            self.agent.decrypt(bytearray(self.custom_alphabet.encode())),
+        )
+
+    def test_encrypt_into(self):
+        self.agent.config(key=173, shuffle=True, seed=0)
+        source = memoryview(self.plain_text.encode())
+        destination = bytearray(len(source))
+        self.assertEqual(len(source), self.agent.encrypt_into(source, destination))
+        self.assertEqual(self.k173_sh1_s0.encode(), destination)
+
+    def test_encrypt_decrypt_inplace(self):
+        self.agent.config(key=173, shuffle=True, seed=0)
+        buffer = bytearray(self.plain_text.encode())
+        self.agent.encrypt_inplace(buffer)
+        self.assertEqual(self.k173_sh1_s0.encode(), buffer)
+        self.agent.decrypt_inplace(buffer)
+        self.assertEqual(self.plain_text.encode(), buffer)
+
+    def test_inplace_strip_unknown(self):
+        self.agent.config(key=1, letter_sequence="abc", strip_unknown=True)
+        buffer = bytearray(b"a-b-c")
+        self.agent.encrypt_inplace(buffer)
+        self.assertEqual(b"bca", buffer)
+        self.agent.decrypt_inplace(buffer)
+        self.assertEqual(b"abc", buffer)
+
+    def test_compile(self):
+        self.agent.config(key=173, shuffle=True, seed=0)
+        cipher = self.agent.compile()
+        self.assertEqual(self.k173_sh1_s0, cipher.encrypt(self.plain_text))
+        self.assertEqual(self.plain_text, cipher.decrypt(self.k173_sh1_s0))
+
+    def test_compiled_cipher_is_independent(self):
+        self.agent.config(key=25, shuffle=False, seed=0)
+        cipher = self.agent.compile()
+        # changing agent configuration must not affect compiled cipher.
+        self.agent.config(key=173, shuffle=True)
+        self.assertEqual(self.k25_sh0_s0, cipher.encrypt(self.plain_text))
+        self.assertEqual(25, cipher.parameters["key"])
+
+    def test_compiled_cipher_is_immutable(self):
+        self.agent.config(key=25)
+        cipher = self.agent.compile()
+        with self.assertRaises(AttributeError):
+            cipher.encrypt_table = {}
+        with self.assertRaises(TypeError):
+            cipher.parameters["key"] = 3
+
+    def test_inverse(self):
+        self.agent.config(key=173, shuffle=True, seed=0)
+        inverse = self.agent.inverse()
+        self.assertEqual(self.plain_text, inverse.encrypt(self.k173_sh1_s0))
+        self.assertEqual(self.k173_sh1_s0, inverse.decrypt(self.plain_text))
+        # inverse of inverse is the original cipher.
+        self.assertEqual(
+            self.k173_sh1_s0, inverse.inverse().encrypt(self.plain_text)
+        )
+
+    def test_compiled_cipher_inverse(self):
+        self.agent.config(key=173, shuffle=True, seed=0)
+        cipher = self.agent.inverse().compile()
+        self.assertEqual(self.plain_text, cipher.encrypt(self.k173_sh1_s0))
+        self.assertEqual(self.k173_sh1_s0, cipher.inverse().encrypt(self.plain_text))
+
+    def test_compile_none_key(self):
+        with self.assertRaises(ValueError):
+            self.agent.compile()
+
+    @unittest.skipUnless(BACKENDS["numpy"].available(), "NumPy isn't installed.")
+    def test_preserve_case(self):
+        text = "Hail Julius Caesar, VENI vidi vici."
+        self.agent.config(key=85, letter_sequence=string.ascii_lowercase)
+        lowercase = self.agent.encrypt(text.lower())
+        expected = "".join(
+            j.upper() if i.isupper() else j for (i, j) in zip(text, lowercase)
+        )
+        self.agent.config(preserve_case=True)
+        self.assertEqual(expected, self.agent.encrypt(text))
+        self.assertEqual(text, self.agent.decrypt(expected))
+
+    def test_fold_case_and_strip_unknown(self):
+        self.agent.config(key=3, letter_sequence=string.ascii_lowercase)
+        self.agent.config(fold_case=True)
+        self.assertEqual("kdlo mxolxv.", self.agent.encrypt("Hail JULIUS."))
+        self.agent.config(strip_unknown=True)
+        self.assertEqual("kdlomxolxv", self.agent.encrypt("Hail JULIUS."))
+        self.assertEqual(b"kdlomxolxv", self.agent.encrypt(b"Hail JULIUS."))
+        self.assertEqual("hailjulius", self.agent.decrypt("KDLO mxolxv!"))
+        self.assertEqual(
+            self.agent.encrypt(self.plain_text * 2),
+            self.agent.compile().encrypt(self.plain_text * 2),
+        )
+
+    def test_encrypt_many(self):
+        texts = self.plain_text.splitlines()
+        self.agent.config(key=173, shuffle=True)
+        cipher_texts = self.agent.encrypt_many(texts)
+        self.assertEqual([self.agent.encrypt(text) for text in texts], cipher_texts)
+        self.assertEqual(texts, self.agent.decrypt_many(cipher_texts))
+        self.assertEqual(cipher_texts, self.agent.compile().encrypt_many(texts))
+        self.assertEqual(
+            [self.agent.encrypt(text, key=5) for text in texts[:10]],
+            self.agent.encrypt_many(texts[:10], key=5),
+        )
+
     def test_terminal_application(self):
         # mock up terminal arguments
         args = [
@@ -151,6 +268,28 @@ class TestShiftCipher(unittest.TestCase):
         )
         self.assertEqual(self.k173_sh1_s0, result)
 
+    def test_terminal_application_binary(self):
+        # mock up terminal arguments
+        output = os.path.join(self.base_path, "Test Shift Binary Terminal.txt")
+        args = [
+            "--file",
+            "{}".format(os.path.join(self.base_path, "Long License File.txt")),
+            "--output",
+            "{}".format(output),
+            "--key",
+            "173",
+            "--shuffle",
+            "--binary",
+        ]
+
+        # run main function
+        shift_main(tuple(args))
+
+        # test if it's ok
+        with open(output, "rb") as file:
+            result = file.read()
+        self.assertEqual(self.k173_sh1_s0.encode(), result)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -23,4 +23,19 @@ class TestShiftCipher(unittest.TestCase):
     def test_temporary_key(self) -> None: ...
     def test_temporary_key_to_permanent(self) -> None: ...
     def test_none_key(self) -> None: ...
+    def test_encrypt_bytes(self) -> None: ...
+    def test_decrypt_bytes_with_byte_alphabet(self) -> None: ...
+    def test_encrypt_into(self) -> None: ...
+    def test_encrypt_decrypt_inplace(self) -> None: ...
+    def test_inplace_strip_unknown(self) -> None: ...
+    def test_compile(self) -> None: ...
+    def test_compiled_cipher_is_independent(self) -> None: ...
+    def test_compiled_cipher_is_immutable(self) -> None: ...
+    def test_inverse(self) -> None: ...
+    def test_compiled_cipher_inverse(self) -> None: ...
+    def test_compile_none_key(self) -> None: ...
+    def test_preserve_case(self) -> None: ...
+    def test_fold_case_and_strip_unknown(self) -> None: ...
+    def test_encrypt_many(self) -> None: ...
     def test_terminal_application(self) -> None: ...
+    def test_terminal_application_binary(self) -> None: ...
@@ -55,9 +55,19 @@ from typing import List
 
 # please keep alphabetical order
 __all__: List[str] = [
+    "test_alphabet",
     "test_base_class",
     "test_crypto_math",
+    "test_disk_cache",
+    "test_fan_out",
+    "test_grouping",
+    "test_key_store",
+    "test_pipeline",
     "test_string_analyzer",
     "test_string_manipulation",
+    "test_table_cache",
+    "test_text_view",
+    "test_translation_backend",
+    "test_translation_engine",
     "test_type_check",
 ]
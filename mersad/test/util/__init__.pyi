@@ -3,8 +3,18 @@
 # NOTE: This dynamically typed stub was automatically generated by stubgen.
 
 # Names in __all__ with no definition:
+#   test_alphabet
 #   test_base_class
 #   test_crypto_math
+#   test_disk_cache
+#   test_fan_out
+#   test_grouping
+#   test_key_store
+#   test_pipeline
 #   test_string_analyzer
 #   test_string_manipulation
+#   test_table_cache
+#   test_text_view
+#   test_translation_backend
+#   test_translation_engine
 #   test_type_check
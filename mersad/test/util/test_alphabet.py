@@ -0,0 +1,110 @@
+# mersad/test/util/test_alphabet.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+#
+
+# Python Standard Library
+import pickle
+import string
+import unittest
+
+# Mersad Library
+from mersad.classical.mixalph_cipher import MixalphCipher
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.util.alphabet import Alphabet
+from mersad.util.string_manipulation import shuffle_string
+
+
+class TestAlphabet(unittest.TestCase):
+    def test_interned(self):
+        alphabet = Alphabet("abcdef")
+        self.assertIs(alphabet, Alphabet("abcdef"))
+        self.assertIs(alphabet, Alphabet(alphabet))
+        self.assertIs(alphabet, pickle.loads(pickle.dumps(alphabet)))
+        self.assertIsNot(alphabet, Alphabet("abcdeg"))
+
+    def test_behaves_like_string(self):
+        alphabet = Alphabet("abcdef")
+        self.assertEqual("abcdef", alphabet)
+        self.assertEqual(hash("abcdef"), hash(alphabet))
+        self.assertEqual("bcdefa", alphabet[1:] + alphabet[:1])
+        self.assertIn("c", alphabet)
+        self.assertIn("cd", alphabet)
+        self.assertNotIn("x", alphabet)
+
+    def test_indexes(self):
+        alphabet = Alphabet("abcab")
+        self.assertEqual(dict(a=0, b=1, c=2), alphabet.indexes)
+        self.assertEqual(1, alphabet.index("b"))
+        self.assertEqual(3, alphabet.index("a", 1))
+        with self.assertRaises(ValueError):
+            alphabet.index("x")
+        self.assertEqual(frozenset("abc"), alphabet.letter_set)
+        self.assertEqual(["a", "b"], alphabet.duplicates)
+        self.assertEqual([], Alphabet("abc").duplicates)
+
+    def test_shuffled(self):
+        alphabet = Alphabet(string.ascii_letters)
+        self.assertEqual(shuffle_string(string.ascii_letters, 7), alphabet.shuffled(7))
+        self.assertIs(alphabet.shuffled(7), alphabet.shuffled(7))
+        self.assertIsInstance(alphabet.shuffled(7), Alphabet)
+
+    def test_agents_share_default_alphabet(self):
+        first = ShiftCipher(key=7)
+        second = MixalphCipher(key="zxcvbnmlkjhgfdsaqwertyuiop")
+        self.assertIs(
+            first.configuration["letter_sequence"],
+            second.configuration["letter_sequence"],
+        )
+        self.assertIs(
+            first.configuration["letter_sequence"], second.configuration["sort_key"]
+        )
+
+    def test_config_accepts_alphabet(self):
+        alphabet = Alphabet(string.ascii_lowercase)
+        agent = ShiftCipher(key=3, letter_sequence=alphabet)
+        self.assertIs(alphabet, agent.configuration["letter_sequence"])
+        agent.config(letter_sequence=string.ascii_lowercase)
+        self.assertIs(alphabet, agent.configuration["letter_sequence"])
+        self.assertEqual("dbc!", agent.encrypt("ayz!"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,14 @@
+# Stubs for mersad.test.util.test_alphabet (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+
+class TestAlphabet(unittest.TestCase):
+    def test_interned(self) -> None: ...
+    def test_behaves_like_string(self) -> None: ...
+    def test_indexes(self) -> None: ...
+    def test_shuffled(self) -> None: ...
+    def test_agents_share_default_alphabet(self) -> None: ...
+    def test_config_accepts_alphabet(self) -> None: ...
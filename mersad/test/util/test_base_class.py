@@ -40,10 +40,14 @@
 #
 
 # Python Standard Library
+import pickle
 import string
 import unittest
 
 # Mersad Library
+from mersad.classical.route_cipher import RouteCipher
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.util.base_class import CompactAgent
 from mersad.util.base_class import MersadClassicalBase
 
 
@@ -96,6 +100,102 @@ class TestMersadClassicalBase(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.BaseClass.config(decrypt="False")
 
+    def test_config_duplicate_letters(self):
+        with self.assertRaises(ValueError):
+            self.BaseClass.config(letter_sequence="abca")
+        # configuration isn't changed.
+        self.assertEqual(
+            string.printable.replace("\r", ""),
+            self.BaseClass.configuration["letter_sequence"],
+        )
+
+    def test_validated_configuration_is_refreshed(self):
+        agent = ShiftCipher(key=1, letter_sequence="abc")
+        self.assertEqual("bca", agent.encrypt("abc"))
+        self.assertEqual(False, agent.configuration["decrypt"])
+        self.assertEqual("abc", agent.decrypt("bca"))
+        self.assertEqual(True, agent.configuration["decrypt"])
+        agent.config(key=2)
+        self.assertEqual("cab", agent.encrypt("abc"))
+        # temporary key doesn't change the validated configuration.
+        self.assertEqual("bca", agent.encrypt("abc", key=1))
+        self.assertEqual("cab", agent.encrypt("abc"))
+        with self.assertRaises(TypeError):
+            agent.encrypt("abc", key="1")
+        agent.reset()
+        agent.config(key=1)
+        self.assertEqual("bcd", agent.encrypt("abc"))
+
+    def test_direct_configuration_change_is_used(self):
+        agent = ShiftCipher(key=1, letter_sequence="abc")
+        self.assertEqual("bca", agent.encrypt("abc"))
+        agent.configuration["key"] = 2
+        self.assertEqual("cab", agent.encrypt("abc"))
+        agent.configuration.update(key=1)
+        self.assertEqual("bca", agent.encrypt("abc"))
+        agent.configuration = dict(agent.configuration, key=2)
+        self.assertEqual("cab", agent.encrypt("abc"))
+        self.assertEqual("abc", agent.inverse().encrypt("cab"))
+
+    def test_compact_agent(self):
+        agent = ShiftCipher(key=1, letter_sequence="abc").compact()
+        self.assertIsInstance(agent, CompactAgent)
+        self.assertEqual("bca", agent.encrypt("abc"))
+        self.assertEqual("abc", agent.decrypt("bca"))
+        self.assertEqual(1, agent.show_key())
+        agent.config(key=2)
+        self.assertEqual("cab", agent.encrypt("abc"))
+        # temporary key doesn't change the configuration.
+        self.assertEqual("bca", agent.encrypt("abc", key=1))
+        self.assertEqual(2, agent.show_key())
+        self.assertEqual("bca", agent.encrypt("abc", key=1, replace_key=True))
+        self.assertEqual(1, agent.show_key())
+        with self.assertRaises(ValueError):
+            agent.config(letter_sequence="abca")
+        agent.reset()
+        self.assertEqual(ShiftCipher().configuration, agent.configuration)
+
+    def test_compact_agent_shares_defaults(self):
+        first = CompactAgent(ShiftCipher, key=1)
+        second = CompactAgent(ShiftCipher, key=2)
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertIs(
+            first.configuration["letter_sequence"],
+            second.configuration["letter_sequence"],
+        )
+
+    def test_compact_agent_extra_configuration(self):
+        route = [3, 2, 1, 0, 4, 8, 12, 13, 14, 15, 11, 7, 6, 5, 9, 10]
+        agent = RouteCipher(key=4, route=route)
+        compact = agent.compact()
+        text = "abcdefghijklmnop"
+        self.assertEqual(agent.encrypt(text), compact.encrypt(text))
+        self.assertEqual(route, compact.configuration["route"])
+        self.assertEqual(text, compact.expand().decrypt(compact.encrypt(text)))
+
+    def test_pickle_agent(self):
+        agent = ShiftCipher(key=1, letter_sequence="abc", inverse=True)
+        restored = pickle.loads(pickle.dumps(agent))
+        self.assertIsInstance(restored, ShiftCipher)
+        self.assertEqual(agent.configuration, restored.configuration)
+        self.assertEqual("cab", restored.encrypt("abc"))
+        # only configurations which differ from defaults are pickled.
+        self.assertNotIn(b"0123456789", pickle.dumps(ShiftCipher(key=1)))
+        compact = pickle.loads(pickle.dumps(agent.compact()))
+        self.assertIsInstance(compact, CompactAgent)
+        self.assertEqual(agent.configuration, compact.configuration)
+        route = [3, 2, 1, 0, 4, 8, 12, 13, 14, 15, 11, 7, 6, 5, 9, 10]
+        agent = pickle.loads(pickle.dumps(RouteCipher(key=4, route=route)))
+        self.assertEqual(route, agent.configuration["route"])
+
+    def test_pickle_compiled_cipher(self):
+        cipher = ShiftCipher(key=1, letter_sequence="abc").compile().inverse()
+        restored = pickle.loads(pickle.dumps(cipher))
+        self.assertEqual(cipher.encrypt_table, restored.encrypt_table)
+        self.assertEqual(dict(cipher.parameters), dict(restored.parameters))
+        self.assertEqual("cab", restored.encrypt("abc"))
+        self.assertEqual("bca", restored.decrypt("abc"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,3 +13,11 @@ class TestMersadClassicalBase(unittest.TestCase):
     def test_config_reset(self) -> None: ...
     def test_print_instance(self) -> None: ...
     def test_config_bad_type(self) -> None: ...
+    def test_config_duplicate_letters(self) -> None: ...
+    def test_validated_configuration_is_refreshed(self) -> None: ...
+    def test_direct_configuration_change_is_used(self) -> None: ...
+    def test_compact_agent(self) -> None: ...
+    def test_compact_agent_shares_defaults(self) -> None: ...
+    def test_compact_agent_extra_configuration(self) -> None: ...
+    def test_pickle_agent(self) -> None: ...
+    def test_pickle_compiled_cipher(self) -> None: ...
@@ -0,0 +1,213 @@
+# mersad/test/util/test_disk_cache.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+# Python Standard Library
+import os
+import tempfile
+import time
+import unittest
+
+# Mersad Library
+from mersad.classical.mixalph_cipher import MixalphCipher
+from mersad.classical.route_cipher import RouteTable
+from mersad.classical.shift_cipher import shift_cipher_table
+from mersad.util import disk_cache
+from mersad.util.disk_cache import DiskCache
+from mersad.util.table_cache import LRUCache
+from mersad.util.translation_engine import CompactTranslationTable
+from mersad.util.translation_engine import StrippingTranslationTable
+from mersad.util.translation_engine import TranslationTable
+from mersad.util.translation_engine import compile_table
+from mersad.util.translation_engine import normalizing_table
+from mersad.util.translation_engine import translate
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(self.directory.name, max_bytes=None)
+
+    def path(self, key):
+        return os.path.join(
+            self.directory.name, disk_cache.key_digest(key) + disk_cache.SUFFIX
+        )
+
+    def tearDown(self) -> None:
+        disk_cache.disable()
+        self.directory.cleanup()
+
+    def test_store_and_load(self):
+        table = compile_table({"a": "b", "b": "a"})
+        self.assertTrue(self.cache.store(("table", "ab", 1), table))
+        self.assertEqual(table, self.cache.load(("table", "ab", 1)))
+        self.assertIsNone(self.cache.load(("table", "ab", 2)))
+        # keys with unknown objects and unknown values aren't stored.
+        self.assertFalse(self.cache.store(("table", object()), table))
+        self.assertFalse(self.cache.store(("list",), [1, 2]))
+        self.assertIsNone(self.cache.load(("table", object())))
+
+    def test_compact_table(self):
+        alphabet = "".join(map(chr, range(0x4E00, 0x4E00 + 5000))) + "abc"
+        table = shift_cipher_table(key=7, letter_sequence=alphabet)
+        self.assertIsInstance(table, CompactTranslationTable)
+        self.cache.store("compact", table)
+        loaded = self.cache.load("compact")
+        self.assertIsInstance(loaded, CompactTranslationTable)
+        self.assertEqual(table, loaded)
+        self.assertEqual(len(table), len(loaded))
+        self.assertEqual(
+            [run.typecode for run in table._runs],
+            [run.typecode for run in loaded._runs],
+        )
+
+    def test_stripping_table(self):
+        table = normalizing_table(
+            shift_cipher_table(key=1, letter_sequence="abc"), True, True
+        )
+        self.cache.store("strip", table)
+        loaded = self.cache.load("strip")
+        self.assertIsInstance(loaded, StrippingTranslationTable)
+        self.assertEqual(table, loaded)
+        self.assertEqual("bcaac", translate("abc! CB?", loaded))
+        # deleted letters of a translation table.
+        table = TranslationTable({ord("a"): ord("b"), ord("!"): None})
+        self.cache.store("delete", table)
+        self.assertEqual(table, self.cache.load("delete"))
+
+    def test_route_table(self):
+        table = RouteTable(4, "ü", (3, 2, 1, 0, 4, 5, 6, 7), True)
+        self.cache.store("route", table)
+        self.assertEqual(table, self.cache.load("route"))
+
+    def test_damaged_file_is_ignored(self):
+        self.cache.store("table", compile_table({"a": "b"}))
+        (name,) = os.listdir(self.directory.name)
+        path = os.path.join(self.directory.name, name)
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) - 3)
+        self.assertIsNone(self.cache.load("table"))
+        with open(path, "wb") as file:
+            file.write(b"not a table")
+        self.assertIsNone(self.cache.load("table"))
+
+    def test_cleanup(self):
+        table = compile_table({chr(j): "a" for j in range(100)})
+        for i in range(4):
+            self.cache.store(i, table)
+            # files of older keys are least recently used.
+            os.utime(self.path(i), (i, i))
+        size = os.path.getsize(self.path(0))
+        self.assertEqual(2, self.cache.cleanup(size * 2))
+        self.assertEqual(
+            [False, False, True, True], [os.path.exists(self.path(i)) for i in range(4)]
+        )
+        self.assertEqual(2, self.cache.clear())
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    def test_cleanup_is_throttled(self):
+        table = compile_table({chr(j): "a" for j in range(100)})
+        cache = DiskCache(self.directory.name, max_bytes=None)
+        cache.store(0, table)
+        size = os.path.getsize(self.path(0))
+        cache = DiskCache(self.directory.name, max_bytes=size * 4)
+        cleanups = []
+        cleanup = cache.cleanup
+        cache.cleanup = lambda max_bytes: cleanups.append(cleanup(max_bytes))
+        for i in range(1, 9):
+            cache.store(i, table)
+        # directory is scanned on first store and when it outgrows the limit,
+        # then it is shrunk to three quarters of the limit.
+        self.assertEqual([0, 2, 2, 2], cleanups)
+        self.assertEqual(3, len(os.listdir(self.directory.name)))
+
+    def test_cleanup_removes_stale_temporary_files(self):
+        stale = os.path.join(self.directory.name, "stale.tmp")
+        fresh = os.path.join(self.directory.name, "fresh.tmp")
+        for path in (stale, fresh):
+            with open(path, "wb") as file:
+                file.write(b"MRSD")
+        # a writer which was killed an hour ago left this file behind.
+        old = time.time() - disk_cache.STALE_SECONDS - 1
+        os.utime(stale, (old, old))
+        self.assertEqual(1, self.cache.cleanup(0))
+        self.assertEqual(["fresh.tmp"], os.listdir(self.directory.name))
+
+    def test_key_digest_has_version(self):
+        digest = disk_cache.key_digest("key")
+        version = disk_cache.__version__
+        try:
+            disk_cache.__version__ = version + ".1"
+            self.assertNotEqual(digest, disk_cache.key_digest("key"))
+        finally:
+            disk_cache.__version__ = version
+
+    def test_table_cache_uses_disk(self):
+        builds = []
+
+        def builder(value):
+            builds.append(value)
+            return compile_table({"a": value})
+
+        for _ in range(2):
+            # a new memory cache, like a new process.
+            cache = LRUCache()
+            cache.disk = self.cache
+            table = cache.fetch("key", builder, "b")
+            self.assertEqual(compile_table({"a": "b"}), table)
+        self.assertEqual(["b"], builds)
+
+    def test_enable(self):
+        cache = disk_cache.enable(self.directory.name)
+        agent = MixalphCipher(
+            key="zyxwvutsrqponmlkjihgfedcba",
+            letter_sequence="abcdefghijklmnopqrstuvwxyz",
+            shuffle=True,
+            seed=41,
+        )
+        encrypted = agent.encrypt("abc")
+        self.assertEqual(self.directory.name, cache.directory)
+        self.assertNotEqual([], os.listdir(self.directory.name))
+        disk_cache.disable()
+        self.assertEqual("abc", agent.decrypt(encrypted))
+
+
+if __name__ == "__main__":
+    unittest.main()
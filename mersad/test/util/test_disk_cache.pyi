@@ -0,0 +1,25 @@
+# Stubs for mersad.test.util.test_disk_cache (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+from typing import Any
+
+class TestDiskCache(unittest.TestCase):
+    directory: Any = ...
+    cache: Any = ...
+    def setUp(self) -> None: ...
+    def path(self, key: Any) -> str: ...
+    def tearDown(self) -> None: ...
+    def test_store_and_load(self) -> None: ...
+    def test_compact_table(self) -> None: ...
+    def test_stripping_table(self) -> None: ...
+    def test_route_table(self) -> None: ...
+    def test_damaged_file_is_ignored(self) -> None: ...
+    def test_cleanup(self) -> None: ...
+    def test_cleanup_is_throttled(self) -> None: ...
+    def test_cleanup_removes_stale_temporary_files(self) -> None: ...
+    def test_key_digest_has_version(self) -> None: ...
+    def test_table_cache_uses_disk(self) -> None: ...
+    def test_enable(self) -> None: ...
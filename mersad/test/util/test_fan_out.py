@@ -0,0 +1,169 @@
+# mersad/test/util/test_fan_out.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+# Python Standard Library
+import contextlib
+import io
+import os
+import string
+import tempfile
+import unittest
+
+# 3rd Party Library
+from ErfanIO import ReaderIO
+
+# Mersad Library
+from mersad.classical.affine_cipher import AffineCipher
+from mersad.classical.atbash_cipher import main as atbash_main
+from mersad.classical.mixalph_cipher import MixalphCipher
+from mersad.classical.route_cipher import RouteCipher
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.classical.shift_cipher import main as shift_main
+from mersad.util.fan_out import FanOut
+from mersad.util.fan_out import compile_ciphers
+
+
+class TestFanOut(unittest.TestCase):
+    def setUp(self) -> None:
+        # setup path
+        util_path = os.path.abspath(os.path.dirname(__file__))
+        test_path = os.path.abspath(os.path.dirname(util_path))
+        self.base_path = os.path.join(test_path, "asset", "texts")
+        self.plain_text = ReaderIO.read(
+            os.path.join(self.base_path, "Long License File.txt"), "text"
+        )
+        self.agents = [
+            ShiftCipher(key=173, shuffle=True),
+            AffineCipher(key=125),
+            MixalphCipher(key=string.ascii_lowercase[::-1], letter_sequence="ab"),
+        ]
+
+    def test_encrypt_and_decrypt(self):
+        fan_out = FanOut(self.agents, workers=1, chunk_size=1000)
+        outputs = [io.StringIO() for _ in self.agents]
+        length = fan_out.encrypt(io.StringIO(self.plain_text), outputs)
+        self.assertEqual(len(self.plain_text), length)
+        cipher_texts = [output.getvalue() for output in outputs]
+        self.assertEqual(
+            [agent.encrypt(self.plain_text) for agent in self.agents], cipher_texts
+        )
+        for agent, cipher_text in zip(self.agents, cipher_texts):
+            decrypted = io.StringIO()
+            FanOut([agent], workers=1).decrypt(io.StringIO(cipher_text), [decrypted])
+            self.assertEqual(self.plain_text, decrypted.getvalue())
+
+    def test_binary(self):
+        fan_out = FanOut(self.agents[:2], workers=1, chunk_size=7)
+        outputs = [io.BytesIO(), io.BytesIO()]
+        fan_out.encrypt(io.BytesIO(b"Hail Julius Caesar."), outputs)
+        self.assertEqual(
+            [agent.encrypt(b"Hail Julius Caesar.") for agent in self.agents[:2]],
+            [output.getvalue() for output in outputs],
+        )
+
+    def test_parallel_compile(self):
+        ciphers = compile_ciphers(self.agents, workers=2)
+        self.assertEqual(
+            [agent.encrypt(self.plain_text) for agent in self.agents],
+            [cipher.encrypt(self.plain_text) for cipher in ciphers],
+        )
+        # compiled ciphers are used as they are.
+        compiled = self.agents[0].compile()
+        self.assertIs(compiled, compile_ciphers([compiled], workers=2)[0])
+
+    def test_wrong_ciphers_and_destinations(self):
+        route = [3, 2, 1, 0, 4, 8, 12, 13, 14, 15, 11, 7, 6, 5, 9, 10]
+        with self.assertRaises(ValueError):
+            FanOut([RouteCipher(key=4, route=route)], workers=1)
+        with self.assertRaises(ValueError):
+            FanOut(self.agents, workers=1).encrypt(io.StringIO("a"), [io.StringIO()])
+
+    def test_terminal_application(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "shift-{}.txt")
+            args = [
+                "--file",
+                os.path.join(self.base_path, "Long License File.txt"),
+                "--output",
+                output,
+                "--shuffle",
+                "--key",
+                "3",
+                "--fan_out",
+                "173",
+                "5",
+                "--workers",
+                "1",
+            ]
+            shift_main(tuple(args))
+            for key in (3, 173, 5):
+                result = ReaderIO.read(output.format(key), "text")
+                agent = ShiftCipher(key=key, shuffle=True)
+                self.assertEqual(agent.encrypt(self.plain_text), result)
+
+
+    def test_terminal_application_without_key(self):
+        with tempfile.TemporaryDirectory() as directory:
+            args = ["--text", "hello", "--output", directory, "--fan_out", "1"]
+            with contextlib.redirect_stderr(io.StringIO()) as error:
+                with self.assertRaises(SystemExit):
+                    atbash_main(tuple(args))
+            self.assertIn(
+                "--fan_out: this cipher doesn't take a key", error.getvalue()
+            )
+            self.assertEqual([], os.listdir(directory))
+
+    def test_terminal_application_with_groups(self):
+        with tempfile.TemporaryDirectory() as directory:
+            args = ["--text", "hello", "--output", directory, "--key", "3"]
+            args += ["--fan_out", "5", "--group_size", "5"]
+            with contextlib.redirect_stderr(io.StringIO()) as error:
+                with self.assertRaises(SystemExit):
+                    shift_main(tuple(args))
+            self.assertIn(
+                "--fan_out: not allowed with --group_size or --line_width",
+                error.getvalue(),
+            )
+            self.assertEqual([], os.listdir(directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
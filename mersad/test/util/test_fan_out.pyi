@@ -0,0 +1,20 @@
+# Stubs for mersad.test.util.test_fan_out (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+from typing import Any
+
+class TestFanOut(unittest.TestCase):
+    base_path: Any = ...
+    plain_text: Any = ...
+    agents: Any = ...
+    def setUp(self) -> None: ...
+    def test_encrypt_and_decrypt(self) -> None: ...
+    def test_binary(self) -> None: ...
+    def test_parallel_compile(self) -> None: ...
+    def test_wrong_ciphers_and_destinations(self) -> None: ...
+    def test_terminal_application(self) -> None: ...
+    def test_terminal_application_without_key(self) -> None: ...
+    def test_terminal_application_with_groups(self) -> None: ...
@@ -0,0 +1,149 @@
+# mersad/test/util/test_grouping.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+# Python Standard Library
+import contextlib
+import io
+import pickle
+import string
+import unittest
+
+# Mersad Library
+from mersad.classical.route_cipher import RouteCipher
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.classical.shift_cipher import main as shift_main
+from mersad.util import grouping
+from mersad.util.translation_engine import CHUNK_SIZE
+from mersad.util.translation_engine import compact_table
+from mersad.util.translation_engine import compile_sequences
+
+
+class TestGrouping(unittest.TestCase):
+    def setUp(self) -> None:
+        self.agent = ShiftCipher(key=3, letter_sequence=string.ascii_uppercase)
+
+    def test_group_text(self):
+        self.assertEqual(
+            "WEARE DISCO VERED", grouping.group_text("WEAREDISCOVERED", 5)
+        )
+        self.assertEqual(
+            "WEA RED\nISC OVE\nRED", grouping.group_text("WEAREDISCOVERED", 3, 7)
+        )
+        self.assertEqual("WEAR\nEDIS\nCO", grouping.group_text("WEAREDISCO", 0, 4))
+        self.assertEqual(b"WE AR E", grouping.group_text(b"WEARE", 2))
+        self.assertEqual("", grouping.group_text("", 5))
+        with self.assertRaises(ValueError):
+            grouping.group_text("WEARE", 0)
+
+    def test_format_groups_across_chunks(self):
+        text = string.ascii_letters * 3
+        chunks = [text[:1], text[1:7], "", text[7:50], text[50:]]
+        self.assertEqual(
+            grouping.group_text(text, 4, 20),
+            "".join(grouping.format_groups(chunks, 4, 20)),
+        )
+
+    def test_encrypt_grouped(self):
+        text = "WEAREDISCOVERED" * CHUNK_SIZE
+        cipher_text = self.agent.encrypt_grouped(text, 5, 59)
+        self.assertEqual(
+            grouping.group_text(self.agent.encrypt(text), 5, 59), cipher_text
+        )
+        self.assertEqual(text, self.agent.decrypt_grouped(cipher_text))
+        self.assertEqual(text, self.agent.compile().decrypt_grouped(cipher_text))
+        self.assertEqual(
+            b"ZHDUH GLVFR", self.agent.compile().encrypt_grouped(b"WEAREDISCO")
+        )
+        self.assertEqual(
+            b"WEAREDISCO", self.agent.decrypt_grouped(b"ZHDUH\nGLVFR")
+        )
+
+    def test_route_cipher(self):
+        route = [3, 2, 1, 0, 4, 8, 12, 13, 14, 15, 11, 7, 6, 5, 9, 10]
+        agent = RouteCipher(key=4, route=route)
+        cipher_text = agent.encrypt_grouped("WEAREDISCOVERED")
+        self.assertEqual("RAEWE CREDX ESIDO V", cipher_text)
+        self.assertEqual("WEAREDISCOVEREDX", agent.decrypt_grouped(cipher_text))
+
+    def test_ungrouped_table(self):
+        alphabet = "".join(map(chr, range(0x4E00, 0x4E00 + 5000)))
+        table = compact_table(
+            compile_sequences(alphabet, alphabet[1:] + alphabet[0])
+        )
+        extended = grouping.ungrouped_table(table)
+        self.assertIs(extended, grouping.ungrouped_table(table))
+        self.assertIs(table._runs, extended._runs)
+        text = alphabet[:1] + " \n" + alphabet[1:2]
+        self.assertEqual(alphabet[1:3], text.translate(extended))
+        # derived tables aren't pickled.
+        restored = pickle.loads(pickle.dumps(table))
+        self.assertNotIn("_ungrouped_table", restored.__dict__)
+
+    def test_separators_in_alphabet(self):
+        agent = ShiftCipher(key=3, letter_sequence=string.ascii_uppercase + " ")
+        with self.assertRaises(ValueError):
+            agent.decrypt_grouped("ZHDUH GLVFR")
+        with self.assertRaises(ValueError):
+            agent.encrypt_grouped("WEARE DISCOVERED")
+
+    def test_default_alphabet(self):
+        # default alphabet has space and newline, grouping would be ambiguous.
+        agent = ShiftCipher(key=3)
+        for text in ["hello world", b"hello world"]:
+            with self.assertRaises(ValueError):
+                agent.encrypt_grouped(text)
+            with self.assertRaises(ValueError):
+                agent.compile().encrypt_grouped(text)
+
+    def test_terminal_application(self):
+        args = ["--text", "WEAREDISCOVERED", "--key", "3"]
+        args += ["--letters", string.ascii_uppercase]
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            shift_main(tuple(args + ["--group_size", "5"]))
+        self.assertEqual("ZHDUH GLVFR YHUHG\n", output.getvalue())
+        args[1] = "ZHDUH GLVFR\nYHUHG"
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            shift_main(tuple(args + ["--decrypt", "--line_width", "17"]))
+        self.assertEqual("WEAREDISCOVERED\n", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
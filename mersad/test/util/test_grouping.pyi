@@ -0,0 +1,19 @@
+# Stubs for mersad.test.util.test_grouping (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+from typing import Any
+
+class TestGrouping(unittest.TestCase):
+    agent: Any = ...
+    def setUp(self) -> None: ...
+    def test_group_text(self) -> None: ...
+    def test_format_groups_across_chunks(self) -> None: ...
+    def test_encrypt_grouped(self) -> None: ...
+    def test_route_cipher(self) -> None: ...
+    def test_ungrouped_table(self) -> None: ...
+    def test_separators_in_alphabet(self) -> None: ...
+    def test_default_alphabet(self) -> None: ...
+    def test_terminal_application(self) -> None: ...
@@ -0,0 +1,151 @@
+# mersad/test/util/test_key_store.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+# Python Standard Library
+import gc
+import unittest
+import weakref
+
+# Mersad Library
+from mersad.classical.affine_cipher import AffineCipher
+from mersad.classical.mixalph_cipher import MixalphCipher
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.util.key_store import KeyStore
+from mersad.util.table_cache import TABLE_CACHE
+
+
+class TestKeyStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.alphabet = "abcdefghijklmnopqrstuvwxyz"
+        self.store = KeyStore(max_entries=2, max_bytes=None)
+        self.store.register("shift", ShiftCipher, key=1, letter_sequence="abc")
+        self.store.register("affine", AffineCipher(key=125))
+        self.store.register(
+            "mixalph",
+            MixalphCipher,
+            key="zyxwvutsrqponmlkjihgfedcba",
+            letter_sequence=self.alphabet,
+        )
+
+    def test_encrypt_and_decrypt(self):
+        self.assertEqual("bca", self.store.encrypt("shift", "abc"))
+        self.assertEqual("abc", self.store.decrypt("shift", "bca"))
+        agent = AffineCipher(key=125)
+        self.assertEqual(
+            agent.encrypt("Hail Julius Caesar."),
+            self.store.encrypt("affine", "Hail Julius Caesar."),
+        )
+        self.assertEqual("zyx", self.store.encrypt("mixalph", "abc"))
+        with self.assertRaises(KeyError):
+            self.store.encrypt("unknown", "abc")
+
+    def test_register_replaces_cipher(self):
+        self.assertEqual("bca", self.store.encrypt("shift", "abc"))
+        self.store.register("shift", ShiftCipher, key=2, letter_sequence="abc")
+        self.assertEqual("cab", self.store.encrypt("shift", "abc"))
+        with self.assertRaises(ValueError):
+            self.store.register("bad", ShiftCipher, key=1, letter_sequence="abca")
+        self.assertNotIn("bad", self.store)
+        self.store.unregister("shift")
+        self.assertNotIn("shift", self.store)
+        self.assertEqual(2, len(self.store))
+
+    def test_batch(self):
+        requests = [("shift", "abc"), ("mixalph", "abc"), ("shift", "cab")]
+        encrypted = self.store.encrypt_batch(requests)
+        self.assertEqual(["bca", "zyx", "abc"], encrypted)
+        self.assertEqual(
+            ["abc", "abc", "cab"],
+            self.store.decrypt_batch(zip((i for (i, _) in requests), encrypted)),
+        )
+
+    def test_eviction_and_statistics(self):
+        self.store.encrypt("shift", "abc")
+        self.store.encrypt("shift", "abc")
+        self.store.encrypt("affine", "abc")
+        self.store.encrypt("mixalph", "abc")
+        statistics = self.store.statistics()
+        self.assertEqual(1, statistics["hits"])
+        self.assertEqual(3, statistics["misses"])
+        self.assertEqual(0.25, statistics["hit_rate"])
+        self.assertEqual(1, statistics["evictions"])
+        self.assertEqual(2, statistics["entries"])
+        self.assertEqual(3, statistics["tenants"])
+        # evicted tenant is compiled again.
+        self.assertEqual("bca", self.store.encrypt("shift", "abc"))
+
+    def test_memory_budget(self):
+        store = KeyStore(max_entries=None, max_bytes=1)
+        store.register("shift", ShiftCipher, key=1, letter_sequence="abc")
+        self.assertEqual("bca", store.encrypt("shift", "abc"))
+        self.assertEqual(0, store.statistics()["entries"])
+
+    def test_eviction_frees_tables(self):
+        store = KeyStore(max_entries=1, max_bytes=None)
+        store.register("shift", ShiftCipher, key=11, letter_sequence="mersdky")
+        self.assertEqual("key", store.decrypt("shift", store.encrypt("shift", "key")))
+        reference = weakref.ref(store.cipher("shift").encrypt_table)
+        # tables of tenants aren't kept in the process-wide table cache.
+        store.register("affine", AffineCipher(key=125))
+        store.encrypt("affine", "abc")
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_compile_builds_tables_once(self):
+        store = KeyStore(max_entries=1, max_bytes=None)
+        store.register("shift", ShiftCipher, key=13, letter_sequence="mersdky")
+        misses = TABLE_CACHE.statistics()["misses"]
+        store.cipher("shift")
+        # decryption table is inverted from the encryption table built before.
+        self.assertEqual(2, TABLE_CACHE.statistics()["misses"] - misses)
+
+    def test_warm_up(self):
+        self.assertEqual(2, self.store.warm_up(["mixalph", "shift", "affine"]))
+        statistics = self.store.statistics()
+        self.assertEqual(0, statistics["hits"] + statistics["misses"])
+        # hottest tenants are kept.
+        self.store.encrypt("mixalph", "abc")
+        self.store.encrypt("shift", "abc")
+        self.assertEqual(1.0, self.store.statistics()["hit_rate"])
+
+
+if __name__ == "__main__":
+    unittest.main()
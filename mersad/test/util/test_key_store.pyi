@@ -0,0 +1,20 @@
+# Stubs for mersad.test.util.test_key_store (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+from typing import Any
+
+class TestKeyStore(unittest.TestCase):
+    alphabet: Any = ...
+    store: Any = ...
+    def setUp(self) -> None: ...
+    def test_encrypt_and_decrypt(self) -> None: ...
+    def test_register_replaces_cipher(self) -> None: ...
+    def test_batch(self) -> None: ...
+    def test_eviction_and_statistics(self) -> None: ...
+    def test_memory_budget(self) -> None: ...
+    def test_eviction_frees_tables(self) -> None: ...
+    def test_compile_builds_tables_once(self) -> None: ...
+    def test_warm_up(self) -> None: ...
@@ -0,0 +1,231 @@
+# mersad/test/util/test_pipeline.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+# Python Standard Library
+import os
+import string
+import sys
+import unittest
+
+# 3rd Party Library
+from ErfanIO import ReaderIO
+
+# Mersad Library
+from mersad.classical.affine_cipher import AffineCipher
+from mersad.classical.atbash_cipher import AtbashCipher
+from mersad.classical.route_cipher import RouteCipher
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.util.pipeline import PLAN_CACHE_SIZE
+from mersad.util.pipeline import Pipeline
+from mersad.util.pipeline import _plan_size
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self) -> None:
+        # setup path
+        util_path = os.path.abspath(os.path.dirname(__file__))
+        test_path = os.path.abspath(os.path.dirname(util_path))
+        self.base_path = os.path.join(test_path, "asset", "texts")
+        self.plain_text = ReaderIO.read(
+            os.path.join(self.base_path, "Long License File.txt"), "text"
+        )
+        self.agents = [
+            ShiftCipher(key=173, shuffle=True),
+            AffineCipher(key=125),
+            AtbashCipher(letter_sequence=string.ascii_lowercase),
+        ]
+        self.route = [3, 2, 1, 0, 4, 8, 12, 13, 14, 15, 11, 7, 6, 5, 9, 10]
+
+    def encrypt_one_by_one(self, agents, text):
+        for agent in agents:
+            text = agent.encrypt(text)
+        return text
+
+    def test_fuse_substitutions(self):
+        pipeline = Pipeline(self.agents)
+        self.assertEqual(1, pipeline.passes)
+        self.assertEqual(
+            self.encrypt_one_by_one(self.agents, self.plain_text),
+            pipeline.encrypt(self.plain_text),
+        )
+
+    def test_decrypt(self):
+        pipeline = Pipeline(self.agents)
+        cipher_text = pipeline.encrypt(self.plain_text)
+        self.assertEqual(self.plain_text, pipeline.decrypt(cipher_text))
+
+    def test_different_alphabets(self):
+        agents = [
+            ShiftCipher(key=3, letter_sequence=string.ascii_lowercase),
+            ShiftCipher(key=5, letter_sequence=string.ascii_letters),
+        ]
+        pipeline = Pipeline(agents)
+        self.assertEqual(
+            "Miqt OCtqCA HimAiz.", pipeline.encrypt("Hail Julius Caesar.")
+        )
+        self.assertEqual(
+            self.encrypt_one_by_one(agents, self.plain_text),
+            pipeline.encrypt(self.plain_text),
+        )
+
+    def test_route_stage(self):
+        agents = (
+            self.agents[:2] + [RouteCipher(key=4, route=self.route)] + self.agents
+        )
+        pipeline = Pipeline(agents, fuse_routes=False)
+        self.assertEqual(3, pipeline.passes)
+        self.assertEqual(
+            self.encrypt_one_by_one(agents, "WEAREDISCOVERED"),
+            pipeline.encrypt("WEAREDISCOVERED"),
+        )
+        self.assertEqual(
+            "WEAREDISCOVERED",
+            pipeline.decrypt(pipeline.encrypt("WEAREDISCOVERED"))[:15],
+        )
+
+    def test_fuse_routes(self):
+        route = RouteCipher(key=4, route=self.route, fill="q")
+        agents = self.agents[:2] + [route] + self.agents + [route]
+        pipeline = Pipeline(agents)
+        self.assertEqual(2, pipeline.passes)
+        # every length which needs a different padding.
+        for text in ["WEAREDISCOVER", "WEAREDISCOVERE", "WEAREDISCOVERED"]:
+            cipher_text = pipeline.encrypt(text)
+            self.assertEqual(self.encrypt_one_by_one(agents, text), cipher_text)
+            self.assertEqual(
+                Pipeline(agents, fuse_routes=False).decrypt(cipher_text),
+                pipeline.decrypt(cipher_text),
+            )
+        # gather plans are kept in a bounded cache by text length.
+        self.assertEqual(3, len(pipeline._encrypt_plans))
+        self.assertEqual(PLAN_CACHE_SIZE, pipeline._encrypt_plans.max_entries)
+        # integers of gather orders are counted, except shared small ones.
+        order = tuple(range(1000))
+        self.assertEqual(
+            sys.getsizeof("q") + sys.getsizeof(order) + 743 * sys.getsizeof(1000),
+            _plan_size(("q", order)),
+        )
+        # decryption of padded text is same as decryption with agents.
+        self.assertEqual(
+            "WEAREDISCOVERED",
+            pipeline.decrypt(pipeline.encrypt("WEAREDISCOVERED"))[:15],
+        )
+
+    def test_strip_unknown_routes(self):
+        agent = ShiftCipher(
+            key=3, letter_sequence=string.ascii_lowercase, strip_unknown=True
+        )
+        agents = [agent, RouteCipher(key=4, route=self.route)]
+        pipeline = Pipeline(agents)
+        # deleting letters changes the length, so routes aren't fused.
+        self.assertEqual(2, pipeline.passes)
+        self.assertEqual(
+            self.encrypt_one_by_one(agents, "we are discovered!"),
+            pipeline.encrypt("we are discovered!"),
+        )
+
+    def test_fold_case_routes(self):
+        agent = ShiftCipher(
+            key=3, letter_sequence=string.ascii_lowercase, fold_case=True
+        )
+        agents = [agent, RouteCipher(key=4, route=self.route)]
+        pipeline = Pipeline(agents)
+        # folded letters have no single preimage, so routes aren't fused.
+        self.assertEqual(2, pipeline.passes)
+        for text in ["wearediscovered", "WeAreDiscovered"]:
+            self.assertEqual(
+                Pipeline(agents, fuse_routes=False).encrypt(text),
+                pipeline.encrypt(text),
+            )
+        self.assertEqual("udhzhfuhgXhvlgry", pipeline.encrypt("wearediscovered"))
+
+    def test_fuse_routes_only(self):
+        pipeline = Pipeline([RouteCipher(key=4, route=self.route)])
+        self.assertEqual(1, pipeline.passes)
+        self.assertEqual("RAEWECREDXESIDOV", pipeline.encrypt("WEAREDISCOVERED"))
+
+    def test_fuse_routes_bytes(self):
+        agents = [self.agents[0], RouteCipher(key=4, route=self.route, fill=b"X")]
+        pipeline = Pipeline(agents)
+        self.assertEqual(
+            pipeline.encrypt("WEAREDISCOVERED").encode(),
+            pipeline.encrypt(b"WEAREDISCOVERED"),
+        )
+        cipher_text = pipeline.encrypt(bytearray(b"WEAREDISCOVERED"))
+        self.assertEqual(
+            Pipeline(agents, fuse_routes=False).decrypt(cipher_text),
+            pipeline.decrypt(cipher_text),
+        )
+        self.assertIsInstance(pipeline.decrypt(cipher_text), bytearray)
+
+    def test_fuse_routes_wrong_length(self):
+        pipeline = Pipeline([self.agents[0], RouteCipher(key=4, route=self.route)])
+        with self.assertRaises(ValueError):
+            pipeline.encrypt("WEARE")
+
+    def test_bytes(self):
+        pipeline = Pipeline(self.agents)
+        cipher_text = pipeline.encrypt(self.plain_text.encode())
+        self.assertEqual(pipeline.encrypt(self.plain_text).encode(), cipher_text)
+        self.assertEqual(self.plain_text.encode(), pipeline.decrypt(cipher_text))
+
+    def test_compiled_ciphers(self):
+        pipeline = Pipeline([agent.compile() for agent in self.agents])
+        self.assertEqual(
+            Pipeline(self.agents).encrypt(self.plain_text),
+            pipeline.encrypt(self.plain_text),
+        )
+
+    def test_pipeline_is_independent(self):
+        pipeline = Pipeline(self.agents)
+        expected = pipeline.encrypt(self.plain_text)
+        # changing agents configuration must not affect pipeline.
+        self.agents[0].config(key=3)
+        self.assertEqual(expected, pipeline.encrypt(self.plain_text))
+
+    def test_empty_pipeline(self):
+        pipeline = Pipeline([])
+        self.assertEqual(0, pipeline.passes)
+        self.assertEqual(self.plain_text, pipeline.encrypt(self.plain_text))
+
+
+if __name__ == "__main__":
+    unittest.main()
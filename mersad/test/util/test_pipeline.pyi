@@ -0,0 +1,29 @@
+# Stubs for mersad.test.util.test_pipeline (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+from typing import Any
+
+class TestPipeline(unittest.TestCase):
+    base_path: Any = ...
+    plain_text: Any = ...
+    agents: Any = ...
+    route: Any = ...
+    def setUp(self) -> None: ...
+    def encrypt_one_by_one(self, agents: Any, text: Any) -> Any: ...
+    def test_fuse_substitutions(self) -> None: ...
+    def test_decrypt(self) -> None: ...
+    def test_different_alphabets(self) -> None: ...
+    def test_route_stage(self) -> None: ...
+    def test_fuse_routes(self) -> None: ...
+    def test_strip_unknown_routes(self) -> None: ...
+    def test_fold_case_routes(self) -> None: ...
+    def test_fuse_routes_only(self) -> None: ...
+    def test_fuse_routes_bytes(self) -> None: ...
+    def test_fuse_routes_wrong_length(self) -> None: ...
+    def test_bytes(self) -> None: ...
+    def test_compiled_ciphers(self) -> None: ...
+    def test_pipeline_is_independent(self) -> None: ...
+    def test_empty_pipeline(self) -> None: ...
@@ -74,6 +74,14 @@ class TestFindUniqeLetters(unittest.TestCase):
         self.assertEqual(expected_result, unique_letters)
 
 
+class TestFindDuplicateLetters(unittest.TestCase):
+    def test(self):
+        self.assertEqual([], string_analyzer.find_duplicate_letters("abc"))
+        self.assertEqual(
+            ["b", "a"], string_analyzer.find_duplicate_letters("abbcaba")
+        )
+
+
 class TestFindLetterIndexes(unittest.TestCase):
     def test(self):
         test_index = string_analyzer.find_letter_indexes(
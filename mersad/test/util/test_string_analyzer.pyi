@@ -8,6 +8,9 @@ import unittest
 class TestFindUniqeLetters(unittest.TestCase):
     def test(self) -> None: ...
 
+class TestFindDuplicateLetters(unittest.TestCase):
+    def test(self) -> None: ...
+
 class TestFindLetterIndexes(unittest.TestCase):
     def test(self) -> None: ...
 
@@ -40,9 +40,11 @@
 #
 
 # Python Standard Library
+import random
 import unittest
 
 # Mersad Library
+from mersad.util.string_manipulation import SHUFFLE_CACHE
 from mersad.util.string_manipulation import replace_letter_by_index
 from mersad.util.string_manipulation import shuffle_string
 
@@ -53,6 +55,19 @@ class TestStringManipulation(unittest.TestCase):
         expected_string = ".uf ls6ehhe nd  ssiglebesiul  tifdw"
         self.assertEqual(expected_string, shuffle_string(test_string, 6))
 
+    def test_shuffle_string_keeps_global_random_state(self):
+        random.seed(42)
+        expected = random.random()
+        random.seed(42)
+        shuffle_string("this will be shuffled using seed 7.", 7)
+        self.assertEqual(expected, random.random())
+
+    def test_shuffle_string_is_cached(self):
+        SHUFFLE_CACHE.clear()
+        first = shuffle_string("this will be shuffled using seed 6.", 6)
+        self.assertIs(first, shuffle_string("this will be shuffled using seed 6.", 6))
+        self.assertEqual(1, SHUFFLE_CACHE.statistics()["hits"])
+
     def test_replace_letter_by_index(self):
         test_string = "Are trying to get something out of this string?"
         expected_string = "ATITe tTITyiTITg tTIT get something out ofTITthis string?"
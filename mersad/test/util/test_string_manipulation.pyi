@@ -7,4 +7,6 @@ import unittest
 
 class TestStringManipulation(unittest.TestCase):
     def test_shuffle_string(self) -> None: ...
+    def test_shuffle_string_keeps_global_random_state(self) -> None: ...
+    def test_shuffle_string_is_cached(self) -> None: ...
     def test_replace_letter_by_index(self) -> None: ...
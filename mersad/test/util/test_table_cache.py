@@ -0,0 +1,159 @@
+# mersad/test/util/test_table_cache.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+# Python Standard Library
+import threading
+import unittest
+
+# Mersad Library
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.util.table_cache import TABLE_CACHE
+from mersad.util.table_cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = LRUCache(max_entries=2, max_bytes=None)
+        cache.put("a", 1)
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(None, cache.get("b"))
+        self.assertEqual(
+            dict(hits=1, misses=1, evictions=0, entries=1),
+            {i: j for (i, j) in cache.statistics().items() if i != "bytes"},
+        )
+
+    def test_evict_least_recently_used(self):
+        cache = LRUCache(max_entries=2, max_bytes=None)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        # touch "a" so "b" becomes the least recently used entry.
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(1, cache.statistics()["evictions"])
+
+    def test_evict_by_memory(self):
+        cache = LRUCache(max_entries=None, max_bytes=100, sizer=lambda value: 40)
+        for i in range(5):
+            cache.put(i, i)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(80, cache.statistics()["bytes"])
+        self.assertEqual(3, cache.statistics()["evictions"])
+
+    def test_discard(self):
+        cache = LRUCache(max_entries=None, max_bytes=None, sizer=lambda value: 40)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.discard("a")
+        cache.discard("c")
+        self.assertNotIn("a", cache)
+        self.assertEqual(1, len(cache))
+        self.assertEqual(40, cache.statistics()["bytes"])
+
+    def test_resize(self):
+        cache = LRUCache(max_entries=None, max_bytes=None)
+        for i in range(5):
+            cache.put(i, i)
+        cache.resize(max_entries=1)
+        self.assertEqual(1, len(cache))
+        self.assertIn(4, cache)
+
+    def test_fetch_builds_once(self):
+        cache = LRUCache()
+        calls = []
+
+        def builder(value):
+            calls.append(value)
+            return value * 2
+
+        self.assertEqual(4, cache.fetch("k", builder, 2))
+        self.assertEqual(4, cache.fetch("k", builder, 2))
+        self.assertEqual([2], calls)
+
+    def test_bypass(self):
+        cache = LRUCache(max_entries=10, max_bytes=None)
+        cache.put("a", 1)
+        calls = []
+
+        def builder(value):
+            calls.append(value)
+            return value
+
+        with cache.bypass():
+            self.assertEqual(1, cache.fetch("a", str, "a"))
+            self.assertEqual("b", cache.fetch("b", builder, "b"))
+            with cache.bypass():
+                # missed values are reused until the block ends.
+                self.assertEqual("b", cache.fetch("b", builder, "b"))
+        self.assertEqual(["b"], calls)
+        self.assertNotIn("b", cache)
+        self.assertEqual("b", cache.fetch("b", str, "b"))
+        self.assertIn("b", cache)
+
+    def test_thread_safety(self):
+        cache = LRUCache(max_entries=10, max_bytes=None)
+
+        def worker():
+            for i in range(1000):
+                cache.fetch(i % 20, str, i % 20)
+
+        threads = [threading.Thread(target=worker) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        statistics = cache.statistics()
+        self.assertEqual(4000, statistics["hits"] + statistics["misses"])
+        self.assertEqual(10, statistics["entries"])
+
+    def test_cipher_tables_are_cached(self):
+        TABLE_CACHE.clear()
+        agent = ShiftCipher(key=7)
+        agent.encrypt("Hail Julius Caesar.")
+        agent.encrypt("Hail Julius Caesar.")
+        self.assertEqual(1, TABLE_CACHE.statistics()["misses"])
+        self.assertEqual(1, TABLE_CACHE.statistics()["hits"])
+
+
+if __name__ == "__main__":
+    unittest.main()
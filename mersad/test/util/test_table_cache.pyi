@@ -0,0 +1,17 @@
+# Stubs for mersad.test.util.test_table_cache (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_and_put(self) -> None: ...
+    def test_evict_least_recently_used(self) -> None: ...
+    def test_evict_by_memory(self) -> None: ...
+    def test_discard(self) -> None: ...
+    def test_resize(self) -> None: ...
+    def test_fetch_builds_once(self) -> None: ...
+    def test_bypass(self) -> None: ...
+    def test_thread_safety(self) -> None: ...
+    def test_cipher_tables_are_cached(self) -> None: ...
@@ -0,0 +1,136 @@
+# mersad/test/util/test_text_view.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+
+# Python Standard Library
+import mmap
+import string
+import tempfile
+import unittest
+
+# Mersad Library
+from mersad.classical.route_cipher import RouteCipher
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.util.text_view import TranslatedView
+from mersad.util.translation_engine import translate
+
+
+class TestTextView(unittest.TestCase):
+    def setUp(self) -> None:
+        self.agent = ShiftCipher(key=3, letter_sequence=string.ascii_letters)
+        self.plain_text = "Hail Julius Caesar, " * 50
+        self.cipher_text = self.agent.encrypt(self.plain_text)
+
+    def test_indexing(self):
+        view = TranslatedView(
+            self.cipher_text, self.agent.compile().decrypt_table, translate, 16
+        )
+        self.assertEqual(len(self.plain_text), len(view))
+        self.assertEqual("H", view[0])
+        self.assertEqual(" ", view[-1])
+        self.assertEqual(self.plain_text[37], view[37])
+        with self.assertRaises(IndexError):
+            view[len(view)]
+        self.assertEqual(self.plain_text, "".join(view))
+
+    def test_slicing(self):
+        view = TranslatedView(
+            self.cipher_text, self.agent.compile().decrypt_table, translate, 16
+        )
+        for index in [
+            slice(0, 4),
+            slice(10, 20),
+            slice(14, 40),
+            slice(5, 5),
+            slice(-20, None),
+            slice(None, None, 3),
+            slice(100, 10, -1),
+            slice(None),
+        ]:
+            self.assertEqual(self.plain_text[index], view[index])
+
+    def test_window_cache(self):
+        view = TranslatedView(
+            self.cipher_text, self.agent.compile().decrypt_table, translate, 16, 2
+        )
+        self.assertEqual(self.plain_text[33:47], view[33:47])
+        self.assertEqual(1, len(view._windows))
+        self.assertIs(view._window(2), view._window(2))
+        view[0], view[20], view[60]
+        self.assertEqual(2, len(view._windows))
+        # reading the whole view doesn't fill the cache.
+        self.assertEqual(self.plain_text, "".join(view.windows()))
+        self.assertEqual(2, len(view._windows))
+
+    def test_binary_data(self):
+        data = self.agent.encrypt(self.plain_text.encode())
+        with tempfile.TemporaryFile() as file:
+            file.write(data)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for text in [data, memoryview(data), mapped]:
+                    view = self.agent.view(text, decrypt=True)
+                    self.assertEqual(ord("H"), view[0])
+                    self.assertEqual(b"Julius", view[5:11])
+                    self.assertEqual(self.plain_text.encode(), bytes(view))
+
+    def test_agent_view(self):
+        view = self.agent.view(self.cipher_text, decrypt=True)
+        self.assertEqual(self.plain_text[:11], view[:11])
+        view = self.agent.view(self.plain_text, key=4)
+        self.assertEqual(ShiftCipher(key=4).encrypt("Hail"), view[:4])
+        view = self.agent.compile().view(self.plain_text)
+        self.assertEqual(self.cipher_text[:100], view[:100])
+        view = self.agent.compile().view(self.cipher_text, decrypt=True)
+        self.assertEqual(self.plain_text[-100:], view[-100:])
+
+    def test_unsupported_tables(self):
+        with self.assertRaises(ValueError):
+            ShiftCipher(strip_unknown=True).view(self.plain_text)
+        route = [3, 2, 1, 0, 4, 8, 12, 13, 14, 15, 11, 7, 6, 5, 9, 10]
+        with self.assertRaises(ValueError):
+            RouteCipher(key=4, route=route).view("WEAREDISCOVERED!")
+        with self.assertRaises(ValueError):
+            TranslatedView("abc", self.agent.compile().encrypt_table, translate, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+# Stubs for mersad.test.util.test_text_view (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+from typing import Any
+
+class TestTextView(unittest.TestCase):
+    agent: Any = ...
+    plain_text: Any = ...
+    cipher_text: Any = ...
+    def setUp(self) -> None: ...
+    def test_indexing(self) -> None: ...
+    def test_slicing(self) -> None: ...
+    def test_window_cache(self) -> None: ...
+    def test_binary_data(self) -> None: ...
+    def test_agent_view(self) -> None: ...
+    def test_unsupported_tables(self) -> None: ...
@@ -0,0 +1,156 @@
+# mersad/test/util/test_translation_backend.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+#
+
+# Python Standard Library
+import string
+import unittest
+
+# Mersad Library
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.classical.shift_cipher import shift_cipher_table
+from mersad.util import translation_backend
+from mersad.util.translation_backend import BACKENDS
+from mersad.util.translation_backend import pin_backend
+from mersad.util.translation_backend import select_backend
+from mersad.util.translation_backend import text_kind
+from mersad.util.translation_backend import translate
+
+
+class TestTranslationBackend(unittest.TestCase):
+    def setUp(self) -> None:
+        self.alphabet = string.ascii_letters + "".join(
+            map(chr, range(0x0600, 0x0700))
+        )
+        self.table = shift_cipher_table(key=7, letter_sequence=self.alphabet)
+        self.texts = [
+            "Hail Julius Caesar.",
+            "ایران \ud800!" * 100,
+            b"Hail Julius Caesar.",
+            bytearray(b"Hail Julius Caesar."),
+        ]
+
+    def tearDown(self) -> None:
+        pin_backend(None)
+
+    def test_text_kind(self):
+        self.assertEqual("ascii", text_kind("abc"))
+        self.assertEqual("str", text_kind("اbc"))
+        self.assertEqual("bytes", text_kind(b"abc"))
+        self.assertEqual("bytes", text_kind(bytearray(b"abc")))
+
+    def test_backends_agree(self):
+        byte_table = shift_cipher_table(key=7, letter_sequence=string.ascii_letters)
+        for text in self.texts:
+            table = byte_table if text_kind(text) == "bytes" else self.table
+            expected = translate(text, table, "python")
+            for name, backend in BACKENDS.items():
+                if not backend.available() or text_kind(text) not in backend.kinds:
+                    continue
+                translated = translate(text, table, name)
+                self.assertEqual(expected, translated)
+                self.assertIs(type(text), type(translated))
+
+    def test_automatic_selection(self):
+        self.assertEqual("str", select_backend("a" * 100000).name)
+        self.assertEqual("bytes", select_backend(b"a" * 100000).name)
+        self.assertEqual("str", select_backend("ا").name)
+        expected = "numpy" if BACKENDS["numpy"].available() else "str"
+        self.assertEqual(expected, select_backend("ا" * 100000).name)
+
+    def test_pin_backend(self):
+        pin_backend("python")
+        self.assertEqual("python", select_backend("abc").name)
+        # explicit backend wins over pinned backend.
+        self.assertEqual("str", select_backend("abc", "str").name)
+        pin_backend("str")
+        # pinned backend is ignored for texts it can't translate.
+        self.assertEqual("bytes", select_backend(b"abc").name)
+        pin_backend(None)
+        self.assertEqual("str", select_backend("abc").name)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            pin_backend("fortran")
+        with self.assertRaises(ValueError):
+            select_backend(b"abc", "str")
+
+    def test_cipher_uses_pinned_backend(self):
+        agent = ShiftCipher(key=7, letter_sequence=self.alphabet)
+        expected = agent.encrypt(self.texts[1])
+        pin_backend("python")
+        self.assertEqual(expected, agent.encrypt(self.texts[1]))
+        self.assertEqual(self.texts[1], agent.decrypt(expected))
+
+    @unittest.skipUnless(BACKENDS["numpy"].available(), "NumPy isn't installed.")
+    def test_lookup_arrays_are_evicted(self):
+        cache = translation_backend.LOOKUP_CACHE
+        limits = (cache.max_entries, cache.max_bytes)
+        # every array covers code points up to the emoji, about 500 KiB.
+        tables = [
+            shift_cipher_table(key=key, letter_sequence="ab\U0001f600")
+            for key in range(1, 3)
+        ]
+        try:
+            cache.clear()
+            cache.resize(8, 768 * 1024)
+            for (table, expected) in zip(tables, ["b\U0001f600a", "\U0001f600ab"]):
+                self.assertEqual(expected, translate("ab\U0001f600", table, "numpy"))
+            self.assertEqual(1, cache.statistics()["entries"])
+            self.assertEqual(1, cache.statistics()["evictions"])
+            self.assertLessEqual(cache.statistics()["bytes"], 768 * 1024)
+        finally:
+            cache.resize(*limits)
+            cache.clear()
+
+    @unittest.skipUnless(BACKENDS["numpy"].available(), "NumPy isn't installed.")
+    def test_calibrate(self):
+        thresholds = dict(translation_backend.THRESHOLDS)
+        try:
+            calibrated = translation_backend.calibrate(sizes=(16, 256), repeat=1)
+            self.assertEqual(0, calibrated[("str", "ascii")])
+            self.assertIn(calibrated[("numpy", "str")], (None, 16, 256))
+        finally:
+            translation_backend.THRESHOLDS.update(thresholds)
+
+
+if __name__ == "__main__":
+    unittest.main()
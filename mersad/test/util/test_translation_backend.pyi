@@ -0,0 +1,22 @@
+# Stubs for mersad.test.util.test_translation_backend (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+from typing import Any
+
+class TestTranslationBackend(unittest.TestCase):
+    alphabet: Any = ...
+    table: Any = ...
+    texts: Any = ...
+    def setUp(self) -> None: ...
+    def tearDown(self) -> None: ...
+    def test_text_kind(self) -> None: ...
+    def test_backends_agree(self) -> None: ...
+    def test_automatic_selection(self) -> None: ...
+    def test_pin_backend(self) -> None: ...
+    def test_unknown_backend(self) -> None: ...
+    def test_cipher_uses_pinned_backend(self) -> None: ...
+    def test_lookup_arrays_are_evicted(self) -> None: ...
+    def test_calibrate(self) -> None: ...
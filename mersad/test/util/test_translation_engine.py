@@ -0,0 +1,299 @@
+# mersad/test/util/test_translation_engine.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+# Python Standard Library
+import gc
+import os
+import pickle
+import string
+import sys
+import unittest
+import weakref
+
+# 3rd Party Library
+from ErfanIO import ReaderIO
+
+# Mersad Library
+from mersad.classical.affine_cipher import affine_cipher_table
+from mersad.classical.atbash_cipher import atbash_cipher_table
+from mersad.classical.mixalph_cipher import mixalph_cipher_table
+from mersad.classical.shift_cipher import shift_cipher_table
+from mersad.util.table_cache import estimate_size
+from mersad.util.translation_engine import CHUNK_SIZE
+from mersad.util.translation_engine import CompactTranslationTable
+from mersad.util.translation_engine import StrippingTranslationTable
+from mersad.util.translation_engine import case_preserving_table
+from mersad.util.translation_engine import compact_table
+from mersad.util.translation_engine import compile_sequences
+from mersad.util.translation_engine import compile_table
+from mersad.util.translation_engine import compose_table
+from mersad.util.translation_engine import expanded_table
+from mersad.util.translation_engine import invert_table
+from mersad.util.translation_engine import normalizing_table
+from mersad.util.translation_engine import reference_translate
+from mersad.util.translation_engine import translate
+from mersad.util.translation_engine import translate_into
+from mersad.util.translation_engine import translate_many
+
+
+class TestTranslationEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        # setup path
+        util_path = os.path.abspath(os.path.dirname(__file__))
+        test_path = os.path.abspath(os.path.dirname(util_path))
+        self.base_path = os.path.join(test_path, "asset", "texts")
+        self.plain_text = ReaderIO.read(
+            os.path.join(self.base_path, "Long License File.txt"), "text"
+        )
+        self.alphabet = string.printable.replace("\r", "")
+
+    def test_compile_table(self):
+        table = compile_table({"a": "b", "b": "a"})
+        self.assertEqual({97: 98, 98: 97}, table)
+
+    def test_translate(self):
+        table = compile_table({"a": "b", "b": "a"})
+        self.assertEqual("bac!", translate("abc!", table))
+
+    def test_translate_bytes(self):
+        table = compile_table({"a": "b", "b": "a"})
+        self.assertEqual(b"bac!", translate(b"abc!", table))
+        self.assertEqual(bytearray(b"bac!"), translate(bytearray(b"abc!"), table))
+
+    def test_bytes_table(self):
+        table = compile_table({"a": "b", "b": "a", "\u4e00": "c"})
+        expected = bytearray(range(256))
+        expected[97], expected[98] = 98, 97
+        self.assertEqual(bytes(expected), table.bytes_table)
+
+    def test_bytes_table_out_of_range(self):
+        table = compile_table({"a": "\u4e00"})
+        with self.assertRaises(ValueError):
+            translate(b"abc", table)
+
+    def test_translate_into(self):
+        table = compile_table({"a": "b", "b": "a"})
+        # source is larger than one chunk.
+        source = b"abc!" * CHUNK_SIZE
+        destination = bytearray(len(source) + 2)
+        self.assertEqual(len(source), translate_into(source, destination, table))
+        self.assertEqual(b"bac!" * CHUNK_SIZE + b"\x00\x00", destination)
+
+    def test_translate_into_same_buffer(self):
+        table = compile_table({"a": "b", "b": "a"})
+        buffer = bytearray(b"abc!")
+        translate_into(buffer, buffer, table)
+        self.assertEqual(bytearray(b"bac!"), buffer)
+
+    def test_translate_into_small_destination(self):
+        table = compile_table({"a": "b", "b": "a"})
+        with self.assertRaises(ValueError):
+            translate_into(b"abc!", bytearray(3), table)
+
+    def test_translate_many(self):
+        table = compile_table({"a": "b", "b": "a"})
+        texts = ["abc", "", "ba!", "a" * 1000]
+        self.assertEqual(
+            [translate(text, table) for text in texts], translate_many(texts, table)
+        )
+        self.assertEqual(
+            [b"ba", bytearray(b"ab"), "b"],
+            translate_many([b"ab", bytearray(b"ba"), "a"], table),
+        )
+        # tables which delete letters translate texts one by one.
+        table = normalizing_table(table, False, True)
+        self.assertEqual(["ba", "", "a"], translate_many(["ab!", "?", "b"], table))
+        self.assertEqual([], translate_many(iter([]), table))
+
+    def test_compile_sequences(self):
+        self.assertEqual({97: 98, 98: 97}, compile_sequences("ab", "ba"))
+        # first occurrence of a repeated letter is used.
+        self.assertEqual({97: 98, 98: 99}, compile_sequences("aba", "bca"))
+
+    def test_large_alphabet(self):
+        # 100k letters outside of the basic multilingual plane.
+        alphabet = "".join(map(chr, range(0x20000, 0x20000 + 100000)))
+        table = shift_cipher_table(key=7, letter_sequence=alphabet)
+        self.assertEqual(len(alphabet), len(table))
+        self.assertEqual(alphabet[7:] + alphabet[:7], translate(alphabet, table))
+
+    def test_compact_table(self):
+        # a whole block of letters and a few scattered letters.
+        alphabet = "".join(map(chr, range(0x4E00, 0x4E00 + 5000))) + "abc\U00020000"
+        table = shift_cipher_table(key=7, letter_sequence=alphabet)
+        expected = dict(table.items())
+        self.assertIsInstance(table, CompactTranslationTable)
+        self.assertEqual(expected, table)
+        self.assertEqual(len(expected), len(table))
+        self.assertEqual(set(expected), set(table))
+        self.assertEqual(expected[ord("b")], table[ord("b")])
+        self.assertEqual(expected[0x4E00], table.get(0x4E00))
+        self.assertNotIn(0x4E00 - 1, table)
+        self.assertEqual(None, table.get(0x4E00 + 5000))
+        # short texts use the table, long texts use the expanded table.
+        self.assertEqual(alphabet[7:8], translate(alphabet[:1], table))
+        self.assertEqual(alphabet[7:] + alphabet[:7], translate(alphabet, table))
+        # runs are pickled as they are, not rebuilt from pairs.
+        restored = pickle.loads(pickle.dumps(table))
+        self.assertEqual(table, restored)
+        self.assertEqual(table._starts, restored._starts)
+        self.assertLess(len(pickle.dumps(table)), len(pickle.dumps(expected)))
+        # cache estimates at least five times less memory than a dictionary.
+        self.assertLess(estimate_size(table) * 5, estimate_size(expected))
+
+    def test_expanded_table(self):
+        alphabet = "".join(map(chr, range(0x4E00, 0x4E00 + 5000)))
+        table = compact_table(compile_sequences(alphabet, alphabet[::-1]))
+        self.assertIsInstance(table, CompactTranslationTable)
+        # long texts reuse one expansion, which doesn't keep the table alive.
+        self.assertEqual(alphabet[::-1], translate(alphabet, table))
+        self.assertIs(expanded_table(table), expanded_table(table))
+        reference = weakref.ref(table)
+        del table
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_compact_table_keeps_small_tables(self):
+        table = compile_table({"a": "b", "b": "a"})
+        self.assertIs(table, compact_table(table))
+        # scattered letters have no runs to compact.
+        table = compile_table({chr(i): "a" for i in range(0, 4096, 2)})
+        self.assertIs(table, compact_table(table))
+
+    def test_compact_table_wide_values(self):
+        table = compact_table(
+            compile_sequences("".join(map(chr, range(2048))), chr(0x20000) * 2048)
+        )
+        self.assertEqual(chr(0x20000) * 3, translate("\x00\x01\x02", table))
+        self.assertLess(sys.getsizeof(table), 2048 * 8)
+
+    def test_invert_table(self):
+        table = compile_table({"a": "b", "b": "c", "c": "a"})
+        self.assertEqual(
+            "abc!", translate(translate("abc!", table), invert_table(table))
+        )
+
+    def test_decrypt_table_is_inverted_encrypt_table(self):
+        for function, kwargs in [
+            (shift_cipher_table, dict(key=173, letter_sequence=self.alphabet)),
+            (affine_cipher_table, dict(key=125, letter_sequence=self.alphabet)),
+            (mixalph_cipher_table, dict(key="zxcvbnmlkjhgfdsaqwertyuiop")),
+        ]:
+            self.assertEqual(
+                invert_table(function(**kwargs)), function(**kwargs, decrypt=True)
+            )
+
+    def test_case_preserving_table(self):
+        table = shift_cipher_table(key=1, letter_sequence="abcz")
+        extended = case_preserving_table(table)
+        self.assertEqual("bczaBCZA", translate("abczABCZ", extended))
+        self.assertEqual(
+            case_preserving_table(invert_table(table)), invert_table(extended)
+        )
+        # letters whose other case is in alphabet are left unchanged.
+        table = shift_cipher_table(key=1, letter_sequence="abB")
+        self.assertEqual(table, case_preserving_table(table))
+
+    def test_case_preserving_table_mixed_alphabet(self):
+        # "z" is translated to "0" which has no case, so "Z" can't be added,
+        # nor "Y" which would be translated to "Z", and so on down to "A".
+        alphabet = string.digits + string.ascii_lowercase
+        table = shift_cipher_table(key=1, letter_sequence=alphabet)
+        table = case_preserving_table(table)
+        self.assertEqual("YZ z0 AB", translate("YZ yz AB", table))
+        self.assertEqual(len(set(table.values())), len(table))
+        for text in ["YZ yz AB", string.ascii_letters + string.digits]:
+            self.assertEqual(
+                text, translate(translate(text, table), invert_table(table))
+            )
+
+    def test_normalizing_table(self):
+        table = shift_cipher_table(key=1, letter_sequence="abcz")
+        folded = normalizing_table(table, True, False)
+        self.assertEqual("bczabcza, D", translate("abczABCZ, D", folded))
+        stripped = normalizing_table(table, False, True)
+        self.assertIsInstance(stripped, StrippingTranslationTable)
+        self.assertEqual("bczab", translate("abc, zA Bad!", stripped))
+        both = normalizing_table(table, True, True)
+        self.assertEqual("bczabcza", translate("abcz, ABCZ, D", both))
+        self.assertEqual("bczabcza", reference_translate("abcz, ABCZ, D", both))
+
+    def test_strip_bytes(self):
+        table = shift_cipher_table(key=1, letter_sequence="ab")
+        table = normalizing_table(table, True, True)
+        self.assertEqual(b"baaba", translate(b"ab, BA! b", table))
+        self.assertEqual(bytearray(b"ba"), translate(bytearray(b"a-b"), table))
+        buffer = bytearray(b"ab, BA! b")
+        self.assertEqual(5, translate_into(buffer, buffer, table))
+        self.assertEqual(b"baaba", buffer[:5])
+
+    def test_compose_stripping_table(self):
+        shift = shift_cipher_table(key=1, letter_sequence="abc")
+        strip = shift_cipher_table(key=1, letter_sequence="bcd")
+        strip = normalizing_table(strip, False, True)
+        for first, second in [(shift, strip), (strip, shift)]:
+            composed = compose_table(first, second)
+            self.assertIsInstance(composed, StrippingTranslationTable)
+            text = "abcdxyz, ABC"
+            self.assertEqual(
+                translate(translate(text, first), second), translate(text, composed)
+            )
+
+    def test_reference_translate(self):
+        table = compile_table({"a": "b", "b": "a"})
+        self.assertEqual("bac!", reference_translate("abc!", table))
+
+    def test_translate_matches_reference(self):
+        tables = [
+            shift_cipher_table(key=173, letter_sequence=self.alphabet, shuffle=True),
+            affine_cipher_table(key=125, letter_sequence=self.alphabet),
+            atbash_cipher_table(letter_sequence=self.alphabet, decrypt=True),
+            mixalph_cipher_table(key="zxcvbnmlkjhgfdsaqwertyuiop"),
+        ]
+        for table in tables:
+            self.assertEqual(
+                reference_translate(self.plain_text, table),
+                translate(self.plain_text, table),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
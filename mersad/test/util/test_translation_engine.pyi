@@ -0,0 +1,37 @@
+# Stubs for mersad.test.util.test_translation_engine (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import unittest
+from typing import Any
+
+class TestTranslationEngine(unittest.TestCase):
+    base_path: Any = ...
+    plain_text: Any = ...
+    alphabet: Any = ...
+    def setUp(self) -> None: ...
+    def test_compile_table(self) -> None: ...
+    def test_translate(self) -> None: ...
+    def test_translate_bytes(self) -> None: ...
+    def test_bytes_table(self) -> None: ...
+    def test_bytes_table_out_of_range(self) -> None: ...
+    def test_translate_into(self) -> None: ...
+    def test_translate_into_same_buffer(self) -> None: ...
+    def test_translate_into_small_destination(self) -> None: ...
+    def test_translate_many(self) -> None: ...
+    def test_compile_sequences(self) -> None: ...
+    def test_large_alphabet(self) -> None: ...
+    def test_compact_table(self) -> None: ...
+    def test_expanded_table(self) -> None: ...
+    def test_compact_table_keeps_small_tables(self) -> None: ...
+    def test_compact_table_wide_values(self) -> None: ...
+    def test_invert_table(self) -> None: ...
+    def test_decrypt_table_is_inverted_encrypt_table(self) -> None: ...
+    def test_case_preserving_table(self) -> None: ...
+    def test_case_preserving_table_mixed_alphabet(self) -> None: ...
+    def test_normalizing_table(self) -> None: ...
+    def test_strip_bytes(self) -> None: ...
+    def test_compose_stripping_table(self) -> None: ...
+    def test_reference_translate(self) -> None: ...
+    def test_translate_matches_reference(self) -> None: ...
@@ -55,10 +55,20 @@ from typing import List
 
 # please keep alphabetical order.
 __all__: List[str] = [
+    "alphabet",
     "base_class",
     "crypto_math",
+    "disk_cache",
+    "fan_out",
+    "grouping",
+    "key_store",
+    "pipeline",
     "string_analyzer",
     "string_manipulation",
+    "table_cache",
     "terminal_app_tools",
+    "text_view",
+    "translation_backend",
+    "translation_engine",
     "type_check",
 ]
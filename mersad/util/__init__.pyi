@@ -3,9 +3,19 @@
 # NOTE: This dynamically typed stub was automatically generated by stubgen.
 
 # Names in __all__ with no definition:
+#   alphabet
 #   base_class
 #   crypto_math
+#   disk_cache
+#   fan_out
+#   grouping
+#   key_store
+#   pipeline
 #   string_analyzer
 #   string_manipulation
+#   table_cache
 #   terminal_app_tools
+#   text_view
+#   translation_backend
+#   translation_engine
 #   type_check
@@ -0,0 +1,222 @@
+# mersad/util/alphabet.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.alphabet module.
+============================
+
+The module contains Alphabet, an immutable string of letters
+which is interned by its content and keeps data that ciphers
+need about their alphabets.
+
+Creating an Alphabet with the content of a living Alphabet
+returns the same object, so all the agents which use the default
+alphabet share one Alphabet and everything it has computed:
+index of every letter, set of letters, repeated letters and
+shuffled versions of it for every seed.
+
+Alphabet is a subclass of str, so it can be used wherever a
+letter sequence is expected and tables built for an Alphabet are
+found in table cache with a plain string of the same letters.
+
+Example
+=======
+
+>>> from mersad.util.alphabet import Alphabet
+>>> alphabet = Alphabet("abcdefghijklmnopqrstuvwxyz")
+>>> alphabet is Alphabet("abcdefghijklmnopqrstuvwxyz")
+True
+>>> alphabet.index("c")
+2
+
+"""
+
+# Python Standard Library
+import string
+import threading
+import weakref
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Mersad Library
+from mersad.util import string_analyzer
+from mersad.util import string_manipulation
+from mersad.util.table_cache import LRUCache
+
+# number of shuffled versions of an alphabet which are kept.
+SHUFFLE_CACHE_SIZE: int = 16
+
+
+class Alphabet(str):
+    """
+    Immutable, interned sequence of letters.
+
+    Letter indexes, set of letters and repeated letters are computed
+    on first use and kept for later calls.
+    """
+
+    # living alphabets by their content.
+    _interned: "weakref.WeakValueDictionary[str, Alphabet]" = (
+        weakref.WeakValueDictionary()
+    )
+    _lock: threading.Lock = threading.Lock()
+
+    def __new__(cls, letters: str = "") -> "Alphabet":
+        """
+        Return the Alphabet of letters, create it if it doesn't exist.
+
+        :param letters  : letters of alphabet.
+        :return         : alphabet with the same letters.
+        :rtype          : Alphabet
+        """
+        if type(letters) is cls:
+            return letters
+        # key of interned alphabets must be a plain string.
+        letters = str.__str__(letters)
+        with cls._lock:
+            alphabet: Optional[Alphabet] = cls._interned.get(letters)
+            if alphabet is None:
+                alphabet = super().__new__(cls, letters)
+                alphabet._indexes = None
+                alphabet._letter_set = None
+                alphabet._duplicates = None
+                alphabet._shuffles = None
+                cls._interned[letters] = alphabet
+            return alphabet
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the alphabet by its letters, so it's interned on unpickling."""
+        return type(self), (str.__str__(self),)
+
+    def __contains__(self, letter: object) -> bool:
+        """Check if a letter (or a substring) is in the alphabet."""
+        if isinstance(letter, str) and len(letter) == 1:
+            return letter in self.letter_set
+        return super().__contains__(letter)
+
+    @property
+    def indexes(self) -> Dict[str, int]:
+        """
+        Return index of every letter in the alphabet.
+
+        Repeated letters take the index of their first occurrence.
+
+        :return : letter to index dictionary.
+        :rtype  : dict
+        """
+        if self._indexes is None:
+            self._indexes = {
+                letter: index for (index, letter) in reversed(list(enumerate(self)))
+            }
+        return self._indexes
+
+    @property
+    def letter_set(self) -> FrozenSet[str]:
+        """
+        Return set of letters in the alphabet.
+
+        :return : set of letters.
+        :rtype  : frozenset
+        """
+        if self._letter_set is None:
+            self._letter_set = frozenset(self)
+        return self._letter_set
+
+    @property
+    def duplicates(self) -> List[str]:
+        """
+        Return letters which are repeated in the alphabet.
+
+        :return : repeated letters in order of their second occurrence.
+        :rtype  : list
+        """
+        if self._duplicates is None:
+            self._duplicates = (
+                []
+                if len(self.letter_set) == len(self)
+                else string_analyzer.find_duplicate_letters(str.__str__(self))
+            )
+        return self._duplicates
+
+    def index(self, letter: str, *args: Any) -> int:  # type: ignore
+        """
+        Return index of the first occurrence of a letter (or a substring).
+
+        :param letter       : letter to be found.
+        :raise ValueError   : if letter isn't in the alphabet.
+        :return             : index of letter.
+        :rtype              : int
+        """
+        if not args and len(letter) == 1:
+            try:
+                return self.indexes[letter]
+            except KeyError:
+                raise ValueError("substring not found") from None
+        return super().index(letter, *args)
+
+    def shuffled(self, seed: int) -> "Alphabet":
+        """
+        Return the alphabet shuffled with a seed.
+
+        The last SHUFFLE_CACHE_SIZE shuffled alphabets are kept.
+
+        :param seed : number for setting seed of shuffle.
+        :return     : shuffled alphabet.
+        :rtype      : Alphabet
+        """
+        if self._shuffles is None:
+            self._shuffles = LRUCache(max_entries=SHUFFLE_CACHE_SIZE, max_bytes=None)
+        return self._shuffles.fetch(seed, self._shuffle, seed)
+
+    def _shuffle(self, seed: int) -> "Alphabet":
+        """Shuffle the alphabet with a seed without caching."""
+        return Alphabet(string_manipulation.shuffle_string(self, seed))
+
+
+# default alphabet of ciphers, string.printable except "\r".
+DEFAULT_ALPHABET: Alphabet = Alphabet(string.printable.replace("\r", ""))
@@ -0,0 +1,40 @@
+# Stubs for mersad.util.alphabet (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import threading
+import weakref
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Mersad Library
+from mersad.util.table_cache import LRUCache
+
+SHUFFLE_CACHE_SIZE: int
+
+class Alphabet(str):
+    _interned: weakref.WeakValueDictionary[str, Alphabet] = ...
+    _lock: threading.Lock = ...
+    _indexes: Optional[Dict[str, int]] = ...
+    _letter_set: Optional[FrozenSet[str]] = ...
+    _duplicates: Optional[List[str]] = ...
+    _shuffles: Optional[LRUCache] = ...
+    def __new__(cls, letters: str = ...) -> Alphabet: ...
+    def __reduce__(self) -> Tuple[Any, ...]: ...
+    def __contains__(self, letter: object) -> bool: ...
+    @property
+    def indexes(self) -> Dict[str, int]: ...
+    @property
+    def letter_set(self) -> FrozenSet[str]: ...
+    @property
+    def duplicates(self) -> List[str]: ...
+    def index(self, letter: str, *args: Any) -> int: ...
+    def shuffled(self, seed: int) -> Alphabet: ...
+    def _shuffle(self, seed: int) -> Alphabet: ...
+
+DEFAULT_ALPHABET: Alphabet
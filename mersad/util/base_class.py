@@ -51,17 +51,82 @@ Mersad's cipher classes.
 """
 
 # Python Standard Library
-import string
+from types import MappingProxyType
+from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Tuple
+from typing import Type
 from typing import Union
 
 # Mersad Library
+from mersad.util import grouping
+from mersad.util import string_manipulation
+from mersad.util import translation_backend
+from mersad.util import translation_engine
 from mersad.util import type_check
+from mersad.util.alphabet import DEFAULT_ALPHABET
+from mersad.util.alphabet import Alphabet
+from mersad.util.text_view import SOURCE_TYPE
+from mersad.util.text_view import TranslatedView
+from mersad.util.translation_engine import BUFFER_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
+from mersad.util.translation_engine import TranslationTable
 
 # define type aliases.
-KWARGS_TYPE = Union[int, str, bool, List[int]]
+KWARGS_TYPE = Union[int, str, bytes, bool, List[int]]
+
+
+class _Configuration(Dict[str, KWARGS_TYPE]):
+    """
+    Configuration dictionary of an agent.
+
+    It keeps the validated copy used by encryption/decryption calls and
+    drops it whenever the dictionary is changed, so direct changes like
+    agent.configuration["key"] = 2 take effect on the next call.
+    "decrypt" switch is set by every call and doesn't drop the copy.
+    """
+
+    def __init__(self, *args: Any, **kwargs: KWARGS_TYPE) -> None:
+        super().__init__(*args, **kwargs)
+        self.validated: Optional[Dict[str, KWARGS_TYPE]] = None
+
+    def __setitem__(self, key: str, value: KWARGS_TYPE) -> None:
+        super().__setitem__(key, value)
+        if key != "decrypt":
+            self.validated = None
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.validated = None
+
+    def __ior__(self, other: Any) -> "_Configuration":
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.validated = None
+
+    def pop(self, key: str, *default: Any) -> Any:
+        self.validated = None
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[str, KWARGS_TYPE]:
+        self.validated = None
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.validated = None
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: KWARGS_TYPE) -> None:
+        super().update(*args, **kwargs)
+        self.validated = None
 
 
 class MersadClassicalBase(object):
@@ -88,11 +153,20 @@ class MersadClassicalBase(object):
         Valid kwargs
         ============
         key             : (optional) primary key.
-        letter_sequence : (optional) alphabet for using in cipher.
+        letter_sequence : (optional) alphabet for using in cipher, a string,
+                          bytes or an Alphabet object.
         sort_key        : (optional) a key for sorting alphabet.
         shuffle         : (optional) randomize letter sequence order.
         seed            : (optional)(requires shuffle) specifies a seed for
                           randomizing, default seed is 0.
+        preserve_case   : (optional) translate the other case of letters
+                          which only one case of them is in alphabet, and
+                          keep their case.
+        fold_case       : (optional) translate the other case of letters
+                          which only one case of them is in alphabet like
+                          the letters in alphabet.
+        strip_unknown   : (optional) delete letters which aren't in alphabet.
+        inverse         : (optional) swap encryption and decryption.
 
         Note: not all options are required by ciphers, ciphers may doesn't need
         one or a couple of this arguments, for example Atbash cipher doesn't
@@ -107,6 +181,10 @@ class MersadClassicalBase(object):
         Default letter sequence is set to "string.printable" except \r character.
         Default shuffle is set to False.
         Default seed is set to 0.
+        Default preserve_case is set to False.
+        Default fold_case is set to False.
+        Default strip_unknown is set to False.
+        Default inverse is set to False.
 
         Each instance has it's own unique configurations saved in
         self.configuration and can work independent from other instances.
@@ -130,13 +208,18 @@ class MersadClassicalBase(object):
         # should not be changed by anyone!
         self._defaults: Dict[str, KWARGS_TYPE] = dict(
             key=None,
-            letter_sequence=string.printable.replace("\r", ""),
+            letter_sequence=DEFAULT_ALPHABET,
             shuffle=False,
             seed=0,
+            preserve_case=False,
+            fold_case=False,
+            strip_unknown=False,
             decrypt=False,
+            inverse=False,
         )
-        # public configuration dictionary.
-        self.configuration: Dict[str, KWARGS_TYPE] = dict()
+        # public configuration dictionary, it also keeps the validated copy
+        # used by every encryption/decryption call until it's changed.
+        self._configuration: _Configuration = _Configuration()
         # do subclass specific init subroutines.
         self._init_subroutines()
         # set self.configuration to default values (default_configuration).
@@ -144,6 +227,25 @@ class MersadClassicalBase(object):
         # process kwargs and update self.configuration values.
         self.config(**kwargs)
 
+    @property
+    def configuration(self) -> Dict[str, KWARGS_TYPE]:
+        """
+        Return configuration dictionary of the agent.
+
+        :return : configuration dictionary.
+        :rtype  : dict
+        """
+        return self._configuration
+
+    @configuration.setter
+    def configuration(self, configuration: Dict[str, KWARGS_TYPE]) -> None:
+        """
+        Replace configuration dictionary of the agent with a copy of given one.
+
+        :param configuration    : new configuration dictionary.
+        """
+        self._configuration = _Configuration(configuration)
+
     def __str__(self) -> str:
         """
         Return the objects info as string.
@@ -166,18 +268,33 @@ class MersadClassicalBase(object):
             seed,
         )
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the agent by its cipher class and changed configurations.
+
+        Only configurations which differ from defaults of cipher are
+        pickled, so sending an agent to another process is cheap.
+        """
+        return (
+            _restore_agent,
+            (type(self), _changed_configuration(type(self), self.configuration)),
+        )
+
     def encrypt(
         self,
-        plain_text: str,
+        plain_text: TEXT_TYPE,
         key: Optional[int] = None,
         replace_key: bool = False,
         **kwargs: KWARGS_TYPE,
-    ) -> str:
+    ) -> TEXT_TYPE:
         """
         Encrypt a string.
 
         This function is a wrapper for self._process function.
 
+        Binary data (bytes or bytearray) can be encrypted too, the result
+        has the same type as plain_text.
+
         :param plain_text   :   (required) the string that will be encrypted.
         :param key          :   (optional) a new key for encryption.
         :param replace_key  :   (optional) if set to True, the provided new key
@@ -189,16 +306,19 @@ class MersadClassicalBase(object):
 
     def decrypt(
         self,
-        cipher_text: str,
+        cipher_text: TEXT_TYPE,
         key: Optional[int] = None,
         replace_key: bool = False,
         **kwargs: KWARGS_TYPE,
-    ) -> str:
+    ) -> TEXT_TYPE:
         """
         Decrypt a string.
 
         This function is a wrapper for self._process function.
 
+        Binary data (bytes or bytearray) can be decrypted too, the result
+        has the same type as cipher_text.
+
         :param cipher_text  :   (required) the string that will be decrypted.
         :param key          :   (optional) a new key for decryption.
         :param replace_key  :   (optional) if set to True, the provided new key
@@ -208,6 +328,270 @@ class MersadClassicalBase(object):
         """
         return self._process(cipher_text, key, replace_key, True, **kwargs)
 
+    def encrypt_into(
+        self,
+        source: BUFFER_TYPE,
+        destination: BUFFER_TYPE,
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> int:
+        """
+        Encrypt binary data directly into a preallocated buffer.
+
+        No intermediate copy of the whole data is created, so memory
+        usage stays at the size of the buffers.
+
+        Example
+        =======
+
+        >>> from mersad.classical.shift_cipher import ShiftCipher
+        >>> agent = ShiftCipher(key=3)
+        >>> source = b"Hail Julius Caesar."
+        >>> destination = bytearray(len(source))
+        >>> agent.encrypt_into(memoryview(source), destination)
+        19
+
+        :param source       :   (required) bytes-like data that will be encrypted.
+        :param destination  :   (required) writable buffer (bytearray or
+                                memoryview) large enough for the result.
+        :param key          :   (optional) a new key for encryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at self.configuration.
+        :raise ValueError   :   if destination is too small.
+        :return             :   number of bytes written into destination.
+        :rtype              :   int
+        """
+        return self._process_into(
+            source, destination, key, replace_key, False, **kwargs
+        )
+
+    def decrypt_into(
+        self,
+        source: BUFFER_TYPE,
+        destination: BUFFER_TYPE,
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> int:
+        """
+        Decrypt binary data directly into a preallocated buffer.
+
+        :param source       :   (required) bytes-like data that will be decrypted.
+        :param destination  :   (required) writable buffer (bytearray or
+                                memoryview) large enough for the result.
+        :param key          :   (optional) a new key for decryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at self.configuration.
+        :raise ValueError   :   if destination is too small.
+        :return             :   number of bytes written into destination.
+        :rtype              :   int
+        """
+        return self._process_into(
+            source, destination, key, replace_key, True, **kwargs
+        )
+
+    def encrypt_inplace(
+        self,
+        buffer: bytearray,
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> None:
+        """
+        Encrypt binary data in place.
+
+        Ciphers which need padding (e.g. Route cipher) extend the buffer
+        and ciphers which strip unknown letters shrink it.
+
+        :param buffer       :   (required) bytearray that will be encrypted.
+        :param key          :   (optional) a new key for encryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at self.configuration.
+        """
+        written: int = self._process_into(
+            buffer, buffer, key, replace_key, False, **kwargs
+        )
+        # stripped letters leave a stale tail behind the written bytes.
+        del buffer[written:]
+
+    def decrypt_inplace(
+        self,
+        buffer: bytearray,
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> None:
+        """
+        Decrypt binary data in place.
+
+        :param buffer       :   (required) bytearray that will be decrypted.
+        :param key          :   (optional) a new key for decryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at self.configuration.
+        """
+        written: int = self._process_into(
+            buffer, buffer, key, replace_key, True, **kwargs
+        )
+        # stripped letters leave a stale tail behind the written bytes.
+        del buffer[written:]
+
+    def encrypt_many(
+        self,
+        plain_texts: Iterable[TEXT_TYPE],
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> List[TEXT_TYPE]:
+        """
+        Encrypt many strings with the same configuration.
+
+        Configuration is copied and the table is fetched once for the whole
+        batch, strings of monoalphabetic ciphers are encrypted in one
+        translate call, see translation_engine.translate_many.
+
+        Example
+        =======
+
+        >>> from mersad.classical.shift_cipher import ShiftCipher
+        >>> agent = ShiftCipher(key=3, letter_sequence="abcdefghijklmnopqrstuvwxyz")
+        >>> agent.encrypt_many(["Hail", "Julius", "Caesar."])
+        ['Hdlo', 'Jxolxv', 'Cdhvdu.']
+
+        :param plain_texts  :   (required) strings that will be encrypted.
+        :param key          :   (optional) a new key for encryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at self.configuration.
+        :return             :   encrypted strings in the same order.
+        :rtype              :   list
+        """
+        return self._process_many(plain_texts, key, replace_key, False, **kwargs)
+
+    def decrypt_many(
+        self,
+        cipher_texts: Iterable[TEXT_TYPE],
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> List[TEXT_TYPE]:
+        """
+        Decrypt many strings with the same configuration.
+
+        :param cipher_texts :   (required) strings that will be decrypted.
+        :param key          :   (optional) a new key for decryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at self.configuration.
+        :return             :   decrypted strings in the same order.
+        :rtype              :   list
+        """
+        return self._process_many(cipher_texts, key, replace_key, True, **kwargs)
+
+    def encrypt_grouped(
+        self,
+        plain_text: TEXT_TYPE,
+        group_size: int = 5,
+        line_width: int = 0,
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE:
+        """
+        Encrypt a string and write the result in groups of letters.
+
+        Groups are separated by spaces and lines by newlines, the text
+        is encrypted and grouped in chunks, see mersad.util.grouping.
+
+        Example
+        =======
+
+        >>> from mersad.classical.shift_cipher import ShiftCipher
+        >>> agent = ShiftCipher(key=3, letter_sequence="ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+        >>> agent.encrypt_grouped("WEAREDISCOVERED")
+        'ZHDUH GLVFR YHUHG'
+
+        :param plain_text   :   (required) the string that will be encrypted.
+        :param group_size   :   (optional) number of letters in a group,
+                                0 for no groups.
+        :param line_width   :   (optional) largest number of characters in
+                                a line, 0 for no line breaks.
+        :param key          :   (optional) a new key for encryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at self.configuration.
+        :raise ValueError   :   if both group_size and line_width are 0, or
+                                if a separator is a letter of alphabet.
+        :return             :   grouped encrypted string.
+        :rtype              :   str
+        """
+        return self._process_grouped(
+            plain_text, key, replace_key, False, group_size, line_width, **kwargs
+        )
+
+    def decrypt_grouped(
+        self,
+        cipher_text: TEXT_TYPE,
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE:
+        """
+        Decrypt a grouped string, group and line separators are ignored.
+
+        :param cipher_text  :   (required) the string that will be decrypted.
+        :param key          :   (optional) a new key for decryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at self.configuration.
+        :raise ValueError   :   if a separator is a letter of alphabet.
+        :return             :   decrypted string.
+        :rtype              :   str
+        """
+        return self._process_grouped(
+            cipher_text, key, replace_key, True, 0, 0, **kwargs
+        )
+
+    def view(
+        self,
+        text: SOURCE_TYPE,
+        decrypt: bool = False,
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> TranslatedView:
+        """
+        Create a lazy view of encrypted or decrypted text.
+
+        Only the parts of text which are read are translated, translated
+        windows are cached, see mersad.util.text_view.
+
+        Example
+        =======
+
+        >>> from mersad.classical.shift_cipher import ShiftCipher
+        >>> agent = ShiftCipher(key=3, letter_sequence="abcdefghijklmnopqrstuvwxyz")
+        >>> view = agent.view("Hdlo Jxolxv Cdhvdu.", decrypt=True)
+        >>> view[5:11]
+        'Julius'
+
+        :param text         :   (required) string or binary data (bytes,
+                                memoryview or mmap) that will be viewed.
+        :param decrypt      :   (optional) view decrypted text instead of
+                                encrypted text.
+        :param key          :   (optional) a new key for translation.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at self.configuration.
+        :raise ValueError   :   if cipher hasn't a translation table which
+                                keeps every letter.
+        :return             :   lazy view of translated text.
+        :rtype              :   TranslatedView
+        """
+        # type annotate.
+        configuration: Dict[str, KWARGS_TYPE]
+        # fetch configurations for this view.
+        configuration = self._process_configuration(
+            key, replace_key, decrypt, **kwargs
+        )
+
+        return TranslatedView(text, self._table(**configuration), self._apply_table)
+
     def config(self, **kwargs: KWARGS_TYPE) -> None:
         """
         Assign values to self.configuration dictionary.
@@ -215,8 +599,9 @@ class MersadClassicalBase(object):
         :raise ValueError: if type of a dictionary value is wrong.
         """
         if "letter_sequence" in kwargs:
-            type_check.type_guard(kwargs["letter_sequence"], str)
-            self.configuration["letter_sequence"] = kwargs["letter_sequence"]
+            letter_sequence: Alphabet = self._to_alphabet(kwargs["letter_sequence"])
+            self._check_sequence(letter_sequence, "letter sequence")
+            self.configuration["letter_sequence"] = letter_sequence
 
         if "seed" in kwargs:
             type_check.type_guard(kwargs["seed"], int)
@@ -226,10 +611,26 @@ class MersadClassicalBase(object):
             type_check.type_guard(kwargs["shuffle"], bool)
             self.configuration["shuffle"] = kwargs["shuffle"]
 
+        if "preserve_case" in kwargs:
+            type_check.type_guard(kwargs["preserve_case"], bool)
+            self.configuration["preserve_case"] = kwargs["preserve_case"]
+
+        if "fold_case" in kwargs:
+            type_check.type_guard(kwargs["fold_case"], bool)
+            self.configuration["fold_case"] = kwargs["fold_case"]
+
+        if "strip_unknown" in kwargs:
+            type_check.type_guard(kwargs["strip_unknown"], bool)
+            self.configuration["strip_unknown"] = kwargs["strip_unknown"]
+
         if "decrypt" in kwargs:
             type_check.type_guard(kwargs["decrypt"], bool)
             self.configuration["decrypt"] = kwargs["decrypt"]
 
+        if "inverse" in kwargs:
+            type_check.type_guard(kwargs["inverse"], bool)
+            self.configuration["inverse"] = kwargs["inverse"]
+
         # do subroutines.
         self._config_subroutines(**kwargs)
 
@@ -248,20 +649,106 @@ class MersadClassicalBase(object):
         """
         return self.configuration["key"]
 
+    def inverse(self) -> "MersadClassicalBase":
+        """
+        Create an agent which does the opposite of this agent.
+
+        encrypt() method of the new agent is decrypt() method of this agent
+        and vice versa, it shares the (cached) tables of this agent so no
+        new table is built.
+
+        Example
+        =======
+
+        >>> from mersad.classical.shift_cipher import ShiftCipher
+        >>> agent = ShiftCipher(key=3)
+        >>> agent.inverse().encrypt(agent.encrypt("Hail Julius Caesar."))
+        'Hail Julius Caesar.'
+
+        :return : new agent with the same configuration in opposite direction.
+        :rtype  : same class as this agent
+        """
+        agent: MersadClassicalBase = type(self)()
+        agent.configuration = self.configuration
+        agent.configuration["inverse"] = not self.configuration["inverse"]
+        return agent
+
+    def compact(self) -> "CompactAgent":
+        """
+        Create a compact agent with the configuration of this agent.
+
+        Compact agents keep their configuration in one tuple and share
+        their defaults with all the agents of their cipher, so they take
+        a small fraction of memory of an agent.
+
+        Example
+        =======
+
+        >>> from mersad.classical.shift_cipher import ShiftCipher
+        >>> agent = ShiftCipher(key=3, letter_sequence="abcdefghijklmnopqrstuvwxyz")
+        >>> agent = agent.compact()
+        >>> agent.encrypt("Hail Julius Caesar.")
+        'Hdlo Jxolxv Cdhvdu.'
+
+        :return : compact agent.
+        :rtype  : CompactAgent
+        """
+        agent: CompactAgent = CompactAgent(type(self))
+        agent._store(self.configuration)
+        return agent
+
+    def compile(self) -> "CompiledCipher":
+        """
+        Compile current configurations into an immutable cipher object.
+
+        Both encryption and decryption tables are built (and validated)
+        once, the returned object doesn't depend on this agent anymore,
+        so later calls to config() don't affect it and it can be shared
+        between threads without any locking.
+
+        Example
+        =======
+
+        >>> from mersad.classical.shift_cipher import ShiftCipher
+        >>> alphabet = "abcdefghijklmnopqrstuvwxyz"
+        >>> agent = ShiftCipher(key=3453, letter_sequence=alphabet)
+        >>> cipher = agent.compile()
+        >>> cipher.encrypt("Hail Julius Caesar.")
+        'Hvdg Jpgdpn Cvznvm.'
+
+        :raise ValueError   : if configuration is invalid.
+        :return             : compiled cipher.
+        :rtype              : CompiledCipher
+        """
+        # copy configuration without the encryption/decryption switches.
+        parameters: Dict[str, KWARGS_TYPE] = {
+            i: j
+            for (i, j) in self.configuration.items()
+            if i not in ("decrypt", "inverse")
+        }
+        # inverse agents swap encryption and decryption tables.
+        inverse: bool = self.configuration["inverse"]
+        encrypt_table: Any = self._table(**parameters, decrypt=inverse)
+        decrypt_table: Any = self._table(**parameters, decrypt=not inverse)
+        return CompiledCipher(
+            type(self), parameters, encrypt_table, decrypt_table, self._apply_table
+        )
+
     def _process(
         self,
-        text: str,
+        text: TEXT_TYPE,
         key: Optional[int],
         replace_key: bool,
         decrypt: bool,
         **kwargs: KWARGS_TYPE,
-    ) -> str:
+    ) -> TEXT_TYPE:
         """
         Handle the process for both encryption and decryption.
 
         This method main job is to fetch configurations and
-        modify them if necessary and then feed it into the
-        translator method.
+        modify them if necessary and then feed the compiled table
+        into self._apply_table method, ciphers without compiled
+        tables feed configurations into the translator method.
 
         :param text         : string to be processed.
         :param key          : key for encryption/decryption.
@@ -271,13 +758,177 @@ class MersadClassicalBase(object):
         :return             : encrypted/decrypted string.
         :rtype              : str
         """
-        # explicitly switch mode to encryption/decryption.
-        self.config(decrypt=decrypt)
+        # type annotate.
+        configuration: Dict[str, KWARGS_TYPE]
+        # fetch configurations for this call.
+        configuration = self._process_configuration(
+            key, replace_key, decrypt, **kwargs
+        )
+
+        # type annotate.
+        table: Any = self._table(**configuration)
+        if table is None:
+            # return a call to cipher translator function with
+            # configuration dictionary as arguments.
+            return self._translator(text, **configuration)
+
+        return self._apply_table(text, table)
+
+    def _process_into(
+        self,
+        source: BUFFER_TYPE,
+        destination: BUFFER_TYPE,
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        **kwargs: KWARGS_TYPE,
+    ) -> int:
+        """
+        Handle the process for both encryption and decryption into buffers.
+
+        This method does same job as self._process but feeds the
+        compiled table into self._apply_table_into method.
+
+        :param source       : binary data to be processed.
+        :param destination  : writable buffer for the result, it can be
+                              same buffer as source.
+        :param key          : key for encryption/decryption.
+        :param decrypt      : switch for encryption/decryption.
+        :param replace_key  : replace the old key in self.configuration
+                              with new one.
+        :return             : number of bytes written into destination.
+        :rtype              : int
+        """
+        # type annotate.
+        configuration: Dict[str, KWARGS_TYPE]
+        # fetch configurations for this call.
+        configuration = self._process_configuration(
+            key, replace_key, decrypt, **kwargs
+        )
+
+        return self._apply_table_into(
+            source, destination, self._table(**configuration)
+        )
+
+    def _process_many(
+        self,
+        texts: Iterable[TEXT_TYPE],
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        **kwargs: KWARGS_TYPE,
+    ) -> List[TEXT_TYPE]:
+        """
+        Handle the process for both encryption and decryption of many strings.
 
+        This method does same job as self._process, but configuration is
+        fetched once for all the strings.
+
+        :param texts        : strings to be processed.
+        :param key          : key for encryption/decryption.
+        :param replace_key  : replace the old key in self.configuration
+                              with new one.
+        :param decrypt      : switch for encryption/decryption.
+        :return             : encrypted/decrypted strings.
+        :rtype              : list
+        """
         # type annotate.
         configuration: Dict[str, KWARGS_TYPE]
-        # deep copy self.configuration dictionary into new dictionary to be used.
-        configuration = {i: j for (i, j) in self.configuration.items()}
+        # fetch configurations for this batch.
+        configuration = self._process_configuration(
+            key, replace_key, decrypt, **kwargs
+        )
+
+        # type annotate.
+        table: Any = self._table(**configuration)
+        if table is None:
+            return [self._translator(text, **configuration) for text in texts]
+        return _translate_many(texts, table, self._apply_table)
+
+    def _process_grouped(
+        self,
+        text: TEXT_TYPE,
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        group_size: int,
+        line_width: int,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE:
+        """
+        Handle the process for both encryption and decryption of grouped texts.
+
+        This method does same job as self._process, encryption groups the
+        result and decryption ignores separators of text.
+
+        :param text         : string to be processed.
+        :param key          : key for encryption/decryption.
+        :param replace_key  : replace the old key in self.configuration
+                              with new one.
+        :param decrypt      : switch for encryption/decryption.
+        :param group_size   : number of letters in a group of result.
+        :param line_width   : largest number of characters in a line of result.
+        :return             : encrypted/decrypted string.
+        :rtype              : str
+        """
+        # type annotate.
+        configuration: Dict[str, KWARGS_TYPE]
+        # fetch configurations for this call.
+        configuration = self._process_configuration(
+            key, replace_key, decrypt, **kwargs
+        )
+
+        # type annotate.
+        table: Any = self._table(**configuration)
+        if table is None:
+            if decrypt:
+                return self._translator(
+                    grouping.remove_separators(text), **configuration
+                )
+            return grouping.group_text(
+                self._translator(text, **configuration), group_size, line_width
+            )
+
+        if decrypt:
+            return grouping.translate_ungrouped(text, table, self._apply_table)
+        return grouping.translate_grouped(
+            text, table, self._apply_table, group_size, line_width
+        )
+
+    def _process_configuration(
+        self,
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        **kwargs: KWARGS_TYPE,
+    ) -> Dict[str, KWARGS_TYPE]:
+        """
+        Create configuration dictionary of an encryption/decryption call.
+
+        :param key          : key for encryption/decryption.
+        :param decrypt      : switch for encryption/decryption.
+        :param replace_key  : replace the old key in self.configuration
+                              with new one.
+        :return             : configuration of this call.
+        :rtype              : dict
+        """
+        # explicitly switch mode to encryption/decryption,
+        # inverse agents swap encryption and decryption.
+        decrypt = decrypt != self.configuration["inverse"]
+        self.configuration["decrypt"] = decrypt
+
+        # configuration is validated by config(), so it's copied once
+        # and reused until configuration changes.
+        if self._configuration.validated is None:
+            self._configuration.validated = {
+                i: j for (i, j) in self.configuration.items() if i != "inverse"
+            }
+
+        # type annotate.
+        configuration: Dict[str, KWARGS_TYPE]
+        # copy validated configuration into new dictionary to be used.
+        configuration = dict(self._configuration.validated)
+        configuration["decrypt"] = decrypt
 
         if key:
             # check key type to be compatible.
@@ -295,11 +946,46 @@ class MersadClassicalBase(object):
             configuration["key"] = key
 
         # do sub-process on configuration.
-        configuration = self._process_subroutines(configuration, **kwargs)
+        return self._process_subroutines(configuration, **kwargs)
 
-        # return a call to cipher translator function with
-        # configuration dictionary as arguments.
-        return self._translator(text, **configuration)
+    @staticmethod
+    def _to_alphabet(letters: KWARGS_TYPE) -> Alphabet:
+        """
+        Convert letters given to config() method into an Alphabet.
+
+        :param letters      : Alphabet, string or bytes of letters.
+        :raise TypeError    : if letters isn't an Alphabet, str, bytes
+                              or bytearray.
+        :return             : interned alphabet of letters.
+        :rtype              : Alphabet
+        """
+        if isinstance(letters, Alphabet):
+            return letters
+        # byte alphabets are stored as string of letters.
+        if isinstance(letters, (bytes, bytearray)):
+            letters = string_manipulation.bytes_to_letters(letters)
+        type_check.type_guard(letters, str)
+        return Alphabet(letters)
+
+    @staticmethod
+    def _check_sequence(sequence: Alphabet, name: str) -> None:
+        """
+        Check that an alphabet doesn't have repeated letters.
+
+        A repeated letter makes its translation ambiguous, so tables
+        built from such an alphabet are wrong.
+
+        :param sequence     : alphabet to be checked.
+        :param name         : name of alphabet in error message.
+        :raise ValueError   : if a letter is repeated in sequence.
+        """
+        duplicates: List[str] = sequence.duplicates
+        if duplicates:
+            raise ValueError(
+                "ERROR: {} has repeated letters: {!r}.".format(
+                    name, "".join(duplicates)
+                )
+            )
 
     def _init_subroutines(self) -> None:
         """
@@ -349,7 +1035,7 @@ class MersadClassicalBase(object):
         return configurations
 
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str:
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE:
         """
         Wrap the actual encryption/decryption function for class.
 
@@ -359,3 +1045,524 @@ class MersadClassicalBase(object):
         :return     : translated text.
         :rtype      : str
         """
+
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> Any:
+        """
+        Build the compiled table of cipher for given configuration.
+
+        This method should be implemented in subclasses which support
+        compile() method.
+
+        :return : compiled table.
+        """
+
+    @staticmethod
+    def _apply_table(text: TEXT_TYPE, table: Any) -> TEXT_TYPE:
+        """
+        Translate a string with a table built by self._table method.
+
+        Monoalphabetic ciphers use the translation backend selected
+        by mersad.util.translation_backend, other ciphers should
+        override this method.
+
+        :param text     : string to be translated.
+        :param table    : compiled table.
+        :return         : translated text.
+        :rtype          : str
+        """
+        return translation_backend.translate(text, table)
+
+    @staticmethod
+    def _apply_table_into(
+        source: BUFFER_TYPE, destination: BUFFER_TYPE, table: Any
+    ) -> int:
+        """
+        Translate binary data into a buffer with a table built by self._table.
+
+        Monoalphabetic ciphers use the default translation engine,
+        other ciphers should override this method.
+
+        :param source       : bytes-like data to be translated.
+        :param destination  : writable buffer, it can be same buffer as source.
+        :param table        : compiled table.
+        :return             : number of bytes written into destination.
+        :rtype              : int
+        """
+        return translation_engine.translate_into(source, destination, table)
+
+
+class CompiledCipher(object):
+    """
+    Immutable compiled cipher created by MersadClassicalBase.compile() method.
+
+    The object holds validated parameters of cipher and its prebuilt
+    encryption and decryption tables, encrypt() and decrypt() take no
+    configuration and don't modify anything, so one instance can be
+    shared between many threads.
+    """
+
+    __slots__ = (
+        "cipher_class",
+        "parameters",
+        "encrypt_table",
+        "decrypt_table",
+        "_apply_table",
+    )
+
+    def __init__(
+        self,
+        cipher_class: Type[MersadClassicalBase],
+        parameters: Dict[str, KWARGS_TYPE],
+        encrypt_table: Any,
+        decrypt_table: Any,
+        apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE],
+    ) -> None:
+        """
+        Create an instance of the class.
+
+        :param cipher_class     : the cipher class which created this object.
+        :param parameters       : validated configuration of cipher.
+        :param encrypt_table    : compiled table for encryption.
+        :param decrypt_table    : compiled table for decryption.
+        :param apply_table      : function for translating text with a table.
+        """
+        parameters_view: Mapping[str, KWARGS_TYPE] = MappingProxyType(
+            dict(parameters)
+        )
+        object.__setattr__(self, "cipher_class", cipher_class)
+        object.__setattr__(self, "parameters", parameters_view)
+        object.__setattr__(self, "encrypt_table", encrypt_table)
+        object.__setattr__(self, "decrypt_table", decrypt_table)
+        object.__setattr__(self, "_apply_table", apply_table)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent modifying the object."""
+        raise AttributeError("CompiledCipher objects are immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        """Prevent modifying the object."""
+        raise AttributeError("CompiledCipher objects are immutable.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the cipher with its compiled tables."""
+        return (
+            CompiledCipher,
+            (
+                self.cipher_class,
+                dict(self.parameters),
+                self.encrypt_table,
+                self.decrypt_table,
+                self._apply_table,
+            ),
+        )
+
+    def __repr__(self) -> str:
+        """Return the objects info as string."""
+        return "CompiledCipher({0}, {1})".format(
+            self.cipher_class.__name__, dict(self.parameters)
+        )
+
+    def inverse(self) -> "CompiledCipher":
+        """
+        Create a compiled cipher which does the opposite of this one.
+
+        :return : compiled cipher with swapped encryption and decryption tables.
+        :rtype  : CompiledCipher
+        """
+        return CompiledCipher(
+            self.cipher_class,
+            dict(self.parameters),
+            self.decrypt_table,
+            self.encrypt_table,
+            self._apply_table,
+        )
+
+    def encrypt(self, plain_text: TEXT_TYPE) -> TEXT_TYPE:
+        """
+        Encrypt a string.
+
+        :param plain_text   : (required) the string that will be encrypted.
+        :return             : encrypted string.
+        :rtype              : str
+        """
+        return self._apply_table(plain_text, self.encrypt_table)
+
+    def decrypt(self, cipher_text: TEXT_TYPE) -> TEXT_TYPE:
+        """
+        Decrypt a string.
+
+        :param cipher_text  : (required) the string that will be decrypted.
+        :return             : decrypted string.
+        :rtype              : str
+        """
+        return self._apply_table(cipher_text, self.decrypt_table)
+
+    def encrypt_many(self, plain_texts: Iterable[TEXT_TYPE]) -> List[TEXT_TYPE]:
+        """
+        Encrypt many strings.
+
+        :param plain_texts  : (required) strings that will be encrypted.
+        :return             : encrypted strings in the same order.
+        :rtype              : list
+        """
+        return _translate_many(plain_texts, self.encrypt_table, self._apply_table)
+
+    def decrypt_many(self, cipher_texts: Iterable[TEXT_TYPE]) -> List[TEXT_TYPE]:
+        """
+        Decrypt many strings.
+
+        :param cipher_texts : (required) strings that will be decrypted.
+        :return             : decrypted strings in the same order.
+        :rtype              : list
+        """
+        return _translate_many(cipher_texts, self.decrypt_table, self._apply_table)
+
+    def encrypt_grouped(
+        self, plain_text: TEXT_TYPE, group_size: int = 5, line_width: int = 0
+    ) -> TEXT_TYPE:
+        """
+        Encrypt a string and write the result in groups of letters.
+
+        :param plain_text   : (required) the string that will be encrypted.
+        :param group_size   : (optional) number of letters in a group,
+                              0 for no groups.
+        :param line_width   : (optional) largest number of characters in
+                              a line, 0 for no line breaks.
+        :return             : grouped encrypted string.
+        :rtype              : str
+        """
+        return grouping.translate_grouped(
+            plain_text, self.encrypt_table, self._apply_table, group_size, line_width
+        )
+
+    def decrypt_grouped(self, cipher_text: TEXT_TYPE) -> TEXT_TYPE:
+        """
+        Decrypt a grouped string, group and line separators are ignored.
+
+        :param cipher_text  : (required) the string that will be decrypted.
+        :return             : decrypted string.
+        :rtype              : str
+        """
+        return grouping.translate_ungrouped(
+            cipher_text, self.decrypt_table, self._apply_table
+        )
+
+    def view(self, text: SOURCE_TYPE, decrypt: bool = False) -> TranslatedView:
+        """
+        Create a lazy view of encrypted or decrypted text.
+
+        :param text     : (required) string or binary data that will be viewed.
+        :param decrypt  : (optional) view decrypted text instead of encrypted text.
+        :return         : lazy view of translated text.
+        :rtype          : TranslatedView
+        """
+        table: Any = self.decrypt_table if decrypt else self.encrypt_table
+        return TranslatedView(text, table, self._apply_table)
+
+
+# field names and default values of compact agents by cipher class.
+_COMPACT_LAYOUTS: Dict[
+    Type[MersadClassicalBase], Tuple[Tuple[str, ...], Tuple[KWARGS_TYPE, ...]]
+] = dict()
+
+
+class CompactAgent(object):
+    """
+    Memory efficient agent created by MersadClassicalBase.compact() method.
+
+    The agent keeps its configuration values in one tuple, names and
+    default values of configuration are shared by all the compact agents
+    of a cipher class. Configurations which aren't in defaults (e.g. route
+    of Route cipher) are kept as a tuple of pairs.
+
+    config(), reset(), show_key(), encrypt() and decrypt() work like the
+    methods of a full agent. Encryption and decryption with the stored
+    configuration use tables of cipher directly, changes of configuration
+    and calls with temporary parameters are done by a full agent created
+    for the call.
+    """
+
+    __slots__ = ("cipher_class", "_values", "_extra")
+
+    def __init__(
+        self, cipher_class: Type[MersadClassicalBase], **kwargs: KWARGS_TYPE
+    ) -> None:
+        """
+        Create an instance of the class.
+
+        Example
+        =======
+
+        >>> from mersad.classical.shift_cipher import ShiftCipher
+        >>> agent = CompactAgent(ShiftCipher, key=3)
+
+        :param cipher_class : the cipher class of agent.
+        :param kwargs       : configuration, same as config() method.
+        """
+        self.cipher_class: Type[MersadClassicalBase] = cipher_class
+        self._values: Tuple[KWARGS_TYPE, ...] = self._layout()[1]
+        self._extra: Tuple[Tuple[str, KWARGS_TYPE], ...] = ()
+        if kwargs:
+            self.config(**kwargs)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the agent by its cipher class and changed configurations."""
+        return (
+            _restore_compact_agent,
+            (
+                self.cipher_class,
+                _changed_configuration(self.cipher_class, self.configuration),
+            ),
+        )
+
+    def __repr__(self) -> str:
+        """Return the objects info as string."""
+        return "CompactAgent({0}, {1})".format(
+            self.cipher_class.__name__, self.configuration
+        )
+
+    @property
+    def configuration(self) -> Dict[str, KWARGS_TYPE]:
+        """
+        Return a copy of configuration of the agent.
+
+        Changing the copy doesn't change the agent, use config() method.
+
+        :return : configuration dictionary.
+        :rtype  : dict
+        """
+        configuration: Dict[str, KWARGS_TYPE] = dict(
+            zip(self._layout()[0], self._values)
+        )
+        configuration.update(self._extra)
+        return configuration
+
+    def config(self, **kwargs: KWARGS_TYPE) -> None:
+        """
+        Assign values to configuration, see MersadClassicalBase.config().
+
+        :raise ValueError: if type of a dictionary value is wrong.
+        """
+        agent: MersadClassicalBase = self.expand()
+        agent.config(**kwargs)
+        self._store(agent.configuration)
+
+    def reset(self) -> None:
+        """Reset all configurations to defaults."""
+        self._values = self._layout()[1]
+        self._extra = ()
+
+    def show_key(self) -> KWARGS_TYPE:
+        """
+        Return the current key in configuration.
+
+        :return : current key in use.
+        :rtype  : int
+        """
+        return self.configuration["key"]
+
+    def expand(self) -> MersadClassicalBase:
+        """
+        Create a full agent with the configuration of this agent.
+
+        :return : new agent.
+        :rtype  : same class as cipher_class
+        """
+        agent: MersadClassicalBase = self.cipher_class()
+        agent.configuration = self.configuration
+        return agent
+
+    def encrypt(
+        self,
+        plain_text: TEXT_TYPE,
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE:
+        """
+        Encrypt a string, see MersadClassicalBase.encrypt().
+
+        :param plain_text   :   (required) the string that will be encrypted.
+        :param key          :   (optional) a new key for encryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at configuration.
+        :return             :   encrypted string.
+        :rtype              :   str
+        """
+        return self._process(plain_text, key, replace_key, False, **kwargs)
+
+    def decrypt(
+        self,
+        cipher_text: TEXT_TYPE,
+        key: Optional[int] = None,
+        replace_key: bool = False,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE:
+        """
+        Decrypt a string, see MersadClassicalBase.decrypt().
+
+        :param cipher_text  :   (required) the string that will be decrypted.
+        :param key          :   (optional) a new key for decryption.
+        :param replace_key  :   (optional) if set to True, the provided new key
+                                replaces old key at configuration.
+        :return             :   decrypted string.
+        :rtype              :   str
+        """
+        return self._process(cipher_text, key, replace_key, True, **kwargs)
+
+    def _process(
+        self,
+        text: TEXT_TYPE,
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE:
+        """
+        Handle the process for both encryption and decryption.
+
+        :param text         : string to be processed.
+        :param key          : key for encryption/decryption.
+        :param decrypt      : switch for encryption/decryption.
+        :param replace_key  : replace the old key in configuration
+                              with new one.
+        :return             : encrypted/decrypted string.
+        :rtype              : str
+        """
+        if key or kwargs:
+            # temporary parameters are validated and applied by a full agent.
+            agent: MersadClassicalBase = self.expand()
+            translated: TEXT_TYPE = agent._process(
+                text, key, replace_key, decrypt, **kwargs
+            )
+            self._store(agent.configuration)
+            return translated
+
+        # type annotate.
+        configuration: Dict[str, KWARGS_TYPE] = self.configuration
+        # inverse agents swap encryption and decryption.
+        configuration["decrypt"] = decrypt != configuration.pop("inverse")
+        table: Any = self.cipher_class._table(**configuration)
+        if table is None:
+            return self.cipher_class._translator(text, **configuration)
+        return self.cipher_class._apply_table(text, table)
+
+    def _layout(self) -> Tuple[Tuple[str, ...], Tuple[KWARGS_TYPE, ...]]:
+        """
+        Return configuration names and default values of cipher class.
+
+        :return : names and default values of configuration.
+        :rtype  : tuple
+        """
+        return _compact_layout(self.cipher_class)
+
+    def _store(self, configuration: Dict[str, KWARGS_TYPE]) -> None:
+        """
+        Store a configuration dictionary in the agent.
+
+        :param configuration    : configuration of a full agent.
+        """
+        names: Tuple[str, ...] = self._layout()[0]
+        self._values = tuple(configuration[i] for i in names)
+        self._extra = tuple(
+            (i, j) for (i, j) in configuration.items() if i not in names
+        )
+
+
+def _translate_many(
+    texts: Iterable[TEXT_TYPE],
+    table: Any,
+    apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE],
+) -> List[TEXT_TYPE]:
+    """
+    Translate many strings with a compiled table of a cipher.
+
+    :param texts        : strings to be translated.
+    :param table        : compiled table.
+    :param apply_table  : function for translating text with table.
+    :return             : translated strings in the same order.
+    :rtype              : list
+    """
+    if isinstance(table, TranslationTable):
+        return translation_engine.translate_many(texts, table, apply_table)
+    return [apply_table(text, table) for text in texts]
+
+
+def _compact_layout(
+    cipher_class: Type[MersadClassicalBase],
+) -> Tuple[Tuple[str, ...], Tuple[KWARGS_TYPE, ...]]:
+    """
+    Return configuration names and default values of a cipher class.
+
+    Layout of a cipher class is created once from its defaults.
+
+    :param cipher_class : the cipher class.
+    :return             : names and default values of configuration.
+    :rtype              : tuple
+    """
+    layout: Optional[
+        Tuple[Tuple[str, ...], Tuple[KWARGS_TYPE, ...]]
+    ] = _COMPACT_LAYOUTS.get(cipher_class)
+    if layout is None:
+        defaults: Dict[str, KWARGS_TYPE] = cipher_class().configuration
+        layout = (tuple(defaults), tuple(defaults.values()))
+        _COMPACT_LAYOUTS[cipher_class] = layout
+    return layout
+
+
+def _changed_configuration(
+    cipher_class: Type[MersadClassicalBase], configuration: Dict[str, KWARGS_TYPE]
+) -> Tuple[Tuple[str, KWARGS_TYPE], ...]:
+    """
+    Return configurations of an agent which differ from defaults of its cipher.
+
+    :param cipher_class     : the cipher class of agent.
+    :param configuration    : configuration of agent.
+    :return                 : pairs of configuration name and value.
+    :rtype                  : tuple
+    """
+    defaults: Dict[str, KWARGS_TYPE] = dict(zip(*_compact_layout(cipher_class)))
+    return tuple(
+        (i, j)
+        for (i, j) in configuration.items()
+        if i not in defaults or defaults[i] != j
+    )
+
+
+def _restore_agent(
+    cipher_class: Type[MersadClassicalBase],
+    changes: Tuple[Tuple[str, KWARGS_TYPE], ...],
+) -> MersadClassicalBase:
+    """
+    Create an agent from a pickled agent.
+
+    Configurations were validated before pickling and aren't validated again.
+
+    :param cipher_class : the cipher class of agent.
+    :param changes      : configurations which differ from defaults.
+    :return             : new agent.
+    :rtype              : same class as cipher_class
+    """
+    agent: MersadClassicalBase = cipher_class()
+    agent.configuration.update(changes)
+    return agent
+
+
+def _restore_compact_agent(
+    cipher_class: Type[MersadClassicalBase],
+    changes: Tuple[Tuple[str, KWARGS_TYPE], ...],
+) -> CompactAgent:
+    """
+    Create a compact agent from a pickled compact agent.
+
+    :param cipher_class : the cipher class of agent.
+    :param changes      : configurations which differ from defaults.
+    :return             : new compact agent.
+    :rtype              : CompactAgent
+    """
+    agent: CompactAgent = CompactAgent(cipher_class)
+    configuration: Dict[str, KWARGS_TYPE] = agent.configuration
+    configuration.update(changes)
+    agent._store(configuration)
+    return agent
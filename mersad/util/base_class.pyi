@@ -4,47 +4,286 @@
 
 # Python Standard Library
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Tuple
+from typing import Type
 from typing import Union
 
-KWARGS_TYPE = Union[int, str, bool, List[int]]
+# Mersad Library
+from mersad.util.alphabet import Alphabet
+from mersad.util.text_view import SOURCE_TYPE
+from mersad.util.text_view import TranslatedView
+from mersad.util.translation_engine import BUFFER_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
+
+KWARGS_TYPE = Union[int, str, bytes, bool, List[int]]
+
+class _Configuration(Dict[str, KWARGS_TYPE]):
+    validated: Optional[Dict[str, KWARGS_TYPE]] = ...
+    def __init__(self, *args: Any, **kwargs: KWARGS_TYPE) -> None: ...
+    def __setitem__(self, key: str, value: KWARGS_TYPE) -> None: ...
+    def __delitem__(self, key: str) -> None: ...
+    def __ior__(self, other: Any) -> _Configuration: ...
+    def clear(self) -> None: ...
+    def pop(self, key: str, *default: Any) -> Any: ...
+    def popitem(self) -> Tuple[str, KWARGS_TYPE]: ...
+    def setdefault(self, key: str, default: Any = ...) -> Any: ...
+    def update(self, *args: Any, **kwargs: KWARGS_TYPE) -> None: ...
 
 class MersadClassicalBase:
     _defaults: Any = ...
-    configuration: Any = ...
+    _configuration: _Configuration = ...
     def __init__(self, **kwargs: KWARGS_TYPE) -> None: ...
+    @property
+    def configuration(self) -> Dict[str, KWARGS_TYPE]: ...
+    @configuration.setter
+    def configuration(self, configuration: Dict[str, KWARGS_TYPE]) -> None: ...
     def __str__(self) -> str: ...
+    def __reduce__(self) -> Tuple[Any, ...]: ...
     def encrypt(
         self,
-        plain_text: str,
+        plain_text: TEXT_TYPE,
         key: Optional[int] = ...,
         replace_key: bool = ...,
         **kwargs: KWARGS_TYPE,
-    ) -> str: ...
+    ) -> TEXT_TYPE: ...
     def decrypt(
         self,
-        cipher_text: str,
+        cipher_text: TEXT_TYPE,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE: ...
+    def encrypt_into(
+        self,
+        source: BUFFER_TYPE,
+        destination: BUFFER_TYPE,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> int: ...
+    def decrypt_into(
+        self,
+        source: BUFFER_TYPE,
+        destination: BUFFER_TYPE,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> int: ...
+    def encrypt_inplace(
+        self,
+        buffer: bytearray,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> None: ...
+    def decrypt_inplace(
+        self,
+        buffer: bytearray,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> None: ...
+    def encrypt_many(
+        self,
+        plain_texts: Iterable[TEXT_TYPE],
         key: Optional[int] = ...,
         replace_key: bool = ...,
         **kwargs: KWARGS_TYPE,
-    ) -> str: ...
+    ) -> List[TEXT_TYPE]: ...
+    def decrypt_many(
+        self,
+        cipher_texts: Iterable[TEXT_TYPE],
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> List[TEXT_TYPE]: ...
+    def encrypt_grouped(
+        self,
+        plain_text: TEXT_TYPE,
+        group_size: int = ...,
+        line_width: int = ...,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE: ...
+    def decrypt_grouped(
+        self,
+        cipher_text: TEXT_TYPE,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE: ...
+    def view(
+        self,
+        text: SOURCE_TYPE,
+        decrypt: bool = ...,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> TranslatedView: ...
     def config(self, **kwargs: KWARGS_TYPE) -> None: ...
     def reset(self) -> None: ...
     def show_key(self) -> int: ...
+    def inverse(self) -> MersadClassicalBase: ...
+    def compact(self) -> CompactAgent: ...
+    def compile(self) -> CompiledCipher: ...
     def _process(
         self,
-        text: str,
+        text: TEXT_TYPE,
         key: Optional[int],
         replace_key: bool,
         decrypt: bool,
         **kwargs: KWARGS_TYPE,
-    ) -> str: ...
+    ) -> TEXT_TYPE: ...
+    def _process_into(
+        self,
+        source: BUFFER_TYPE,
+        destination: BUFFER_TYPE,
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        **kwargs: KWARGS_TYPE,
+    ) -> int: ...
+    def _process_many(
+        self,
+        texts: Iterable[TEXT_TYPE],
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        **kwargs: KWARGS_TYPE,
+    ) -> List[TEXT_TYPE]: ...
+    def _process_grouped(
+        self,
+        text: TEXT_TYPE,
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        group_size: int,
+        line_width: int,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE: ...
+    def _process_configuration(
+        self,
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        **kwargs: KWARGS_TYPE,
+    ) -> Dict[str, KWARGS_TYPE]: ...
+    @staticmethod
+    def _to_alphabet(letters: KWARGS_TYPE) -> Alphabet: ...
+    @staticmethod
+    def _check_sequence(sequence: Alphabet, name: str) -> None: ...
     def _init_subroutines(self) -> None: ...
     def _config_subroutines(self, **kwargs: KWARGS_TYPE) -> None: ...
     def _process_subroutines(
         self, configurations: Dict[str, KWARGS_TYPE], **kwargs: KWARGS_TYPE
     ) -> Dict[str, KWARGS_TYPE]: ...
     @staticmethod
-    def _translator(text: str, **kwargs: KWARGS_TYPE) -> str: ...
+    def _translator(text: TEXT_TYPE, **kwargs: KWARGS_TYPE) -> TEXT_TYPE: ...
+    @staticmethod
+    def _table(**kwargs: KWARGS_TYPE) -> Any: ...
+    @staticmethod
+    def _apply_table(text: TEXT_TYPE, table: Any) -> TEXT_TYPE: ...
+    @staticmethod
+    def _apply_table_into(
+        source: BUFFER_TYPE, destination: BUFFER_TYPE, table: Any
+    ) -> int: ...
+
+class CompiledCipher:
+    cipher_class: Type[MersadClassicalBase] = ...
+    parameters: Mapping[str, KWARGS_TYPE] = ...
+    encrypt_table: Any = ...
+    decrypt_table: Any = ...
+    _apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE] = ...
+    def __init__(
+        self,
+        cipher_class: Type[MersadClassicalBase],
+        parameters: Dict[str, KWARGS_TYPE],
+        encrypt_table: Any,
+        decrypt_table: Any,
+        apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE],
+    ) -> None: ...
+    def __setattr__(self, name: str, value: Any) -> None: ...
+    def __delattr__(self, name: str) -> None: ...
+    def __reduce__(self) -> Tuple[Any, ...]: ...
+    def __repr__(self) -> str: ...
+    def inverse(self) -> CompiledCipher: ...
+    def encrypt(self, plain_text: TEXT_TYPE) -> TEXT_TYPE: ...
+    def decrypt(self, cipher_text: TEXT_TYPE) -> TEXT_TYPE: ...
+    def encrypt_many(self, plain_texts: Iterable[TEXT_TYPE]) -> List[TEXT_TYPE]: ...
+    def decrypt_many(self, cipher_texts: Iterable[TEXT_TYPE]) -> List[TEXT_TYPE]: ...
+    def encrypt_grouped(
+        self, plain_text: TEXT_TYPE, group_size: int = ..., line_width: int = ...
+    ) -> TEXT_TYPE: ...
+    def decrypt_grouped(self, cipher_text: TEXT_TYPE) -> TEXT_TYPE: ...
+    def view(self, text: SOURCE_TYPE, decrypt: bool = ...) -> TranslatedView: ...
+
+_COMPACT_LAYOUTS: Dict[
+    Type[MersadClassicalBase], Tuple[Tuple[str, ...], Tuple[KWARGS_TYPE, ...]]
+]
+
+class CompactAgent:
+    cipher_class: Type[MersadClassicalBase] = ...
+    _values: Tuple[KWARGS_TYPE, ...] = ...
+    _extra: Tuple[Tuple[str, KWARGS_TYPE], ...] = ...
+    def __init__(
+        self, cipher_class: Type[MersadClassicalBase], **kwargs: KWARGS_TYPE
+    ) -> None: ...
+    def __reduce__(self) -> Tuple[Any, ...]: ...
+    def __repr__(self) -> str: ...
+    @property
+    def configuration(self) -> Dict[str, KWARGS_TYPE]: ...
+    def config(self, **kwargs: KWARGS_TYPE) -> None: ...
+    def reset(self) -> None: ...
+    def show_key(self) -> KWARGS_TYPE: ...
+    def expand(self) -> MersadClassicalBase: ...
+    def encrypt(
+        self,
+        plain_text: TEXT_TYPE,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE: ...
+    def decrypt(
+        self,
+        cipher_text: TEXT_TYPE,
+        key: Optional[int] = ...,
+        replace_key: bool = ...,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE: ...
+    def _process(
+        self,
+        text: TEXT_TYPE,
+        key: Optional[int],
+        replace_key: bool,
+        decrypt: bool,
+        **kwargs: KWARGS_TYPE,
+    ) -> TEXT_TYPE: ...
+    def _layout(self) -> Tuple[Tuple[str, ...], Tuple[KWARGS_TYPE, ...]]: ...
+    def _store(self, configuration: Dict[str, KWARGS_TYPE]) -> None: ...
+
+def _translate_many(
+    texts: Iterable[TEXT_TYPE],
+    table: Any,
+    apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE],
+) -> List[TEXT_TYPE]: ...
+def _compact_layout(
+    cipher_class: Type[MersadClassicalBase],
+) -> Tuple[Tuple[str, ...], Tuple[KWARGS_TYPE, ...]]: ...
+def _changed_configuration(
+    cipher_class: Type[MersadClassicalBase], configuration: Dict[str, KWARGS_TYPE]
+) -> Tuple[Tuple[str, KWARGS_TYPE], ...]: ...
+def _restore_agent(
+    cipher_class: Type[MersadClassicalBase],
+    changes: Tuple[Tuple[str, KWARGS_TYPE], ...],
+) -> MersadClassicalBase: ...
+def _restore_compact_agent(
+    cipher_class: Type[MersadClassicalBase],
+    changes: Tuple[Tuple[str, KWARGS_TYPE], ...],
+) -> CompactAgent: ...
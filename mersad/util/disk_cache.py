@@ -0,0 +1,570 @@
+# mersad/util/disk_cache.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.disk_cache module.
+==============================
+
+The module contains an optional on-disk cache of compiled tables.
+
+Programs which start again and again with the same configuration
+(e.g. terminal programs with a shuffled large alphabet) rebuild the
+same tables on every run. When the disk cache is enabled, tables built
+by the process-wide table cache are also written into a directory,
+by default $XDG_CACHE_HOME/mersad, and later runs load them from there.
+
+Every table is a file named by a hash of its cache key. A file has a
+fixed header and arrays of 32-bit integers, it's memory-mapped and the
+table is built straight from the arrays, which is much cheaper than
+rebuilding it (about 0.05 ms against 15-40 ms for a large shuffled
+alphabet). Files are written into a temporary file and renamed, so
+concurrent writers never leave a partial file, and the least recently
+used files are removed when the directory grows larger than its size
+limit, together with temporary files left behind by killed writers.
+
+Example
+=======
+
+>>> from mersad.util import disk_cache
+>>> cache = disk_cache.enable(max_bytes=64 * 1024 * 1024)
+>>> # ... tables are loaded from and written to cache.directory.
+>>> disk_cache.disable()
+
+"""
+
+# Python Standard Library
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Mersad Library
+from mersad._version import __version__
+from mersad.util import translation_engine
+from mersad.util.table_cache import TABLE_CACHE
+from mersad.util.translation_engine import CompactTranslationTable
+from mersad.util.translation_engine import StrippingTranslationTable
+from mersad.util.translation_engine import TranslationTable
+
+# file format: magic, version, kind of table and number of items.
+MAGIC: bytes = b"MRSD"
+VERSION: int = 1
+HEADER: struct.Struct = struct.Struct("<4sHHI")
+SUFFIX: str = ".table"
+TEMPORARY_SUFFIX: str = ".tmp"
+# temporary files older than this (in seconds) are left by killed writers.
+STALE_SECONDS: float = 3600.0
+DEFAULT_MAX_BYTES: int = 256 * 1024 * 1024
+# stores shrink the directory to this part of its limit when it's full.
+CLEANUP_RATIO: float = 0.75
+# stored translation of deleted letters, above every code point.
+DELETED: int = 0xFFFFFFFF
+
+# define type aliases.
+ENCODER_TYPE = Callable[[Any], Tuple[int, bytes]]
+DECODER_TYPE = Callable[[memoryview, int], Any]
+
+# codecs of cached values: type -> (kind, encoder) and kind -> decoder.
+ENCODERS: Dict[type, Tuple[int, ENCODER_TYPE]] = dict()
+DECODERS: Dict[int, DECODER_TYPE] = dict()
+
+
+def register_codec(
+    kind: int, value_type: type, encoder: ENCODER_TYPE, decoder: DECODER_TYPE
+) -> None:
+    """
+    Register functions for storing a type of table in files.
+
+    Encoder takes a table and returns number of items and payload
+    of file, decoder takes the payload (a memoryview of the mapped
+    file) and number of items and returns the table. Decoders raise
+    ValueError for damaged payloads and must copy what they keep from
+    the memoryview.
+
+    :param kind         : unique number of table type in files.
+    :param value_type   : type of table, subclasses are stored too.
+    :param encoder      : function which converts table to payload.
+    :param decoder      : function which converts payload to table.
+    """
+    ENCODERS[value_type] = (kind, encoder)
+    DECODERS[kind] = decoder
+
+
+def default_directory() -> str:
+    """
+    Return default directory of disk cache.
+
+    :return : $XDG_CACHE_HOME/mersad, or ~/.cache/mersad if it isn't set.
+    :rtype  : str
+    """
+    cache_home: str = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "mersad")
+
+
+def key_digest(key: Hashable) -> Optional[str]:
+    """
+    Return a stable hash of a table cache key.
+
+    Classes and functions in the key are hashed by their qualified name,
+    keys which contain any other object can't be stored on disk. The
+    package version is hashed too, so tables built by another release
+    are never loaded.
+
+    :param key  : key of table cache.
+    :return     : hex digest of key, or None if key can't be hashed.
+    :rtype      : str
+    """
+    try:
+        text: str = repr((sys.byteorder, __version__, VERSION, _stable_key(key)))
+    except TypeError:
+        return None
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class DiskCache(object):
+    """
+    Directory of compiled tables shared by processes.
+
+    Only tables which have a registered codec are stored, load()
+    returns None for everything else, so the cache can be put in
+    front of any builder.
+
+    Size of directory is estimated from the files this object writes,
+    it's only scanned (see cleanup) when the estimate exceeds max_bytes,
+    then it's shrunk to CLEANUP_RATIO of max_bytes.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """
+        Create a disk cache, directory is created on first write.
+
+        :param directory    : directory of cached files, default is
+                              $XDG_CACHE_HOME/mersad.
+        :param max_bytes    : maximum size of directory, None for no limit.
+        """
+        self.directory: str = directory or default_directory()
+        self.max_bytes: Optional[int] = max_bytes
+        # estimated size of directory, None until it's scanned.
+        self._bytes: Optional[int] = None
+
+    def __repr__(self) -> str:
+        """Return the objects info as string."""
+        return "DiskCache({0!r}, {1})".format(self.directory, self.max_bytes)
+
+    def load(self, key: Hashable) -> Any:
+        """
+        Load the table of a key.
+
+        Files which are missing, damaged or written by another version
+        are ignored.
+
+        :param key  : key of table cache.
+        :return     : cached table or None.
+        """
+        digest: Optional[str] = key_digest(key)
+        if digest is None:
+            return None
+        path: str = os.path.join(self.directory, digest + SUFFIX)
+        try:
+            with open(path, "rb") as file, mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                value: Any = _decode(mapped)
+            # refresh the file for least recently used cleanup.
+            if value is not None:
+                os.utime(path)
+        except OSError:
+            return None
+        return value
+
+    def store(self, key: Hashable, value: Any) -> bool:
+        """
+        Write the table of a key into the directory.
+
+        :param key      : key of table cache.
+        :param value    : table to be stored.
+        :return         : True if table is stored.
+        :rtype          : bool
+        """
+        digest: Optional[str] = key_digest(key)
+        codec: Optional[Tuple[int, ENCODER_TYPE]] = _find_encoder(value)
+        if digest is None or codec is None:
+            return False
+        count, payload = codec[1](value)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # write a temporary file and rename it, readers only see whole files.
+            descriptor, temporary = tempfile.mkstemp(
+                dir=self.directory, suffix=TEMPORARY_SUFFIX
+            )
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(HEADER.pack(MAGIC, VERSION, codec[0], count))
+                    file.write(payload)
+                os.replace(temporary, os.path.join(self.directory, digest + SUFFIX))
+            except BaseException:
+                os.remove(temporary)
+                raise
+        except OSError:
+            return False
+        if self.max_bytes is not None:
+            if self._bytes is not None:
+                self._bytes += HEADER.size + len(payload)
+            if self._bytes is None or self._bytes > self.max_bytes:
+                self.cleanup(int(self.max_bytes * CLEANUP_RATIO))
+        return True
+
+    def cleanup(self, max_bytes: int) -> int:
+        """
+        Remove least recently used files until directory fits in max_bytes.
+
+        Temporary files older than STALE_SECONDS are removed too.
+
+        :param max_bytes    : maximum size of directory.
+        :return             : number of removed files.
+        :rtype              : int
+        """
+        files: List[Tuple[float, int, str]]
+        stale: List[str]
+        try:
+            files, stale = self._scan()
+        except OSError:
+            self._bytes = None
+            return 0
+        for path in stale:
+            _remove_file(path)
+        removed: int = len(stale)
+        total: int = sum(size for (_, size, _) in files)
+        for (_, size, path) in sorted(files):
+            if total <= max_bytes:
+                break
+            _remove_file(path)
+            total -= size
+            removed += 1
+        self._bytes = total
+        return removed
+
+    def _scan(self) -> Tuple[List[Tuple[float, int, str]], List[str]]:
+        """
+        Scan the directory for cached files and stale temporary files.
+
+        :raise OSError  : if directory can't be scanned.
+        :return         : (modification time, size, path) of cached files
+                          and paths of stale temporary files.
+        :rtype          : tuple
+        """
+        files: List[Tuple[float, int, str]] = list()
+        stale: List[str] = list()
+        deadline: float = time.time() - STALE_SECONDS
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(SUFFIX):
+                    status: os.stat_result = entry.stat()
+                    files.append((status.st_mtime, status.st_size, entry.path))
+                elif entry.name.endswith(TEMPORARY_SUFFIX):
+                    if entry.stat().st_mtime < deadline:
+                        stale.append(entry.path)
+        return files, stale
+
+    def clear(self) -> int:
+        """
+        Remove all cached files.
+
+        :return : number of removed files.
+        :rtype  : int
+        """
+        return self.cleanup(0)
+
+
+def enable(
+    directory: Optional[str] = None, max_bytes: Optional[int] = DEFAULT_MAX_BYTES
+) -> DiskCache:
+    """
+    Put a disk cache behind the process-wide table cache.
+
+    :param directory    : directory of cached files, default is
+                          $XDG_CACHE_HOME/mersad.
+    :param max_bytes    : maximum size of directory, None for no limit.
+    :return             : the disk cache.
+    :rtype              : DiskCache
+    """
+    TABLE_CACHE.disk = DiskCache(directory, max_bytes)
+    return TABLE_CACHE.disk
+
+
+def disable() -> None:
+    """Stop using disk cache in the process-wide table cache."""
+    TABLE_CACHE.disk = None
+
+
+def _remove_file(path: str) -> None:
+    """
+    Remove a file which may be removed by another process meanwhile.
+
+    :param path : path of file.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        # another process removed it.
+        pass
+
+
+def _stable_key(key: Any) -> Any:
+    """
+    Convert a cache key into a value with a stable repr.
+
+    :param key          : key or a part of key.
+    :raise TypeError    : if key contains an unsupported object.
+    :return             : key with classes, functions and strings converted.
+    """
+    if key is None or isinstance(key, (bool, int, float, bytes)):
+        return key
+    if isinstance(key, str):
+        # alphabets are stored as plain strings.
+        return str.__str__(key)
+    if isinstance(key, (tuple, list)):
+        return tuple(_stable_key(i) for i in key)
+    if isinstance(key, type) or callable(key):
+        return "{0}.{1}".format(key.__module__, key.__qualname__)
+    raise TypeError("unsupported key {0!r}".format(key))
+
+
+def _find_encoder(value: Any) -> Optional[Tuple[int, ENCODER_TYPE]]:
+    """
+    Find codec of a table by its type.
+
+    :param value    : table to be stored.
+    :return         : kind and encoder, or None if type isn't registered.
+    """
+    for cls in type(value).__mro__:
+        if cls in ENCODERS:
+            return ENCODERS[cls]
+    return None
+
+
+def _decode(buffer: Any) -> Any:
+    """
+    Read a table from the content of a file.
+
+    Views of a mapped file must be released before the file is closed,
+    so errors of decoders are handled here, before their frames (which
+    hold views of file) can leave this function in a traceback.
+
+    :param buffer       : content of file.
+    :return             : table, or None if file isn't a valid table.
+    """
+    if len(buffer) < HEADER.size:
+        return None
+    magic, version, kind, count = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != VERSION or kind not in DECODERS:
+        return None
+    with memoryview(buffer) as view:
+        try:
+            return DECODERS[kind](view[HEADER.size:], count)
+        except (TypeError, ValueError):
+            # damaged file.
+            pass
+    return None
+
+
+def _encode_translation_table(table: TranslationTable) -> Tuple[int, bytes]:
+    """
+    Encode a translation table as an array of code points and their translations.
+
+    Deleted letters are stored with DELETED as their translation.
+
+    :param table    : translation table.
+    :return         : number of pairs and payload.
+    :rtype          : tuple
+    """
+    pairs: List[Tuple[int, Optional[int]]] = list(table.items())
+    letters: array = array("I", (i for (i, _) in pairs))
+    letters.extend(DELETED if j is None else j for (_, j) in pairs)
+    return len(pairs), letters.tobytes()
+
+
+def _decode_translation_table(payload: memoryview, count: int) -> TranslationTable:
+    """
+    Decode a translation table, large tables are stored compact.
+
+    :param payload      : content of file after header.
+    :param count        : number of pairs.
+    :raise ValueError   : if payload size doesn't match count.
+    :return             : translation table.
+    :rtype              : TranslationTable
+    """
+    table: TranslationTable = TranslationTable(_decode_pairs(payload, count))
+    return translation_engine.compact_table(table)
+
+
+def _decode_stripping_table(
+    payload: memoryview, count: int
+) -> StrippingTranslationTable:
+    """
+    Decode a stripping table, it is stored the same as a translation table.
+
+    :param payload      : content of file after header.
+    :param count        : number of pairs.
+    :raise ValueError   : if payload size doesn't match count.
+    :return             : stripping translation table.
+    :rtype              : StrippingTranslationTable
+    """
+    return StrippingTranslationTable(_decode_pairs(payload, count))
+
+
+def _decode_pairs(
+    payload: memoryview, count: int
+) -> List[Tuple[int, Optional[int]]]:
+    """
+    Decode code points and their translations of a translation table.
+
+    :param payload      : content of file after header.
+    :param count        : number of pairs.
+    :raise ValueError   : if payload size doesn't match count.
+    :return             : pairs of code point and translation, None if deleted.
+    :rtype              : list
+    """
+    if len(payload) != count * 8:
+        raise ValueError("ERROR: table size doesn't match its header.")
+    with payload.cast("I") as letters:
+        return [
+            (i, None if j == DELETED else j)
+            for (i, j) in zip(letters[:count], letters[count:])
+        ]
+
+
+def _encode_compact_table(table: CompactTranslationTable) -> Tuple[int, bytes]:
+    """
+    Encode a compact table with its runs, so runs aren't split again on load.
+
+    Payload is the pairs which aren't part of a run (same as a translation
+    table), first code point, length and item size of every run and then
+    raw arrays of runs, each one padded to a multiple of four bytes.
+
+    :param table    : compact translation table.
+    :return         : number of pairs and payload.
+    :rtype          : tuple
+    """
+    count, payload = _encode_translation_table(TranslationTable(dict.items(table)))
+    chunks: List[bytes] = [payload]
+    chunks.append(
+        array(
+            "I",
+            [len(table._runs)]
+            + [
+                i
+                for (start, run) in zip(table._starts, table._runs)
+                for i in (start, len(run), run.itemsize)
+            ],
+        ).tobytes()
+    )
+    for run in table._runs:
+        data: bytes = run.tobytes()
+        chunks.append(data + bytes(-len(data) % 4))
+    return count, b"".join(chunks)
+
+
+def _decode_compact_table(
+    payload: memoryview, count: int
+) -> CompactTranslationTable:
+    """
+    Decode a compact table, runs are copied from the file as they are.
+
+    :param payload      : content of file after header.
+    :param count        : number of pairs which aren't part of a run.
+    :raise ValueError   : if payload size doesn't match its header.
+    :return             : compact translation table.
+    :rtype              : CompactTranslationTable
+    """
+    position: int = count * 8
+    pairs: TranslationTable = _decode_translation_table(payload[:position], count)
+    with payload[position:].cast("I") as words:
+        end: int = 1 + words[0] * 3 if len(words) else 1
+        if len(words) < end:
+            raise ValueError("ERROR: table size doesn't match its header.")
+        layout: List[int] = words[1:end].tolist()
+    position += 4 + len(layout) * 4
+    starts: List[int] = list()
+    runs: List[array] = list()
+    for index in range(0, len(layout), 3):
+        start, length, itemsize = layout[index:index + 3]
+        if itemsize not in (2, 4):
+            raise ValueError("ERROR: unknown item size of table.")
+        run: array = array("H" if itemsize == 2 else "I")
+        run.frombytes(payload[position:position + length * itemsize])
+        if len(run) != length:
+            raise ValueError("ERROR: table size doesn't match its header.")
+        starts.append(start)
+        runs.append(run)
+        position += length * itemsize + (-length * itemsize % 4)
+    return CompactTranslationTable.from_runs(dict(pairs), starts, runs)
+
+
+register_codec(
+    1, TranslationTable, _encode_translation_table, _decode_translation_table
+)
+register_codec(
+    2, CompactTranslationTable, _encode_compact_table, _decode_compact_table
+)
+register_codec(
+    4, StrippingTranslationTable, _encode_translation_table, _decode_stripping_table
+)
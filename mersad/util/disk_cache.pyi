@@ -0,0 +1,75 @@
+# Stubs for mersad.util.disk_cache (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+import struct
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Mersad Library
+from mersad.util.translation_engine import CompactTranslationTable
+from mersad.util.translation_engine import StrippingTranslationTable
+from mersad.util.translation_engine import TranslationTable
+
+MAGIC: bytes
+VERSION: int
+HEADER: struct.Struct
+SUFFIX: str
+TEMPORARY_SUFFIX: str
+STALE_SECONDS: float
+DEFAULT_MAX_BYTES: int
+CLEANUP_RATIO: float
+DELETED: int
+ENCODER_TYPE = Callable[[Any], Tuple[int, bytes]]
+DECODER_TYPE = Callable[[memoryview, int], Any]
+ENCODERS: Dict[type, Tuple[int, ENCODER_TYPE]]
+DECODERS: Dict[int, DECODER_TYPE]
+
+def register_codec(
+    kind: int, value_type: type, encoder: ENCODER_TYPE, decoder: DECODER_TYPE
+) -> None: ...
+def default_directory() -> str: ...
+def key_digest(key: Hashable) -> Optional[str]: ...
+
+class DiskCache:
+    directory: str = ...
+    max_bytes: Optional[int] = ...
+    _bytes: Optional[int] = ...
+    def __init__(
+        self, directory: Optional[str] = ..., max_bytes: Optional[int] = ...
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    def load(self, key: Hashable) -> Any: ...
+    def store(self, key: Hashable, value: Any) -> bool: ...
+    def cleanup(self, max_bytes: int) -> int: ...
+    def _scan(self) -> Tuple[List[Tuple[float, int, str]], List[str]]: ...
+    def clear(self) -> int: ...
+
+def enable(
+    directory: Optional[str] = ..., max_bytes: Optional[int] = ...
+) -> DiskCache: ...
+def disable() -> None: ...
+def _remove_file(path: str) -> None: ...
+def _stable_key(key: Any) -> Any: ...
+def _find_encoder(value: Any) -> Optional[Tuple[int, ENCODER_TYPE]]: ...
+def _decode(buffer: Any) -> Any: ...
+def _encode_translation_table(table: TranslationTable) -> Tuple[int, bytes]: ...
+def _decode_translation_table(
+    payload: memoryview, count: int
+) -> TranslationTable: ...
+def _decode_stripping_table(
+    payload: memoryview, count: int
+) -> StrippingTranslationTable: ...
+def _decode_pairs(
+    payload: memoryview, count: int
+) -> List[Tuple[int, Optional[int]]]: ...
+def _encode_compact_table(table: CompactTranslationTable) -> Tuple[int, bytes]: ...
+def _decode_compact_table(
+    payload: memoryview, count: int
+) -> CompactTranslationTable: ...
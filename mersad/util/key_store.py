@@ -0,0 +1,323 @@
+# mersad/util/key_store.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.key_store module.
+=============================
+
+The module contains KeyStore class which keeps cipher
+configurations of many tenants.
+
+Every tenant is registered once with its cipher and configuration,
+which is validated and kept as a compact agent. Ciphers are compiled
+on the first use of a tenant and kept in a least recently used cache
+with a memory budget, so only the tables of busy tenants stay in memory.
+
+Example
+=======
+
+>>> from mersad.classical.shift_cipher import ShiftCipher
+>>> from mersad.util.key_store import KeyStore
+>>> store = KeyStore(max_bytes=8 * 1024 * 1024)
+>>> alphabet = "abcdefghijklmnopqrstuvwxyz"
+>>> store.register("alice", ShiftCipher, key=3, letter_sequence=alphabet)
+>>> store.encrypt("alice", "Hail Julius Caesar.")
+'Hdlo Jxolxv Cdhvdu.'
+>>> store.statistics()["hit_rate"]
+0.0
+
+"""
+
+# Python Standard Library
+import sys
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+# Mersad Library
+from mersad.util.base_class import KWARGS_TYPE
+from mersad.util.base_class import CompactAgent
+from mersad.util.base_class import CompiledCipher
+from mersad.util.base_class import MersadClassicalBase
+from mersad.util.table_cache import TABLE_CACHE
+from mersad.util.table_cache import LRUCache
+from mersad.util.table_cache import estimate_size
+from mersad.util.translation_engine import TEXT_TYPE
+
+
+def estimate_cipher_size(cipher: CompiledCipher) -> int:
+    """
+    Estimate memory used by a compiled cipher in bytes.
+
+    :param cipher   : the compiled cipher to be measured.
+    :return         : approximate size of cipher and its tables in bytes.
+    :rtype          : int
+    """
+    size: int = sys.getsizeof(cipher) + estimate_size(cipher.encrypt_table)
+    # decryption table is the same object for involutions like Atbash.
+    if cipher.decrypt_table is not cipher.encrypt_table:
+        size += estimate_size(cipher.decrypt_table)
+    return size
+
+
+class KeyStore(object):
+    """
+    Store of cipher configurations of tenants.
+
+    Tenants are identified by any hashable id. Compiled ciphers are
+    evicted when the number of compiled tenants exceeds max_entries
+    or when the estimated memory of their tables exceeds max_bytes,
+    an evicted tenant is compiled again on its next use. Tables of
+    tenants aren't kept in TABLE_CACHE, so evicting a tenant frees them.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+    ) -> None:
+        """
+        Create an empty key store.
+
+        :param max_entries  : maximum number of compiled ciphers, None for
+                              no limit.
+        :param max_bytes    : maximum memory of compiled ciphers, None for
+                              no limit.
+        """
+        self._agents: Dict[Hashable, CompactAgent] = dict()
+        self._ciphers: LRUCache = LRUCache(
+            max_entries, max_bytes, estimate_cipher_size
+        )
+
+    def __len__(self) -> int:
+        """Return number of registered tenants."""
+        return len(self._agents)
+
+    def __contains__(self, tenant_id: Hashable) -> bool:
+        """Check if a tenant is registered."""
+        return tenant_id in self._agents
+
+    def register(
+        self,
+        tenant_id: Hashable,
+        cipher: Union[Type[MersadClassicalBase], MersadClassicalBase],
+        **kwargs: KWARGS_TYPE,
+    ) -> None:
+        """
+        Register a tenant or replace its configuration.
+
+        :param tenant_id    : id of tenant.
+        :param cipher       : cipher class or a configured agent.
+        :param kwargs       : configuration of cipher, same as config() method.
+        :raise ValueError   : if configuration is invalid.
+        """
+        agent: CompactAgent = (
+            cipher.compact()
+            if isinstance(cipher, MersadClassicalBase)
+            else CompactAgent(cipher)
+        )
+        if kwargs:
+            agent.config(**kwargs)
+        self._agents[tenant_id] = agent
+        # the old compiled cipher of tenant is out of date.
+        self._ciphers.discard(tenant_id)
+
+    def unregister(self, tenant_id: Hashable) -> None:
+        """
+        Remove a tenant and its compiled cipher.
+
+        :param tenant_id    : id of tenant.
+        :raise KeyError     : if tenant isn't registered.
+        """
+        del self._agents[tenant_id]
+        self._ciphers.discard(tenant_id)
+
+    def cipher(self, tenant_id: Hashable) -> CompiledCipher:
+        """
+        Return compiled cipher of a tenant, compile it if it isn't cached.
+
+        :param tenant_id    : id of tenant.
+        :raise KeyError     : if tenant isn't registered.
+        :return             : compiled cipher of tenant.
+        :rtype              : CompiledCipher
+        """
+        return self._ciphers.fetch(tenant_id, self._compile, tenant_id)
+
+    def encrypt(self, tenant_id: Hashable, plain_text: TEXT_TYPE) -> TEXT_TYPE:
+        """
+        Encrypt a string with the cipher of a tenant.
+
+        :param tenant_id    : id of tenant.
+        :param plain_text   : the string that will be encrypted.
+        :raise KeyError     : if tenant isn't registered.
+        :return             : encrypted string.
+        :rtype              : str
+        """
+        return self.cipher(tenant_id).encrypt(plain_text)
+
+    def decrypt(self, tenant_id: Hashable, cipher_text: TEXT_TYPE) -> TEXT_TYPE:
+        """
+        Decrypt a string with the cipher of a tenant.
+
+        :param tenant_id    : id of tenant.
+        :param cipher_text  : the string that will be decrypted.
+        :raise KeyError     : if tenant isn't registered.
+        :return             : decrypted string.
+        :rtype              : str
+        """
+        return self.cipher(tenant_id).decrypt(cipher_text)
+
+    def encrypt_batch(
+        self, requests: Iterable[Tuple[Hashable, TEXT_TYPE]]
+    ) -> List[TEXT_TYPE]:
+        """
+        Encrypt many strings, each one with the cipher of its tenant.
+
+        :param requests     : pairs of tenant id and string to be encrypted.
+        :raise KeyError     : if a tenant isn't registered.
+        :return             : encrypted strings in the order of requests.
+        :rtype              : list
+        """
+        return self._batch(requests, False)
+
+    def decrypt_batch(
+        self, requests: Iterable[Tuple[Hashable, TEXT_TYPE]]
+    ) -> List[TEXT_TYPE]:
+        """
+        Decrypt many strings, each one with the cipher of its tenant.
+
+        :param requests     : pairs of tenant id and string to be decrypted.
+        :raise KeyError     : if a tenant isn't registered.
+        :return             : decrypted strings in the order of requests.
+        :rtype              : list
+        """
+        return self._batch(requests, True)
+
+    def warm_up(self, tenant_ids: Iterable[Hashable]) -> int:
+        """
+        Compile ciphers of tenants before their first use.
+
+        Tenants should be given from the hottest one, when the budget
+        can't hold all of them the hottest tenants are kept. Warming up
+        isn't counted in hits and misses of statistics.
+
+        :param tenant_ids   : ids of tenants, hottest tenant first.
+        :raise KeyError     : if a tenant isn't registered.
+        :return             : number of given tenants which are compiled.
+        :rtype              : int
+        """
+        tenants: List[Hashable] = list(tenant_ids)
+        # compile the coldest tenant first, so the hottest is the most recent.
+        for tenant_id in reversed(tenants):
+            if tenant_id not in self._ciphers:
+                self._ciphers.put(tenant_id, self._compile(tenant_id))
+        return sum(1 for tenant_id in tenants if tenant_id in self._ciphers)
+
+    def resize(
+        self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Change limits of compiled ciphers and evict ciphers which don't fit.
+
+        :param max_entries  : maximum number of compiled ciphers, None for
+                              no limit.
+        :param max_bytes    : maximum memory of compiled ciphers, None for
+                              no limit.
+        """
+        self._ciphers.resize(max_entries, max_bytes)
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Return statistics of compiled ciphers.
+
+        :return : number of tenants and compiled ciphers (entries), hits,
+                  misses, hit rate, evictions and estimated bytes.
+        :rtype  : dict
+        """
+        statistics: Dict[str, Union[int, float]] = dict(self._ciphers.statistics())
+        lookups: Union[int, float] = statistics["hits"] + statistics["misses"]
+        statistics["hit_rate"] = statistics["hits"] / lookups if lookups else 0.0
+        statistics["tenants"] = len(self._agents)
+        return statistics
+
+    def _compile(self, tenant_id: Hashable) -> CompiledCipher:
+        """
+        Compile the cipher of a tenant without caching.
+
+        :param tenant_id    : id of tenant.
+        :raise KeyError     : if tenant isn't registered.
+        :return             : compiled cipher of tenant.
+        :rtype              : CompiledCipher
+        """
+        with TABLE_CACHE.bypass():
+            return self._agents[tenant_id].expand().compile()
+
+    def _batch(
+        self, requests: Iterable[Tuple[Hashable, TEXT_TYPE]], decrypt: bool
+    ) -> List[TEXT_TYPE]:
+        """
+        Handle batches for both encryption and decryption.
+
+        Cipher of every tenant is looked up once per batch.
+
+        :param requests     : pairs of tenant id and string.
+        :param decrypt      : switch for encryption/decryption.
+        :return             : translated strings in the order of requests.
+        :rtype              : list
+        """
+        ciphers: Dict[Hashable, CompiledCipher] = dict()
+        translated: List[TEXT_TYPE] = list()
+        for (tenant_id, text) in requests:
+            cipher: Optional[CompiledCipher] = ciphers.get(tenant_id)
+            if cipher is None:
+                cipher = ciphers[tenant_id] = self.cipher(tenant_id)
+            translated.append(
+                cipher.decrypt(text) if decrypt else cipher.encrypt(text)
+            )
+        return translated
@@ -0,0 +1,57 @@
+# Stubs for mersad.util.key_store (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+# Mersad Library
+from mersad.util.base_class import KWARGS_TYPE
+from mersad.util.base_class import CompactAgent
+from mersad.util.base_class import CompiledCipher
+from mersad.util.base_class import MersadClassicalBase
+from mersad.util.table_cache import LRUCache
+from mersad.util.translation_engine import TEXT_TYPE
+
+def estimate_cipher_size(cipher: CompiledCipher) -> int: ...
+
+class KeyStore:
+    _agents: Dict[Hashable, CompactAgent] = ...
+    _ciphers: LRUCache = ...
+    def __init__(
+        self, max_entries: Optional[int] = ..., max_bytes: Optional[int] = ...
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, tenant_id: Hashable) -> bool: ...
+    def register(
+        self,
+        tenant_id: Hashable,
+        cipher: Union[Type[MersadClassicalBase], MersadClassicalBase],
+        **kwargs: KWARGS_TYPE,
+    ) -> None: ...
+    def unregister(self, tenant_id: Hashable) -> None: ...
+    def cipher(self, tenant_id: Hashable) -> CompiledCipher: ...
+    def encrypt(self, tenant_id: Hashable, plain_text: TEXT_TYPE) -> TEXT_TYPE: ...
+    def decrypt(self, tenant_id: Hashable, cipher_text: TEXT_TYPE) -> TEXT_TYPE: ...
+    def encrypt_batch(
+        self, requests: Iterable[Tuple[Hashable, TEXT_TYPE]]
+    ) -> List[TEXT_TYPE]: ...
+    def decrypt_batch(
+        self, requests: Iterable[Tuple[Hashable, TEXT_TYPE]]
+    ) -> List[TEXT_TYPE]: ...
+    def warm_up(self, tenant_ids: Iterable[Hashable]) -> int: ...
+    def resize(
+        self, max_entries: Optional[int] = ..., max_bytes: Optional[int] = ...
+    ) -> None: ...
+    def statistics(self) -> Dict[str, Union[int, float]]: ...
+    def _compile(self, tenant_id: Hashable) -> CompiledCipher: ...
+    def _batch(
+        self, requests: Iterable[Tuple[Hashable, TEXT_TYPE]], decrypt: bool
+    ) -> List[TEXT_TYPE]: ...
@@ -0,0 +1,384 @@
+# mersad/util/pipeline.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.pipeline module.
+============================
+
+The module contains Pipeline class which chains ciphers.
+
+A pipeline is built once from a list of configured agents (or compiled
+ciphers). Consecutive monoalphabetic ciphers are substitutions, so their
+tables are composed into one table at build time and any chain of
+substitutions costs a single translate pass over the text.
+
+Route cipher only moves letters and substitutions only change letters, so
+the two commute. By default a pipeline with Route ciphers runs as one
+translate pass (symbol pass) followed by one gather (position pass), the
+gather order of every text length is composed from all routes and cached.
+Padding letters of a route are only changed by ciphers after that route,
+so they are added to the text already mapped backwards through ciphers
+before that route. Passing fuse_routes=False runs every route as a
+separate stage instead. Pipelines whose ciphers delete letters (strip
+unknown letters) always run routes as separate stages.
+
+Example
+=======
+
+>>> from mersad.classical.affine_cipher import AffineCipher
+>>> from mersad.classical.atbash_cipher import AtbashCipher
+>>> from mersad.classical.shift_cipher import ShiftCipher
+>>> from mersad.util.pipeline import Pipeline
+>>> pipeline = Pipeline([ShiftCipher(key=3), AffineCipher(key=125), AtbashCipher()])
+>>> pipeline.passes
+1
+>>> pipeline.decrypt(pipeline.encrypt("Hail Julius Caesar."))
+'Hail Julius Caesar.'
+>>> from mersad.classical.route_cipher import RouteCipher
+>>> route = [3, 2, 1, 0, 4, 8, 12, 13, 14, 15, 11, 7, 6, 5, 9, 10]
+>>> pipeline = Pipeline([ShiftCipher(key=3), RouteCipher(key=4, route=route)])
+>>> pipeline.passes
+2
+>>> pipeline.encrypt("WEAREDISCOVERED")
+'UDHZHFUHGXHVLGRY'
+
+"""
+
+# Python Standard Library
+import sys
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+# Mersad Library
+from mersad.classical.route_cipher import RouteTable
+from mersad.classical.route_cipher import route_cipher_padding
+from mersad.util import translation_engine
+from mersad.util.base_class import CompiledCipher
+from mersad.util.base_class import MersadClassicalBase
+from mersad.util.table_cache import LRUCache
+from mersad.util.translation_engine import TEXT_TYPE
+from mersad.util.translation_engine import TranslationTable
+
+# define type aliases.
+AGENT_TYPE = Union[MersadClassicalBase, CompiledCipher]
+STAGE_TYPE = Tuple[Any, Callable[[TEXT_TYPE, Any], TEXT_TYPE]]
+PLAN_TYPE = Tuple[str, Tuple[int, ...]]
+
+# limits of gather plans kept by a pipeline, plans hold an index per letter.
+PLAN_CACHE_SIZE: int = 64
+PLAN_CACHE_BYTES: int = 16 * 1024 * 1024
+
+
+class Pipeline(object):
+    """
+    Chain of ciphers which encrypts a text with every cipher in order.
+
+    Agents are compiled when the pipeline is created, so later changes to
+    agents' configuration don't affect the pipeline. Decryption runs the
+    chain backwards with decryption tables of every cipher.
+    """
+
+    def __init__(
+        self, agents: Sequence[AGENT_TYPE], fuse_routes: bool = True
+    ) -> None:
+        """
+        Create an instance of the class.
+
+        :param agents       : configured agents or compiled ciphers, in the order
+                              of encryption.
+        :param fuse_routes  : run the whole pipeline as one symbol pass and one
+                              position pass, default is True.
+        """
+        # compile agents, compiled ciphers are immutable and used as is.
+        self.ciphers: Tuple[CompiledCipher, ...] = tuple(
+            agent.compile() if isinstance(agent, MersadClassicalBase) else agent
+            for agent in agents
+        )
+        self._encrypt_stages: List[STAGE_TYPE] = self._fuse(
+            [(cipher.encrypt_table, cipher._apply_table) for cipher in self.ciphers]
+        )
+        self._decrypt_stages: List[STAGE_TYPE] = self._fuse(
+            [
+                (cipher.decrypt_table, cipher._apply_table)
+                for cipher in reversed(self.ciphers)
+            ]
+        )
+        # fused execution needs at least one route and no unknown stage.
+        # padding letters are mapped backwards through substitutions, so
+        # every table must be a permutation, tables which delete letters
+        # change the length of text and folded letters have no single
+        # preimage.
+        self._fused: bool = (
+            fuse_routes
+            and any(isinstance(t, RouteTable) for (t, _) in self._encrypt_stages)
+            and all(
+                isinstance(t, RouteTable) or _is_permutation(t)
+                for (t, _) in self._encrypt_stages + self._decrypt_stages
+            )
+        )
+        # composed table of all substitutions and gather plans of each length.
+        self._encrypt_table: TranslationTable = self._compose(self._encrypt_stages)
+        self._decrypt_table: TranslationTable = self._compose(self._decrypt_stages)
+        self._encrypt_plans: LRUCache = LRUCache(
+            PLAN_CACHE_SIZE, PLAN_CACHE_BYTES, _plan_size
+        )
+        self._decrypt_plans: LRUCache = LRUCache(
+            PLAN_CACHE_SIZE, PLAN_CACHE_BYTES, _plan_size
+        )
+
+    def __repr__(self) -> str:
+        """Return the objects info as string."""
+        return "Pipeline({0})".format(
+            ", ".join(cipher.cipher_class.__name__ for cipher in self.ciphers)
+        )
+
+    @property
+    def passes(self) -> int:
+        """
+        Return number of passes over the text for encrypting it.
+
+        :return : number of stages after fusing substitutions.
+        :rtype  : int
+        """
+        if self._fused:
+            # one position pass, plus one symbol pass if there is any substitution.
+            return 1 + int(bool(self._encrypt_table))
+        return len(self._encrypt_stages)
+
+    def encrypt(self, plain_text: TEXT_TYPE) -> TEXT_TYPE:
+        """
+        Encrypt a string with every cipher of the pipeline.
+
+        :param plain_text   : (required) string or binary data to be encrypted.
+        :return             : encrypted text.
+        :rtype              : str, bytes or bytearray
+        """
+        if self._fused:
+            return self._run_fused(
+                plain_text,
+                self._encrypt_stages,
+                self._encrypt_table,
+                self._encrypt_plans,
+            )
+        return self._run(plain_text, self._encrypt_stages)
+
+    def decrypt(self, cipher_text: TEXT_TYPE) -> TEXT_TYPE:
+        """
+        Decrypt a string encrypted by this pipeline.
+
+        :param cipher_text  : (required) string or binary data to be decrypted.
+        :return             : decrypted text.
+        :rtype              : str, bytes or bytearray
+        """
+        if self._fused:
+            return self._run_fused(
+                cipher_text,
+                self._decrypt_stages,
+                self._decrypt_table,
+                self._decrypt_plans,
+            )
+        return self._run(cipher_text, self._decrypt_stages)
+
+    @staticmethod
+    def _run(text: TEXT_TYPE, stages: List[STAGE_TYPE]) -> TEXT_TYPE:
+        """
+        Pass a text through stages.
+
+        :param text     : string or binary data.
+        :param stages   : list of (table, apply_table) pairs.
+        :return         : translated text.
+        :rtype          : str, bytes or bytearray
+        """
+        for table, apply_table in stages:
+            text = apply_table(text, table)
+        return text
+
+    @staticmethod
+    def _fuse(stages: List[STAGE_TYPE]) -> List[STAGE_TYPE]:
+        """
+        Compose consecutive substitution stages into one stage.
+
+        :param stages   : list of (table, apply_table) pairs.
+        :return         : list of stages with no two consecutive substitutions.
+        :rtype          : list
+        """
+        fused: List[STAGE_TYPE] = list()
+        for table, apply_table in stages:
+            if (
+                fused
+                and isinstance(table, TranslationTable)
+                and isinstance(fused[-1][0], TranslationTable)
+            ):
+                fused[-1] = (
+                    translation_engine.compose_table(fused[-1][0], table),
+                    translation_engine.translate,
+                )
+            else:
+                fused.append((table, apply_table))
+        return fused
+
+    @staticmethod
+    def _compose(stages: List[STAGE_TYPE]) -> TranslationTable:
+        """
+        Compose every substitution stage into one table.
+
+        :param stages   : list of (table, apply_table) pairs.
+        :return         : composed table of substitution stages.
+        :rtype          : TranslationTable
+        """
+        composed: TranslationTable = TranslationTable()
+        for table, _ in stages:
+            if isinstance(table, TranslationTable):
+                composed = translation_engine.compose_table(composed, table)
+        return composed
+
+    @staticmethod
+    def _plan(length: int, stages: List[STAGE_TYPE]) -> PLAN_TYPE:
+        """
+        Compose routes of stages into one gather order for a text length.
+
+        Padding letters of every route are appended to the text, mapped
+        backwards through substitutions before that route, so that the
+        composed table of all substitutions turns them into what the
+        ciphers after the route make of the fill letter.
+
+        :param length   : length of text to be translated.
+        :param stages   : list of (table, apply_table) pairs.
+        :raise ValueError   : if a route length doesn't match text length.
+        :return         : letters to append to text and gather order.
+        :rtype          : tuple
+        """
+        # current text as indexes of the (padded) source text.
+        order: List[int] = list(range(length))
+        suffix: List[str] = list()
+        # composed table of substitutions seen so far.
+        before: TranslationTable = TranslationTable()
+        inverse: Optional[TranslationTable] = None
+
+        for table, _ in stages:
+            if isinstance(table, TranslationTable):
+                before = translation_engine.compose_table(before, table)
+                inverse = None
+                continue
+            padding: str = route_cipher_padding(len(order), table, True)
+            if padding and inverse is None:
+                inverse = translation_engine.invert_table(before)
+            for letter in padding:
+                order.append(length + len(suffix))
+                suffix.append(chr(inverse.get(ord(letter), ord(letter))))
+            order = [order[index] for index in table.order]
+
+        return "".join(suffix), tuple(order)
+
+    @classmethod
+    def _run_fused(
+        cls,
+        text: TEXT_TYPE,
+        stages: List[STAGE_TYPE],
+        table: TranslationTable,
+        plans: LRUCache,
+    ) -> TEXT_TYPE:
+        """
+        Pass a text through stages with one symbol pass and one position pass.
+
+        :param text     : string or binary data.
+        :param stages   : list of (table, apply_table) pairs.
+        :param table    : composed table of substitution stages.
+        :param plans    : cache of gather plans for each text length.
+        :return         : translated text.
+        :rtype          : str, bytes or bytearray
+        """
+        plan: PLAN_TYPE = plans.fetch(len(text), cls._plan, len(text), stages)
+        suffix, order = plan
+
+        if isinstance(text, str):
+            translated: TEXT_TYPE = translation_engine.translate(
+                text + suffix, table
+            )
+            return "".join(map(translated.__getitem__, order))
+        translated = translation_engine.translate(
+            text + suffix.encode("latin-1"), table
+        )
+        return type(text)(map(translated.__getitem__, order))
+
+
+def _is_permutation(table: Any) -> bool:
+    """
+    Check if a table is a translation table which maps letters one to one.
+
+    :param table    : table of a stage.
+    :return         : True if every translated letter is a letter of table
+                      and no two letters are translated to the same letter.
+    :rtype          : bool
+    """
+    if not isinstance(table, TranslationTable) or table.deletes():
+        return False
+    pairs: Dict[int, Optional[int]] = dict(table.items())
+    translated: Set[Optional[int]] = set(pairs.values())
+    return len(translated) == len(pairs) and translated == set(pairs)
+
+
+def _plan_size(plan: PLAN_TYPE) -> int:
+    """
+    Estimate memory used by a gather plan in bytes.
+
+    Integers of gather order are counted too, except small ones (up to
+    256) which are shared by the interpreter.
+
+    :param plan : letters to append to text and gather order.
+    :return     : approximate size of plan in bytes.
+    :rtype      : int
+    """
+    order: Tuple[int, ...] = plan[1]
+    return (
+        sys.getsizeof(plan[0])
+        + sys.getsizeof(order)
+        + sum(sys.getsizeof(index) for index in order if index > 256)
+    )
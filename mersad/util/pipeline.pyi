@@ -0,0 +1,61 @@
+# Stubs for mersad.util.pipeline (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+# Mersad Library
+from mersad.util.base_class import CompiledCipher
+from mersad.util.base_class import MersadClassicalBase
+from mersad.util.table_cache import LRUCache
+from mersad.util.translation_engine import TEXT_TYPE
+from mersad.util.translation_engine import TranslationTable
+
+AGENT_TYPE = Union[MersadClassicalBase, CompiledCipher]
+STAGE_TYPE = Tuple[Any, Callable[[TEXT_TYPE, Any], TEXT_TYPE]]
+PLAN_TYPE = Tuple[str, Tuple[int, ...]]
+PLAN_CACHE_SIZE: int
+PLAN_CACHE_BYTES: int
+
+class Pipeline:
+    ciphers: Tuple[CompiledCipher, ...] = ...
+    _encrypt_stages: List[STAGE_TYPE] = ...
+    _decrypt_stages: List[STAGE_TYPE] = ...
+    _fused: bool = ...
+    _encrypt_table: TranslationTable = ...
+    _decrypt_table: TranslationTable = ...
+    _encrypt_plans: LRUCache = ...
+    _decrypt_plans: LRUCache = ...
+    def __init__(
+        self, agents: Sequence[AGENT_TYPE], fuse_routes: bool = ...
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    @property
+    def passes(self) -> int: ...
+    def encrypt(self, plain_text: TEXT_TYPE) -> TEXT_TYPE: ...
+    def decrypt(self, cipher_text: TEXT_TYPE) -> TEXT_TYPE: ...
+    @staticmethod
+    def _run(text: TEXT_TYPE, stages: List[STAGE_TYPE]) -> TEXT_TYPE: ...
+    @staticmethod
+    def _fuse(stages: List[STAGE_TYPE]) -> List[STAGE_TYPE]: ...
+    @staticmethod
+    def _compose(stages: List[STAGE_TYPE]) -> TranslationTable: ...
+    @staticmethod
+    def _plan(length: int, stages: List[STAGE_TYPE]) -> PLAN_TYPE: ...
+    @classmethod
+    def _run_fused(
+        cls,
+        text: TEXT_TYPE,
+        stages: List[STAGE_TYPE],
+        table: TranslationTable,
+        plans: LRUCache,
+    ) -> TEXT_TYPE: ...
+
+def _is_permutation(table: Any) -> bool: ...
+def _plan_size(plan: PLAN_TYPE) -> int: ...
@@ -74,6 +74,31 @@ def find_unique_letters(text: str) -> Set[str]:
     return set(text)
 
 
+def find_duplicate_letters(text: str) -> List[str]:
+    """
+    List letters which occur more than once in a string.
+
+    :param text: string source.
+    :return: repeated letters in order of their second occurrence.
+    :rtype: list
+    """
+    # check types.
+    type_check.type_guard(text, str)
+    # most alphabets have no duplicates, so test that first.
+    if len(set(text)) == len(text):
+        return []
+
+    # type annotations
+    seen: Set[str] = set()
+    duplicates: List[str] = []
+
+    for letter in text:
+        if letter in seen and letter not in duplicates:
+            duplicates.append(letter)
+        seen.add(letter)
+    return duplicates
+
+
 def find_letter_indexes(text: str, letter: str) -> List[int]:
     """
     List indexes of a letter in a string.
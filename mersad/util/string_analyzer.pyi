@@ -8,5 +8,6 @@ from typing import List
 from typing import Set
 
 def find_unique_letters(text: str) -> Set[str]: ...
+def find_duplicate_letters(text: str) -> List[str]: ...
 def find_letter_indexes(text: str, letter: str) -> List[int]: ...
 def map_letters_to_indexes(text: str) -> Dict[str, List[int]]: ...
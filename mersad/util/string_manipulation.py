@@ -52,6 +52,13 @@ This module provides functions for modifying string objects.
 # Python Standard Library
 import random
 from typing import List
+from typing import Union
+
+# Mersad Library
+from mersad.util.table_cache import LRUCache
+
+# cache of shuffled strings by (string, seed).
+SHUFFLE_CACHE: LRUCache = LRUCache(max_entries=256, max_bytes=16 * 1024 * 1024)
 
 
 def shuffle_string(text: str, seed: int) -> str:
@@ -61,14 +68,32 @@ def shuffle_string(text: str, seed: int) -> str:
     with seed parameter in can create identical strings
     from same source in multiple calls.
 
+    The string is shuffled with a private random generator, so the
+    global state of random library isn't touched, and shuffled strings
+    are cached in SHUFFLE_CACHE.
+
     :param text : string to be shuffled.
     :param seed : number for setting seed on random library.
     :return     : the shuffled string.
     :rtype      : str
     """
-    random.seed(seed)
+    return SHUFFLE_CACHE.fetch((text, seed), _shuffle_string, text, seed)
+
+
+def _shuffle_string(text: str, seed: int) -> str:
+    """
+    Shuffle letters in the string without caching.
+
+    The result is the same as seeding the global random generator with
+    seed and shuffling the letters with random.shuffle.
+
+    :param text : string to be shuffled.
+    :param seed : number for setting seed on random generator.
+    :return     : the shuffled string.
+    :rtype      : str
+    """
     letter_list: List[str] = list(text)
-    random.shuffle(letter_list)
+    random.Random(seed).shuffle(letter_list)
     return "".join(letter_list)
 
 
@@ -87,3 +112,17 @@ def replace_letter_by_index(text: str, letter: str, indexes: List[int]) -> str:
     for index in indexes:
         letter_list[index] = letter
     return "".join(letter_list)
+
+
+def bytes_to_letters(letters: Union[bytes, bytearray]) -> str:
+    """
+    Convert a set of bytes into a string of letters.
+
+    Every byte becomes the letter with the same code point (latin-1),
+    so byte alphabets can be used wherever a letter sequence is needed.
+
+    :param letters  : bytes to be converted.
+    :return         : string with one letter for each byte.
+    :rtype          : str
+    """
+    return bytes(letters).decode("latin-1")
@@ -4,6 +4,14 @@
 
 # Python Standard Library
 from typing import List
+from typing import Union
+
+# Mersad Library
+from mersad.util.table_cache import LRUCache
+
+SHUFFLE_CACHE: LRUCache
 
 def shuffle_string(text: str, seed: int) -> str: ...
+def _shuffle_string(text: str, seed: int) -> str: ...
 def replace_letter_by_index(text: str, letter: str, indexes: List[int]) -> str: ...
+def bytes_to_letters(letters: Union[bytes, bytearray]) -> str: ...
@@ -0,0 +1,311 @@
+# mersad/util/table_cache.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.table_cache module.
+===============================
+
+The module contains a bounded, thread-safe least recently
+used (LRU) cache for compiled translation tables.
+
+Building a table (shuffling the alphabet and mapping every
+letter) costs more than translating a short message, so the
+ciphers share one process-wide cache, TABLE_CACHE, and only
+build a table the first time a configuration is seen.
+
+Example
+=======
+
+>>> from mersad.util.table_cache import TABLE_CACHE
+>>> # limit the cache to 256 tables or 16 MiB, whichever comes first.
+>>> TABLE_CACHE.resize(max_entries=256, max_bytes=16 * 1024 * 1024)
+>>> TABLE_CACHE.statistics()
+{'hits': 0, 'misses': 0, 'evictions': 0, 'entries': 0, 'bytes': 0}
+
+"""
+
+# Python Standard Library
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate memory used by a cached value in bytes.
+
+    Dictionaries are measured with their keys and values, other
+    objects are measured with sys.getsizeof. Compact translation
+    tables report their runs by their own __sizeof__.
+
+    :param value    : the object to be measured.
+    :return         : approximate size of object in bytes.
+    :rtype          : int
+    """
+    size: int = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            sys.getsizeof(i) + sys.getsizeof(j) for i, j in dict.items(value)
+        )
+    return size
+
+
+class LRUCache(object):
+    """
+    Bounded, thread-safe least recently used cache.
+
+    The cache evicts least recently used entries when the number
+    of entries exceeds max_entries or when the estimated memory
+    of entries exceeds max_bytes. a limit set to None is disabled.
+
+    Cached values are shared between all the callers and must
+    not be modified.
+
+    A disk cache (see mersad.util.disk_cache) can be put behind the
+    cache by setting disk attribute, fetch() loads missing values from
+    it before building them and stores the values it builds.
+
+    Inside a bypass() block, values which a thread fetches and misses
+    aren't kept in the cache, so objects with their own memory budget
+    (for example the key store) can build tables without pinning them
+    in the cache. They're only kept until the block ends, so a table
+    derived from another one (e.g. a decryption table) doesn't build
+    it again.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 512,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        sizer: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        """
+        Create an empty cache.
+
+        :param max_entries  : maximum number of entries, None for no limit.
+        :param max_bytes    : maximum memory of entries, None for no limit.
+        :param sizer        : function for estimating memory of a value.
+        """
+        self.max_entries: Optional[int] = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self._sizer: Callable[[Any], int] = sizer
+        # optional second level cache with load(key) and store(key, value).
+        self.disk: Optional[Any] = None
+        # entries are stored as key: (value, size) from least to most recent.
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        # depth of bypass() blocks and values missed in them, of each thread.
+        self._bypass: threading.local = threading.local()
+
+    def __len__(self) -> int:
+        """Return number of entries in the cache."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a key is in the cache without touching its recency."""
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value of a key and mark it as recently used.
+
+        :param key      : key of entry.
+        :param default  : value to return if key isn't cached.
+        :return         : cached value or default.
+        """
+        with self._lock:
+            entry: Optional[Tuple[Any, int]] = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Add or replace an entry and evict old entries if limits are exceeded.
+
+        :param key      : key of entry.
+        :param value    : value to be cached.
+        """
+        size: int = self._sizer(value)
+        with self._lock:
+            old: Optional[Tuple[Any, int]] = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove an entry if it's in the cache.
+
+        :param key      : key of entry.
+        """
+        with self._lock:
+            old: Optional[Tuple[Any, int]] = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+    def fetch(self, key: Hashable, builder: Callable[..., Any], *args: Any) -> Any:
+        """
+        Return the cached value of a key, build and cache it if it's missing.
+
+        The builder is called outside of the lock, so two threads that miss
+        the same key at the same time may both build it, but both get an
+        equal value and the cache stays consistent. If a disk cache is set,
+        the value is loaded from it before calling builder.
+
+        :param key      : key of entry.
+        :param builder  : function which creates the value.
+        :param args     : arguments passed to builder.
+        :return         : cached or newly built value.
+        """
+        bypassed: Optional[Dict[Hashable, Any]] = getattr(
+            self._bypass, "values", None
+        )
+        if bypassed is not None and key in bypassed:
+            return bypassed[key]
+        with self._lock:
+            entry: Optional[Tuple[Any, int]] = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+        disk: Optional[Any] = self.disk
+        value: Any = disk.load(key) if disk is not None else None
+        if value is None:
+            value = builder(*args)
+            if disk is not None:
+                disk.store(key, value)
+        if bypassed is None:
+            self.put(key, value)
+        else:
+            bypassed[key] = value
+        return value
+
+    @contextmanager
+    def bypass(self) -> Iterator[None]:
+        """
+        Don't keep values which this thread fetches and misses in the block.
+
+        Cached values are still returned, missed values are reused until
+        the outermost block ends, other threads aren't affected.
+        """
+        self._bypass.depth = getattr(self._bypass, "depth", 0) + 1
+        if self._bypass.depth == 1:
+            self._bypass.values = dict()
+        try:
+            yield
+        finally:
+            self._bypass.depth -= 1
+            if not self._bypass.depth:
+                del self._bypass.values
+
+    def resize(
+        self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Change cache limits and evict entries which don't fit anymore.
+
+        :param max_entries  : maximum number of entries, None for no limit.
+        :param max_bytes    : maximum memory of entries, None for no limit.
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Return cache statistics.
+
+        :return : hits, misses, evictions, number of entries and estimated bytes.
+        :rtype  : dict
+        """
+        with self._lock:
+            return dict(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until cache fits its limits."""
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            size: int = self._entries.popitem(last=False)[1][1]
+            self._bytes -= size
+            self._evictions += 1
+
+
+# process-wide cache of compiled translation tables.
+TABLE_CACHE: LRUCache = LRUCache()
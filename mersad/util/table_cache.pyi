@@ -0,0 +1,41 @@
+# Stubs for mersad.util.table_cache (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterator
+from typing import Optional
+
+def estimate_size(value: Any) -> int: ...
+
+class LRUCache:
+    max_entries: Optional[int] = ...
+    max_bytes: Optional[int] = ...
+    disk: Optional[Any] = ...
+    def __init__(
+        self,
+        max_entries: Optional[int] = ...,
+        max_bytes: Optional[int] = ...,
+        sizer: Callable[[Any], int] = ...,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, key: Hashable) -> bool: ...
+    def get(self, key: Hashable, default: Any = ...) -> Any: ...
+    def put(self, key: Hashable, value: Any) -> None: ...
+    def discard(self, key: Hashable) -> None: ...
+    def fetch(
+        self, key: Hashable, builder: Callable[..., Any], *args: Any
+    ) -> Any: ...
+    def bypass(self) -> Iterator[None]: ...
+    def resize(
+        self, max_entries: Optional[int] = ..., max_bytes: Optional[int] = ...
+    ) -> None: ...
+    def clear(self) -> None: ...
+    def statistics(self) -> Dict[str, int]: ...
+    def _evict(self) -> None: ...
+
+TABLE_CACHE: LRUCache
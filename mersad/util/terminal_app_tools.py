@@ -52,15 +52,24 @@ Mersad programs in terminal.
 
 # Python Standard Library
 import argparse
-import string
+import contextlib
+import io
+import sys
+from typing import IO
 from typing import Any
 from typing import List
+from typing import Optional
 from typing import Type
 from typing import TypeVar
 
 # Mersad Library
 from mersad._version import __version__
+from mersad.util import disk_cache
+from mersad.util.alphabet import DEFAULT_ALPHABET
+from mersad.util.alphabet import Alphabet
 from mersad.util.base_class import MersadClassicalBase
+from mersad.util.fan_out import FanOut
+from mersad.util.translation_engine import TEXT_TYPE
 
 # define a new type hint.
 MCLCryptClass = TypeVar("MCLCryptClass", bound=MersadClassicalBase)
@@ -102,12 +111,23 @@ class MainFunctionClassical(object):
         # parse terminal arguments
         args: argparse.Namespace = self._parse_args()
 
+        # load compiled tables from (and save them to) the disk cache.
+        if args.disk_cache:
+            disk_cache.enable()
+
+        # translate the input with every key in one read.
+        if args.fan_out:
+            self._fan_out(args)
+            return
+
         # load text_input from file or terminal.
         # type annotations.
-        text_input: str
+        text_input: TEXT_TYPE
         if args.file:
-            with open(args.file, "r") as file:
+            with open(args.file, "rb" if args.binary else "r") as file:
                 text_input = file.read()
+        elif args.binary:
+            text_input = args.text.encode()
         else:
             text_input = args.text
 
@@ -118,19 +138,77 @@ class MainFunctionClassical(object):
         self._config_agent(agent, args)
 
         # type annotations.
-        text_output: str
-        if args.decrypt:
+        text_output: TEXT_TYPE
+        if args.group_size or args.line_width:
+            # write cipher text in groups, decryption ignores separators.
+            if args.decrypt:
+                text_output = agent.decrypt_grouped(text_input)
+            else:
+                text_output = agent.encrypt_grouped(
+                    text_input, args.group_size, args.line_width
+                )
+        elif args.decrypt:
             text_output = agent.decrypt(text_input)
         else:
             text_output = agent.encrypt(text_input)
 
         # write output to a file or show on terminal.
         if args.output:
-            with open(args.output, "w+") as file:
+            with open(args.output, "wb" if args.binary else "w+") as file:
                 file.write(text_output)
+        elif args.binary:
+            sys.stdout.buffer.write(text_output)
+            sys.stdout.buffer.flush()
         else:
             print(text_output)
 
+    def _fan_out(self, args: argparse.Namespace) -> None:
+        """
+        Translate the input with --key and every key of fan out into its own output.
+
+        Every key is parsed like the --key argument, output path of a key
+        is --output formatted with the key, or --output and the key joined
+        with a dot if --output has no "{}".
+
+        :param args         : terminal argument namespace.
+        :raise ValueError   : if output isn't given.
+        """
+        if not args.output:
+            raise ValueError("ERROR: fan out needs an output path (--output).")
+
+        # type annotations.
+        agents: List[MersadClassicalBase] = list()
+        paths: List[str] = list()
+        keys: List[str] = list(args.fan_out)
+        if getattr(args, "key", None) is not None:
+            keys.insert(0, str(args.key))
+        for key in dict.fromkeys(keys):
+            agent = self.agent_class()
+            self._config_agent(agent, self._parse_args(["--key", key]))
+            agents.append(agent)
+            if "{}" in args.output:
+                paths.append(args.output.format(key))
+            else:
+                paths.append("{}.{}".format(args.output, key))
+
+        fan_out: FanOut = FanOut(agents, workers=args.workers)
+        mode: str = "b" if args.binary else ""
+        with contextlib.ExitStack() as stack:
+            source: IO[Any]
+            if args.file:
+                source = stack.enter_context(open(args.file, "r" + mode))
+            elif args.binary:
+                source = io.BytesIO(args.text.encode())
+            else:
+                source = io.StringIO(args.text)
+            destinations: List[IO[Any]] = [
+                stack.enter_context(open(path, "w" + mode)) for path in paths
+            ]
+            if args.decrypt:
+                fan_out.decrypt(source, destinations)
+            else:
+                fan_out.encrypt(source, destinations)
+
     def _config_agent(
         self, agent: Type[MCLCryptClass], args: argparse.Namespace
     ) -> None:
@@ -140,10 +218,12 @@ class MainFunctionClassical(object):
         This method should be implemented in subclasses.
         """
 
-    def _parse_args(self) -> argparse.Namespace:
+    def _parse_args(self, extra: Optional[List[str]] = None) -> argparse.Namespace:
         """
         Start parsing terminal arguments.
 
+        :param extra: arguments added after terminal arguments, they
+                      override terminal arguments (e.g. a key of fan out).
         :return: terminal argument namespace.
         :rtype: argparse.Namespace
         """
@@ -172,7 +252,16 @@ class MainFunctionClassical(object):
         )
 
         # parse args and create a dictionary like namespace object.
-        return parser.parse_args(args=self.args)
+        args: argparse.Namespace = parser.parse_args(args=self.args + (extra or []))
+        # fan out configures an agent with each key, key-less ciphers can't.
+        if args.fan_out and "key" not in args:
+            parser.error("argument --fan_out: this cipher doesn't take a key")
+        # outputs of fan out are streamed, they can't be written in groups.
+        if args.fan_out and (args.group_size or args.line_width):
+            parser.error(
+                "argument --fan_out: not allowed with --group_size or --line_width"
+            )
+        return args
 
     def _custom_arguments(self) -> argparse.ArgumentParser:
         """
@@ -218,6 +307,36 @@ class MainFunctionClassical(object):
             "-d", "--decrypt", action="store_true", default=False, help=help_decrypt
         )
 
+        help_binary: str = "process data as raw bytes instead of text"
+        parser.add_argument(
+            "-b", "--binary", action="store_true", default=False, help=help_binary
+        )
+
+        help_group_size: str = "write cipher text in groups of this many letters"
+        parser.add_argument(
+            "-gs", "--group_size", type=int, default=0, help=help_group_size
+        )
+
+        help_line_width: str = "largest number of characters in a cipher text line"
+        parser.add_argument(
+            "-lw", "--line_width", type=int, default=0, help=help_line_width
+        )
+
+        help_fan_out: str = "translate the input once with --key and each of "
+        help_fan_out += "these keys, into --output with {} replaced by the key"
+        parser.add_argument("--fan_out", nargs="+", metavar="KEY", help=help_fan_out)
+
+        help_workers: str = "number of processes for building tables of fan out, "
+        help_workers += "0 for number of CPUs, default is 1 (this process)"
+        parser.add_argument("--workers", type=int, default=1, help=help_workers)
+
+        help_disk_cache: str = (
+            "keep compiled tables in $XDG_CACHE_HOME/mersad for later runs"
+        )
+        parser.add_argument(
+            "--disk_cache", action="store_true", default=False, help=help_disk_cache
+        )
+
         # display version.
         version: str = f"Azadeh Afzar - Mersad Cryptography Library v{__version__}"
         parser.add_argument("-V", "--version", action="version", version=version)
@@ -243,8 +362,8 @@ def monoalphabetic_common_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "-l",
         "--letters",
-        type=str,
-        default=string.printable.replace("\r", ""),
+        type=Alphabet,
+        default=DEFAULT_ALPHABET,
         help=help_letters,
     )
 
@@ -256,4 +375,27 @@ def monoalphabetic_common_parser() -> argparse.ArgumentParser:
     help_seed: str = "specify random seed for shuffling the alphabet letters"
     parser.add_argument("-s", "--seed", type=int, default=0, help=help_seed)
 
+    help_preserve_case: str = "encrypt both cases of letters and keep their case"
+    parser.add_argument(
+        "-pc",
+        "--preserve_case",
+        action="store_true",
+        default=False,
+        help=help_preserve_case,
+    )
+
+    help_fold_case: str = "encrypt both cases of letters like alphabet letters"
+    parser.add_argument(
+        "-fc", "--fold_case", action="store_true", default=False, help=help_fold_case
+    )
+
+    help_strip_unknown: str = "delete letters which aren't in alphabet"
+    parser.add_argument(
+        "-su",
+        "--strip_unknown",
+        action="store_true",
+        default=False,
+        help=help_strip_unknown,
+    )
+
     return parser
@@ -6,6 +6,7 @@
 import argparse
 from typing import Any
 from typing import List
+from typing import Optional
 from typing import Type
 from typing import TypeVar
 
@@ -29,10 +30,11 @@ class MainFunctionClassical:
         predefined_parser: argparse.ArgumentParser,
     ) -> None: ...
     def process(self) -> None: ...
+    def _fan_out(self, args: argparse.Namespace) -> None: ...
     def _config_agent(
         self, agent: Type[MCLCryptClass], args: argparse.Namespace
     ) -> None: ...
-    def _parse_args(self) -> argparse.Namespace: ...
+    def _parse_args(self, extra: Optional[List[str]] = ...) -> argparse.Namespace: ...
     def _custom_arguments(self) -> argparse.ArgumentParser: ...
     @staticmethod
     def _base_parser() -> argparse.ArgumentParser: ...
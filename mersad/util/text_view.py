@@ -0,0 +1,223 @@
+# mersad/util/text_view.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.text_view module.
+=============================
+
+Monoalphabetic ciphers translate every letter on its own, so letter i
+of the translated text only depends on letter i of the text.
+
+TranslatedView is a lazy sequence over a text (string, binary data or
+a memory mapped file) which translates only the parts that are read.
+The text is split into windows of a fixed size, every read window is
+translated once and kept in a small LRU cache, so paging through a
+large cipher text costs only the pages that are shown.
+
+Example
+=======
+
+>>> from mersad.classical.shift_cipher import ShiftCipher
+>>> agent = ShiftCipher(key=3, letter_sequence="abcdefghijklmnopqrstuvwxyz")
+>>> view = agent.view("Hdlo Jxolxv Cdhvdu.", decrypt=True)
+>>> view[:4]
+'Hail'
+>>> len(view)
+19
+
+"""
+
+# Python Standard Library
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Sequence
+from typing import Union
+
+# Mersad Library
+from mersad.util.table_cache import LRUCache
+from mersad.util.translation_engine import CHUNK_SIZE
+from mersad.util.translation_engine import TEXT_TYPE
+from mersad.util.translation_engine import TranslationTable
+
+# define type aliases.
+SOURCE_TYPE = Union[str, bytes, bytearray, memoryview, Any]
+
+# number of translated windows kept by a view.
+DEFAULT_WINDOWS: int = 16
+
+
+class TranslatedView(Sequence):
+    """
+    Lazy read only sequence of a translated text.
+
+    Indexing returns a letter (an integer for binary data) and slicing
+    returns a translated string (or bytes), like the translated text.
+    """
+
+    def __init__(
+        self,
+        text: SOURCE_TYPE,
+        table: TranslationTable,
+        apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE],
+        window_size: int = CHUNK_SIZE,
+        windows: int = DEFAULT_WINDOWS,
+    ) -> None:
+        """
+        Create an instance of the class.
+
+        :param text         : string or binary data (bytes, bytearray,
+                              memoryview or mmap) to be translated.
+        :param table        : compiled translation table.
+        :param apply_table  : function for translating text with table.
+        :param window_size  : number of letters translated at once.
+        :param windows      : number of translated windows kept in cache.
+        :raise ValueError   : if table isn't a translation table, or it
+                              deletes letters, so positions would shift.
+        """
+        if not isinstance(table, TranslationTable) or table.deletes():
+            raise ValueError(
+                "ERROR: only translation tables which keep every letter "
+                "can be viewed lazily."
+            )
+        if window_size < 1 or windows < 1:
+            raise ValueError("ERROR: window size and windows must be positive.")
+        self.text: SOURCE_TYPE = text
+        self.table: TranslationTable = table
+        self.window_size: int = window_size
+        self._apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE] = apply_table
+        self._windows: LRUCache = LRUCache(max_entries=windows, max_bytes=None)
+
+    def __repr__(self) -> str:
+        """Return the objects info as string."""
+        return "TranslatedView(length={0}, window_size={1})".format(
+            len(self), self.window_size
+        )
+
+    def __len__(self) -> int:
+        """Return length of the text."""
+        return len(self.text)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Return a translated letter or a translated slice of the text.
+
+        Slices within a few windows are assembled from cached windows,
+        longer slices are translated directly without caching.
+
+        :param index        : position or slice.
+        :raise IndexError   : if position is out of range.
+        :return             : translated letter or text.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1 or stop - start > self.window_size * 2:
+                return self._translate(self.text[index])
+            if stop <= start:
+                return self._translate(self.text[0:0])
+            first: int = start // self.window_size
+            last: int = (stop - 1) // self.window_size
+            offset: int = first * self.window_size
+            joined: TEXT_TYPE = self._window(first)
+            for window in range(first + 1, last + 1):
+                joined += self._window(window)
+            return joined[start - offset:stop - offset]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TranslatedView index out of range")
+        return self._window(index // self.window_size)[index % self.window_size]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over translated letters, window by window."""
+        for window in self.windows():
+            yield from window
+
+    def windows(self) -> Iterator[TEXT_TYPE]:
+        """
+        Iterate over translated windows of the text from start to end.
+
+        Windows which are read in order aren't cached, so reading the whole
+        view doesn't evict windows of random accesses.
+
+        :return : translated windows.
+        :rtype  : iterator
+        """
+        for index in range(-(-len(self) // self.window_size)):
+            window: Any = self._windows.get(index)
+            if window is None:
+                window = self._translate_window(index)
+            yield window
+
+    def _window(self, index: int) -> TEXT_TYPE:
+        """
+        Return a translated window, it is translated on first access.
+
+        :param index    : number of window.
+        :return         : translated window.
+        :rtype          : str or bytes
+        """
+        return self._windows.fetch(index, self._translate_window, index)
+
+    def _translate_window(self, index: int) -> TEXT_TYPE:
+        """
+        Translate a window of the text.
+
+        :param index    : number of window.
+        :return         : translated window.
+        :rtype          : str or bytes
+        """
+        start: int = index * self.window_size
+        return self._translate(self.text[start:start + self.window_size])
+
+    def _translate(self, text: SOURCE_TYPE) -> TEXT_TYPE:
+        """
+        Translate a part of the text, memoryviews are copied into bytes.
+
+        :param text : part of the text.
+        :return     : translated part.
+        :rtype      : str or bytes
+        """
+        if isinstance(text, memoryview):
+            text = text.tobytes()
+        return self._apply_table(text, self.table)
@@ -0,0 +1,40 @@
+# Stubs for mersad.util.text_view (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Sequence
+from typing import Union
+
+# Mersad Library
+from mersad.util.table_cache import LRUCache
+from mersad.util.translation_engine import TEXT_TYPE
+from mersad.util.translation_engine import TranslationTable
+
+SOURCE_TYPE = Union[str, bytes, bytearray, memoryview, Any]
+DEFAULT_WINDOWS: int
+
+class TranslatedView(Sequence[str]):
+    text: SOURCE_TYPE = ...
+    table: TranslationTable = ...
+    window_size: int = ...
+    _windows: LRUCache = ...
+    def __init__(
+        self,
+        text: SOURCE_TYPE,
+        table: TranslationTable,
+        apply_table: Callable[[TEXT_TYPE, Any], TEXT_TYPE],
+        window_size: int = ...,
+        windows: int = ...,
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: Union[int, slice]) -> Any: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def windows(self) -> Iterator[TEXT_TYPE]: ...
+    def _window(self, index: int) -> TEXT_TYPE: ...
+    def _translate_window(self, index: int) -> TEXT_TYPE: ...
+    def _translate(self, text: SOURCE_TYPE) -> TEXT_TYPE: ...
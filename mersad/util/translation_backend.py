@@ -0,0 +1,464 @@
+# mersad/util/translation_backend.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.translation_backend module.
+=======================================
+
+The module contains interchangeable backends which translate
+texts with compiled translation tables of monoalphabetic ciphers.
+
+Available backends are:
+    - python : letter by letter loop, the reference implementation.
+    - str    : str.translate.
+    - bytes  : bytes.translate with a 256-entry table.
+    - numpy  : vectorized look up with NumPy (only if NumPy is installed).
+
+translate function selects a backend by type and length of the text,
+str.translate is very fast for ASCII texts but slow for other letters,
+so NumPy is only selected for long non-ASCII texts, where it pays for
+its conversion overhead. Minimum lengths are kept in THRESHOLDS and
+can be calibrated on the running machine with calibrate function.
+
+Example
+=======
+
+>>> from mersad.util import translation_backend
+>>> # always use NumPy, even for short texts.
+>>> translation_backend.pin_backend("numpy")
+>>> # go back to automatic selection.
+>>> translation_backend.pin_backend(None)
+
+"""
+
+# Python Standard Library
+import timeit
+import weakref
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# 3rd Party Library
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Mersad Library
+from mersad.util import translation_engine
+from mersad.util.table_cache import LRUCache
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
+
+# minimum length of a text, per backend and kind of text ("ascii" string,
+# other "str" or "bytes"), for selecting a backend automatically.
+# None means the backend is never selected automatically.
+THRESHOLDS: Dict[Tuple[str, str], Optional[int]] = {
+    ("str", "ascii"): 0,
+    ("str", "str"): 0,
+    ("bytes", "bytes"): 0,
+    ("numpy", "ascii"): None,
+    ("numpy", "str"): 256,
+    ("numpy", "bytes"): None,
+}
+# maximum number and memory (in bytes) of look up arrays of NumPy backend.
+LOOKUP_CACHE_SIZE: int = 8
+LOOKUP_CACHE_BYTES: int = 16 * 1024 * 1024
+
+
+class TranslationBackend(object):
+    """
+    Base class for translation backends.
+
+    Sub-classes should override self.translate method and
+    set name and kinds (kinds of text they can translate).
+    """
+
+    name: str = ""
+    kinds: Tuple[str, ...] = ()
+
+    def available(self) -> bool:
+        """
+        Check if the backend can be used in this process.
+
+        :return : True if the backend's requirements are installed.
+        :rtype  : bool
+        """
+        return True
+
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE:
+        """
+        Translate a string or binary data with a compiled translation table.
+
+        This method should be implemented in subclasses.
+
+        :param text     : string or binary data to be translated.
+        :param table    : compiled translation table.
+        :return         : translated text.
+        :rtype          : str, bytes or bytearray
+        """
+        raise NotImplementedError
+
+
+class PythonBackend(TranslationBackend):
+    """Translate letter by letter in pure Python, slow but simple."""
+
+    name: str = "python"
+    kinds: Tuple[str, ...] = ("ascii", "str", "bytes")
+
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE:
+        """Translate text with the reference loop of translation engine."""
+        if isinstance(text, str):
+            return translation_engine.reference_translate(text, table)
+        return type(text)(
+            table.bytes_table[byte] for byte in text if not table.deletes(byte)
+        )
+
+
+class StrBackend(TranslationBackend):
+    """Translate strings with str.translate."""
+
+    name: str = "str"
+    kinds: Tuple[str, ...] = ("ascii", "str")
+
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE:
+        """Translate a string with translation engine."""
+        return translation_engine.translate(text, table)
+
+
+class BytesBackend(TranslationBackend):
+    """Translate binary data with bytes.translate."""
+
+    name: str = "bytes"
+    kinds: Tuple[str, ...] = ("bytes",)
+
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE:
+        """Translate binary data with translation engine."""
+        return translation_engine.translate(text, table)
+
+
+class NumpyBackend(TranslationBackend):
+    """
+    Translate texts with vectorized NumPy look ups.
+
+    Strings are converted to arrays of code points (UTF-32) and every
+    code point is looked up in a dense array that covers code points
+    of the table, the dense array is built on first use and kept in
+    LOOKUP_CACHE for later calls.
+    """
+
+    name: str = "numpy"
+    kinds: Tuple[str, ...] = ("ascii", "str", "bytes")
+
+    def available(self) -> bool:
+        """Check if NumPy is installed."""
+        return numpy is not None
+
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE:
+        """Translate text with a NumPy look up table."""
+        if table.deletes():
+            # look ups can't delete letters, tables which delete letters
+            # are translated with translation engine.
+            return translation_engine.translate(text, table)
+        if not isinstance(text, str):
+            lookup: Any = numpy.frombuffer(table.bytes_table, dtype=numpy.uint8)
+            return type(text)(lookup[numpy.frombuffer(text, dtype=numpy.uint8)])
+
+        lookup = self.lookup_table(table)
+        codes: Any = numpy.frombuffer(
+            text.encode("utf-32-le", "surrogatepass"), dtype=numpy.uint32
+        )
+        translated: Any = codes.copy()
+        # code points above the table remain unchanged.
+        mask: Any = codes < len(lookup)
+        translated[mask] = lookup[codes[mask]]
+        return translated.tobytes().decode("utf-32-le", "surrogatepass")
+
+    @staticmethod
+    def lookup_table(table: TABLE_TYPE) -> Any:
+        """
+        Return the dense look up array of a table.
+
+        Arrays are kept in LOOKUP_CACHE, which holds the tables only by
+        weak references and is limited in number of entries and memory,
+        like expanded compact tables of translation engine.
+
+        :param table    : compiled translation table.
+        :return         : array which maps every code point up to the largest
+                          code point of table to its translated code point.
+        :rtype          : numpy.ndarray
+        """
+        entry: Any = LOOKUP_CACHE.get(id(table))
+        if entry is None or entry[0]() is not table:
+            # ids are reused after a table is freed, so the reference is checked.
+            size: int = max(table, default=-1) + 1
+            lookup: Any = numpy.arange(size, dtype=numpy.uint32)
+            keys: Any = numpy.fromiter(table.keys(), dtype=numpy.uint32)
+            lookup[keys] = numpy.fromiter(table.values(), dtype=numpy.uint32)
+            entry = (weakref.ref(table), lookup)
+            LOOKUP_CACHE.put(id(table), entry)
+        return entry[1]
+
+
+def _lookup_size(entry: Tuple[Any, Any]) -> int:
+    """
+    Estimate memory used by a look up array in bytes.
+
+    :param entry    : weak reference to table and its look up array.
+    :return         : size of array in bytes.
+    :rtype          : int
+    """
+    return int(entry[1].nbytes)
+
+
+# look up arrays of NumPy backend by id of table, see NumpyBackend.lookup_table.
+LOOKUP_CACHE: LRUCache = LRUCache(
+    LOOKUP_CACHE_SIZE, LOOKUP_CACHE_BYTES, _lookup_size
+)
+
+
+# registered backends by name, in order of registration.
+BACKENDS: Dict[str, TranslationBackend] = dict()
+
+# name of the backend which is used for every text, None for automatic selection.
+_pinned: Optional[str] = None
+
+
+def register_backend(backend: TranslationBackend) -> None:
+    """
+    Register a backend, a backend with the same name is replaced.
+
+    :param backend  : the backend to be registered.
+    """
+    BACKENDS[backend.name] = backend
+
+
+def pin_backend(name: Optional[str]) -> None:
+    """
+    Use one backend for every text instead of automatic selection.
+
+    :param name         : name of backend, None for automatic selection.
+    :raise ValueError   : if backend isn't registered or isn't available.
+    """
+    global _pinned
+    if name is not None:
+        _get_backend(name)
+    _pinned = name
+
+
+def text_kind(text: TEXT_TYPE) -> str:
+    """
+    Return kind of a text for selecting a backend.
+
+    :param text : string or binary data.
+    :return     : "ascii" for ASCII strings, "str" for other strings
+                  and "bytes" for binary data.
+    :rtype      : str
+    """
+    if not isinstance(text, str):
+        return "bytes"
+    # str.isascii is added in python 3.7.
+    if hasattr(text, "isascii"):
+        return "ascii" if text.isascii() else "str"
+    return "ascii" if max(text, default=" ") < "\x80" else "str"
+
+
+def select_backend(
+    text: TEXT_TYPE, backend: Optional[str] = None
+) -> TranslationBackend:
+    """
+    Select the backend which translates a text.
+
+    An explicit backend wins over the pinned backend, which wins over the
+    automatic selection. A pinned backend that can't translate this kind
+    of text is ignored. Automatically the available backend with the
+    largest threshold that the text length reaches is selected.
+
+    :param text         : string or binary data to be translated.
+    :param backend      : name of backend to use, None for default.
+    :raise ValueError   : if backend isn't registered, isn't available
+                          or can't translate this kind of text.
+    :return             : selected backend.
+    :rtype              : TranslationBackend
+    """
+    # type annotations
+    kind: str = text_kind(text)
+    selected: Optional[TranslationBackend] = None
+    selected_threshold: int = -1
+
+    if backend is not None:
+        selected = _get_backend(backend)
+        if kind not in selected.kinds:
+            raise ValueError(
+                "ERROR: translation backend {!r} can't translate {} texts.".format(
+                    backend, kind
+                )
+            )
+        return selected
+    if _pinned is not None and kind in BACKENDS[_pinned].kinds:
+        return BACKENDS[_pinned]
+
+    for candidate in BACKENDS.values():
+        threshold: Optional[int] = THRESHOLDS.get((candidate.name, kind))
+        if (
+            kind in candidate.kinds
+            and threshold is not None
+            and selected_threshold < threshold <= len(text)
+            and candidate.available()
+        ):
+            selected, selected_threshold = candidate, threshold
+    if selected is None:
+        raise ValueError("ERROR: no translation backend for {} texts.".format(kind))
+    return selected
+
+
+def translate(
+    text: TEXT_TYPE, table: TABLE_TYPE, backend: Optional[str] = None
+) -> TEXT_TYPE:
+    """
+    Translate a string or binary data with the selected backend.
+
+    :param text         : string or binary data to be translated.
+    :param table        : compiled translation table.
+    :param backend      : name of backend to use, None for default.
+    :raise ValueError   : if backend isn't registered or isn't available.
+    :return             : translated text.
+    :rtype              : str, bytes or bytearray
+    """
+    return select_backend(text, backend).translate(text, table)
+
+
+def calibrate(
+    sizes: Sequence[int] = (16, 64, 256, 1024, 4096, 16384, 65536), repeat: int = 5
+) -> Dict[Tuple[str, str], Optional[int]]:
+    """
+    Measure backends on this machine and update THRESHOLDS.
+
+    For every kind of text, each available backend that is selected
+    automatically is timed against the default backend of that kind
+    (threshold 0), its threshold becomes the smallest size from which
+    it is always faster, or None if it never is.
+
+    :param sizes    : ascending lengths of texts to be measured.
+    :param repeat   : number of measurements of each length.
+    :return         : updated thresholds.
+    :rtype          : dict
+    """
+    # sample alphabets of each kind and their tables.
+    alphabets: Dict[str, str] = dict(
+        ascii="".join(map(chr, range(32, 127))),
+        str="".join(map(chr, range(0x0600, 0x0700))),
+        bytes="".join(map(chr, range(256))),
+    )
+
+    for kind, alphabet in alphabets.items():
+        table: TABLE_TYPE = translation_engine.compile_sequences(
+            alphabet, alphabet[1:] + alphabet[:1]
+        )
+        defaults: List[TranslationBackend] = [
+            i for i in BACKENDS.values() if THRESHOLDS.get((i.name, kind)) == 0
+        ]
+        for backend in BACKENDS.values():
+            if (
+                backend in defaults
+                or (backend.name, kind) not in THRESHOLDS
+                or not backend.available()
+            ):
+                continue
+            threshold: Optional[int] = None
+            for size in sizes:
+                text: TEXT_TYPE = (alphabet * (size // len(alphabet) + 1))[:size]
+                if kind == "bytes":
+                    text = text.encode("latin-1")
+                faster: bool = all(
+                    _measure(backend, text, table, repeat)
+                    < _measure(default, text, table, repeat)
+                    for default in defaults
+                )
+                if not faster:
+                    threshold = None
+                elif threshold is None:
+                    threshold = size
+            THRESHOLDS[(backend.name, kind)] = threshold
+    return THRESHOLDS
+
+
+def _measure(
+    backend: TranslationBackend, text: TEXT_TYPE, table: TABLE_TYPE, repeat: int
+) -> float:
+    """Return the best time of translating a text with a backend."""
+    # translate once so lazily built tables aren't measured.
+    backend.translate(text, table)
+    return min(
+        timeit.repeat(
+            lambda: backend.translate(text, table), number=10, repeat=repeat
+        )
+    )
+
+
+def _get_backend(name: str) -> TranslationBackend:
+    """
+    Return a registered and available backend by its name.
+
+    :param name         : name of backend.
+    :raise ValueError   : if backend isn't registered or isn't available.
+    :return             : the backend.
+    :rtype              : TranslationBackend
+    """
+    if name not in BACKENDS:
+        raise ValueError("ERROR: unknown translation backend {!r}.".format(name))
+    if not BACKENDS[name].available():
+        raise ValueError(
+            "ERROR: translation backend {!r} isn't available.".format(name)
+        )
+    return BACKENDS[name]
+
+
+register_backend(PythonBackend())
+register_backend(StrBackend())
+register_backend(BytesBackend())
+register_backend(NumpyBackend())
@@ -0,0 +1,72 @@
+# Stubs for mersad.util.translation_backend (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# Mersad Library
+from mersad.util.table_cache import LRUCache
+from mersad.util.translation_engine import TABLE_TYPE
+from mersad.util.translation_engine import TEXT_TYPE
+
+THRESHOLDS: Dict[Tuple[str, str], Optional[int]]
+LOOKUP_CACHE_SIZE: int
+LOOKUP_CACHE_BYTES: int
+
+class TranslationBackend:
+    name: str = ...
+    kinds: Tuple[str, ...] = ...
+    def available(self) -> bool: ...
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE: ...
+
+class PythonBackend(TranslationBackend):
+    name: str = ...
+    kinds: Tuple[str, ...] = ...
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE: ...
+
+class StrBackend(TranslationBackend):
+    name: str = ...
+    kinds: Tuple[str, ...] = ...
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE: ...
+
+class BytesBackend(TranslationBackend):
+    name: str = ...
+    kinds: Tuple[str, ...] = ...
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE: ...
+
+class NumpyBackend(TranslationBackend):
+    name: str = ...
+    kinds: Tuple[str, ...] = ...
+    def available(self) -> bool: ...
+    def translate(self, text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE: ...
+    @staticmethod
+    def lookup_table(table: TABLE_TYPE) -> Any: ...
+
+def _lookup_size(entry: Tuple[Any, Any]) -> int: ...
+
+LOOKUP_CACHE: LRUCache
+
+BACKENDS: Dict[str, TranslationBackend]
+_pinned: Optional[str]
+
+def register_backend(backend: TranslationBackend) -> None: ...
+def pin_backend(name: Optional[str]) -> None: ...
+def text_kind(text: TEXT_TYPE) -> str: ...
+def select_backend(
+    text: TEXT_TYPE, backend: Optional[str] = ...
+) -> TranslationBackend: ...
+def translate(
+    text: TEXT_TYPE, table: TABLE_TYPE, backend: Optional[str] = ...
+) -> TEXT_TYPE: ...
+def calibrate(
+    sizes: Sequence[int] = ..., repeat: int = ...
+) -> Dict[Tuple[str, str], Optional[int]]: ...
+def _measure(
+    backend: TranslationBackend, text: TEXT_TYPE, table: TABLE_TYPE, repeat: int
+) -> float: ...
+def _get_backend(name: str) -> TranslationBackend: ...
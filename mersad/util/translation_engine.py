@@ -0,0 +1,795 @@
+# mersad/util/translation_engine.py
+#
+# This file is a part of:
+# Azadeh Afzar - Mersad Cryptography Library in Python language (AA-MCLpy).
+#
+# Copyright (C) 2019 Azadeh Afzar
+# Copyright (C) 2019 Mohammad Mahdi Baghbani Pourvahid
+#
+# GNU AFFERO GENERAL PUBLIC LICENSE
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or (at
+# your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ZLIB LICENSE
+#
+# Permission is granted to anyone to use this software for any purpose,
+# including commercial applications, and to alter it and redistribute it
+# freely, subject to the following restrictions:
+#
+# 1. The origin of this software must not be misrepresented; you must not
+# claim that you wrote the original software. If you use this software
+# in a product, an acknowledgement in the product documentation would be
+# appreciated but is not required.
+#
+# 2. Altered source versions must be plainly marked as such, and must not be
+# misrepresented as being the original software.
+#
+# 3. This notice may not be removed or altered from any source distribution.
+#
+
+"""
+Azadeh Afzar - Mersad Cryptography Library.
+
+mersad.util.translation_engine module.
+======================================
+
+The module contains the shared translation engine of
+monoalphabetic ciphers.
+
+Monoalphabetic ciphers map every letter of their alphabet
+to exactly one other letter, so each configuration can be
+compiled once into a str.translate table and the whole text
+can be translated in a single pass.
+
+Binary data (bytes and bytearray) is translated with a 256-entry
+bytes.translate table derived from the same compiled table, every
+byte is treated as the letter with the same code point (latin-1),
+so b"abc" and "abc" describe the same alphabet.
+
+Tables of large alphabets (whole Unicode blocks) are stored as
+CompactTranslationTable, contiguous ranges of code points are kept
+in arrays with an offset and only scattered letters are kept in a
+dictionary, which takes a fraction of the memory of a dictionary.
+
+Normalizing text (folding case, stripping letters which aren't in the
+alphabet) is compiled into the same table, letters mapped to None are
+deleted by str.translate and bytes.translate in the translating pass.
+
+"""
+
+# Python Standard Library
+import sys
+import weakref
+from array import array
+from bisect import bisect_right
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Sequence
+from typing import Set
+from typing import Union
+
+# Mersad Library
+from mersad.util.table_cache import TABLE_CACHE
+from mersad.util.table_cache import LRUCache
+from mersad.util.table_cache import estimate_size
+
+# define type aliases.
+TEXT_TYPE = Union[str, bytes, bytearray]
+BUFFER_TYPE = Union[bytes, bytearray, memoryview]
+
+# number of bytes translated at once by translate_into function.
+CHUNK_SIZE: int = 64 * 1024
+
+# tables with fewer entries than this are never compacted.
+COMPACT_THRESHOLD: int = 1024
+
+# contiguous code points shorter than this are kept in the dictionary.
+MINIMUM_RUN: int = 32
+
+# limits of expanded compact tables kept for translating long texts.
+EXPANSION_CACHE_SIZE: int = 8
+EXPANSION_CACHE_BYTES: int = 16 * 1024 * 1024
+
+
+class TranslationTable(dict):
+    """
+    Compiled translation table of a monoalphabetic cipher.
+
+    The table maps code point of every letter in alphabet to code point
+    of its translated letter and can be used directly by str.translate.
+    A letter mapped to None is deleted from translated text.
+    """
+
+    def __init__(self, *args: Any) -> None:
+        """Create a table from a code point to code point dictionary or pairs."""
+        super().__init__(*args)
+        self._bytes_table: Optional[bytes] = None
+        self._bytes_delete: Optional[bytes] = None
+
+    @property
+    def bytes_table(self) -> bytes:
+        """
+        Return the 256-entry table of bytes.translate for this table.
+
+        The table is built on first use and kept for later calls.
+
+        :raise ValueError   : if a byte is translated to a letter outside
+                              of byte range (code point above 255).
+        :return             : table which can be used by bytes.translate.
+        :rtype              : bytes
+        """
+        if self._bytes_table is None:
+            table: bytearray = bytearray(range(256))
+            for letter, translated in self.items():
+                if letter > 255 or translated is None:
+                    # this letter can't appear in binary data or is deleted.
+                    continue
+                if translated > 255:
+                    raise ValueError(
+                        "ERROR: alphabet must only contain letters in byte range "
+                        + "(latin-1) for translating binary data."
+                    )
+                table[letter] = translated
+            self._bytes_table = bytes(table)
+        return self._bytes_table
+
+    @property
+    def bytes_delete(self) -> bytes:
+        """
+        Return the bytes which are deleted from translated binary data.
+
+        :return : bytes which can be used as delete argument of bytes.translate.
+        :rtype  : bytes
+        """
+        if self._bytes_delete is None:
+            self._bytes_delete = bytes(
+                letter for letter in range(256) if self.deletes(letter)
+            )
+        return self._bytes_delete
+
+    def deletes(self, letter: Optional[int] = None) -> bool:
+        """
+        Check if the table deletes a letter, or any letter if letter is None.
+
+        :param letter   : code point of letter.
+        :return         : True if letter is deleted from translated text.
+        :rtype          : bool
+        """
+        if letter is None:
+            return None in dict.values(self)
+        return letter in self and self[letter] is None
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the table with its attributes, e.g. runs of a compact table.
+
+        Tables derived from this table (e.g. by grouping module) are left
+        out, they are rebuilt on first use.
+        """
+        state: Dict[str, Any] = {
+            i: j for (i, j) in self.__dict__.items() if i != "_ungrouped_table"
+        }
+        return _restore_table, (type(self), dict(dict.items(self))), state
+
+
+class CompactTranslationTable(TranslationTable):
+    """
+    Compiled translation table which stores contiguous code points in arrays.
+
+    Every run of contiguous code points is stored as its first code point
+    and an array of translated code points, array('H') if they all fit in
+    two bytes and array('I') otherwise. Letters which aren't part of a long
+    run are stored in the dictionary itself.
+
+    The table behaves like a read-only TranslationTable and can be used
+    directly by str.translate, but translate function uses an expanded
+    dictionary when the text is longer than the table, which is faster
+    for long texts. Expanded dictionaries of the last used tables are
+    kept in a small cache with a memory limit, see expanded_table.
+    """
+
+    def __init__(self, *args: Any) -> None:
+        """Create a table from a code point to code point dictionary or pairs."""
+        super().__init__()
+        self._starts: List[int] = list()
+        self._runs: List[array] = list()
+        self._length: int = 0
+
+        # type annotations
+        pairs: Dict[int, int] = dict(*args)
+        keys: List[int] = sorted(pairs)
+        start: int = 0
+        end: int
+
+        # split sorted code points into runs of contiguous code points.
+        while start < len(keys):
+            end = start + 1
+            while end < len(keys) and keys[end] == keys[end - 1] + 1:
+                end += 1
+            if end - start < MINIMUM_RUN:
+                for key in keys[start:end]:
+                    dict.__setitem__(self, key, pairs[key])
+            else:
+                values: List[int] = [pairs[key] for key in keys[start:end]]
+                self._starts.append(keys[start])
+                kind: str = "H" if max(values) < 0x10000 else "I"
+                self._runs.append(array(kind, values))
+            start = end
+        self._length = len(keys)
+
+    @classmethod
+    def from_runs(
+        cls, pairs: Dict[int, int], starts: List[int], runs: List[array]
+    ) -> "CompactTranslationTable":
+        """
+        Create a table from its parts without splitting code points into runs.
+
+        :param pairs    : code points which aren't part of a run.
+        :param starts   : first code point of every run.
+        :param runs     : translated code points of every run.
+        :return         : compact table.
+        :rtype          : CompactTranslationTable
+        """
+        table: CompactTranslationTable = _restore_table(cls, pairs)
+        table._bytes_table = None
+        table._bytes_delete = None
+        table._starts = starts
+        table._runs = runs
+        table._length = len(pairs) + sum(map(len, runs))
+        return table
+
+    def __missing__(self, key: int) -> int:
+        """Look up a code point which isn't in the dictionary in the runs."""
+        index: int = bisect_right(self._starts, key) - 1
+        if index >= 0:
+            offset: int = key - self._starts[index]
+            if offset < len(self._runs[index]):
+                return self._runs[index][offset]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a code point is in the table."""
+        try:
+            self[key]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over code points of the table."""
+        return (key for key, _ in self.items())
+
+    def __len__(self) -> int:
+        """Return number of code points in the table."""
+        return self._length
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the table with a dictionary or another table."""
+        return dict(self.items()) == other
+
+    def __ne__(self, other: object) -> bool:
+        """Compare the table with a dictionary or another table."""
+        return not self == other
+
+    def __repr__(self) -> str:
+        """Return representation of the table."""
+        return "{}({!r})".format(type(self).__name__, dict(self.items()))
+
+    def __sizeof__(self) -> int:
+        """Return memory used by the table, its runs and its dictionary."""
+        return (
+            super().__sizeof__()
+            + sys.getsizeof(self._starts)
+            + sum(map(sys.getsizeof, self._runs))
+        )
+
+    def get(self, key: int, default: Any = None) -> Any:
+        """Return translated code point of a code point or default."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Iterable[int]:  # type: ignore
+        """Return code points of the table."""
+        return list(self)
+
+    def values(self) -> Iterable[int]:  # type: ignore
+        """Return translated code points of the table."""
+        return [value for _, value in self.items()]
+
+    def items(self) -> Iterable[Tuple[int, int]]:  # type: ignore
+        """Return code point and translated code point pairs of the table."""
+        pairs: List[Tuple[int, int]] = list(dict.items(self))
+        for start, run in zip(self._starts, self._runs):
+            pairs.extend(zip(range(start, start + len(run)), run))
+        return pairs
+
+    def expand(self) -> Dict[int, int]:
+        """
+        Expand the table into a plain dictionary.
+
+        :return : dictionary which has every pair of the table.
+        :rtype  : dict
+        """
+        return dict(self.items())
+
+
+class StrippingTranslationTable(TranslationTable):
+    """
+    Compiled translation table which deletes every letter it doesn't have.
+
+    str.translate calls __missing__ for letters which aren't in the table,
+    it returns None, so they are deleted in the same pass that translates
+    letters of the table.
+    """
+
+    def __missing__(self, key: int) -> None:
+        """Delete letters which aren't in the table."""
+        return None
+
+    def deletes(self, letter: Optional[int] = None) -> bool:
+        """
+        Check if the table deletes a letter, or any letter if letter is None.
+
+        :param letter   : code point of letter.
+        :return         : True if letter is deleted from translated text.
+        :rtype          : bool
+        """
+        return letter is None or self[letter] is None
+
+
+# define type aliases.
+TABLE_TYPE = TranslationTable
+
+
+def _restore_table(cls: type, pairs: Dict[int, int]) -> TABLE_TYPE:
+    """
+    Create an empty table of a class for unpickling.
+
+    Attributes of table (e.g. runs of a compact table) are set by pickle.
+
+    :param cls      : class of table.
+    :param pairs    : pairs stored in the dictionary of table.
+    :return         : new table.
+    :rtype          : TranslationTable
+    """
+    table: TABLE_TYPE = dict.__new__(cls)
+    dict.update(table, pairs)
+    return table
+
+
+def compact_table(table: TABLE_TYPE) -> TABLE_TYPE:
+    """
+    Store a large translation table in compact form.
+
+    Tables with less than COMPACT_THRESHOLD entries, tables with no
+    runs of contiguous code points and tables which delete letters
+    are returned unchanged.
+
+    :param table    : compiled translation table.
+    :return         : compact or the same table.
+    :rtype          : TranslationTable
+    """
+    if (
+        isinstance(table, CompactTranslationTable)
+        or len(table) < COMPACT_THRESHOLD
+        or table.deletes()
+    ):
+        return table
+    compact: CompactTranslationTable = CompactTranslationTable(table)
+    if not compact._runs:
+        return table
+    return compact
+
+
+def compile_table(mapping: Dict[str, str]) -> TABLE_TYPE:
+    """
+    Compile a letter to letter mapping into a translation table.
+
+    :param mapping  : dictionary that maps every letter in alphabet
+                      to its translated letter.
+    :return         : table which can be used by str.translate.
+    :rtype          : TranslationTable
+    """
+    return TranslationTable(
+        {ord(letter): ord(translated) for letter, translated in mapping.items()}
+    )
+
+
+def compile_sequences(plain: str, translated: Sequence[str]) -> TABLE_TYPE:
+    """
+    Compile two aligned sequences into a translation table.
+
+    The n-th letter of plain is translated to the n-th letter of translated,
+    if a letter repeats in plain, its first occurrence is used. The table is
+    built in linear time, so it is suitable for very large alphabets.
+
+    :param plain        : alphabet of the text.
+    :param translated   : translated letter of each letter of plain.
+    :return             : table which can be used by str.translate.
+    :rtype              : TranslationTable
+    """
+    # zip reversed sequences so the first occurrence of a letter is written last.
+    pairs: Iterator[Tuple[int, int]] = zip(
+        map(ord, reversed(plain)), map(ord, reversed(translated))
+    )
+    return compact_table(TranslationTable(pairs))
+
+
+def invert_table(table: TABLE_TYPE) -> TABLE_TYPE:
+    """
+    Create the inverse of a translation table.
+
+    Translation tables of monoalphabetic ciphers are permutations of
+    their alphabet, so the decryption table is the encryption table
+    read backwards and can be built in linear time.
+
+    :param table    : compiled translation table.
+    :return         : table that translates back what table translates.
+    :rtype          : TranslationTable
+    """
+    return compact_table(TranslationTable({j: i for (i, j) in table.items()}))
+
+
+def case_preserving_table(table: TABLE_TYPE) -> TABLE_TYPE:
+    """
+    Extend a translation table to translate the other case of its letters.
+
+    A letter whose other case isn't in the alphabet is translated like
+    its alphabet letter and keeps its case, e.g. with a lowercase alphabet
+    "A" is translated to the uppercase of what "a" is translated to. The
+    other case of a letter and of its translation must both be outside of
+    the alphabet (and single letters). Letters which aren't in the table
+    are left unchanged, so the other case of a letter is only added if
+    the added letters are translated among themselves, e.g. with alphabet
+    "0123456789abc...z" "Z" would be translated to "0", so neither "Z"
+    nor "Y" (translated to "Z") are added. Extending the inverse of a
+    table gives the inverse of the extended table.
+
+    :param table    : compiled translation table.
+    :return         : table that translates both cases of letters.
+    :rtype          : TranslationTable
+    """
+    pairs: List[Tuple[int, int]] = list(table.items())
+    extension: Dict[int, int] = dict()
+    # the other case of two letters may be the same letter (e.g. "K" and
+    # Kelvin sign), such letters and their translations are left out.
+    repeated: Set[int] = set()
+    for letter, translated in pairs:
+        other: str = chr(letter).swapcase()
+        other_translated: str = chr(translated).swapcase()
+        if len(other) != 1 or len(other_translated) != 1:
+            continue
+        if ord(other) in table or ord(other_translated) in table:
+            continue
+        if ord(other) in extension:
+            repeated.add(ord(other))
+        extension[ord(other)] = ord(other_translated)
+    values: Dict[int, int] = dict()
+    for letter, translated in extension.items():
+        values[translated] = values.get(translated, 0) + 1
+    extension = {
+        letter: translated
+        for (letter, translated) in extension.items()
+        if letter not in repeated and values[translated] == 1
+    }
+    # a letter translated out of the extension would collide with that
+    # unchanged letter, it's removed and so is the letter translated to it.
+    inverse: Dict[int, int] = {j: i for (i, j) in extension.items()}
+    removed: List[int] = [i for (i, j) in extension.items() if j not in extension]
+    while removed:
+        letter: int = removed.pop()
+        if extension.pop(letter, None) is not None and letter in inverse:
+            removed.append(inverse[letter])
+    pairs.extend(extension.items())
+    return compact_table(TranslationTable(pairs))
+
+
+def apply_table_options(
+    table: TABLE_TYPE, table_key: Tuple[Any, ...], **kwargs: Any
+) -> TABLE_TYPE:
+    """
+    Apply case and normalization options of a cipher to its table.
+
+    Options are compiled into the table, so they don't cost any extra
+    pass over the text. Derived tables are cached in the process-wide
+    table cache next to the table they are built from.
+
+    :param table                                : compiled translation table.
+    :param table_key                            : cache key of table.
+    :param kwargs:
+        preserve_case (optional)(default = False) : see case_preserving_table.
+        fold_case (optional)(default = False)     : see normalizing_table.
+        strip_unknown (optional)(default = False) : see normalizing_table.
+    :return                                     : table with options applied.
+    :rtype                                      : TranslationTable
+    """
+    preserve_case: bool = kwargs.get("preserve_case", False)
+    fold_case: bool = kwargs.get("fold_case", False)
+    strip_unknown: bool = kwargs.get("strip_unknown", False)
+    if preserve_case:
+        table = TABLE_CACHE.fetch(
+            (case_preserving_table, table_key), case_preserving_table, table
+        )
+    if fold_case or strip_unknown:
+        table = TABLE_CACHE.fetch(
+            (normalizing_table, table_key, preserve_case, fold_case, strip_unknown),
+            normalizing_table,
+            table,
+            fold_case,
+            strip_unknown,
+        )
+    return table
+
+
+def normalizing_table(
+    table: TABLE_TYPE, fold_case: bool, strip_unknown: bool
+) -> TABLE_TYPE:
+    """
+    Extend a translation table to normalize text while translating it.
+
+    With fold_case, a letter whose other case isn't in the alphabet is
+    translated like its alphabet letter (e.g. with an uppercase alphabet
+    "a" is translated like "A"), with strip_unknown every other letter
+    which isn't in the alphabet is deleted. Normalized tables can't be
+    inverted, decryption folds and strips with the decryption table.
+
+    :param table            : compiled translation table.
+    :param fold_case        : translate the other case of alphabet letters.
+    :param strip_unknown    : delete letters which aren't in the table.
+    :return                 : table that normalizes and translates text.
+    :rtype                  : TranslationTable
+    """
+    pairs: List[Tuple[int, int]] = list(table.items())
+    if fold_case:
+        folded: Dict[int, int] = dict()
+        # the other case of two letters may be the same letter (e.g. "K" and
+        # Kelvin sign), such letters are left out.
+        repeated: Set[int] = set()
+        for letter, translated in pairs:
+            other: str = chr(letter).swapcase()
+            if len(other) != 1 or ord(other) in table:
+                continue
+            if ord(other) in folded:
+                repeated.add(ord(other))
+            folded[ord(other)] = translated
+        pairs.extend(
+            (letter, translated)
+            for (letter, translated) in folded.items()
+            if letter not in repeated
+        )
+    if strip_unknown:
+        return StrippingTranslationTable(pairs)
+    return compact_table(TranslationTable(pairs))
+
+
+def compose_table(first: TABLE_TYPE, second: TABLE_TYPE) -> TABLE_TYPE:
+    """
+    Compose two translation tables into one table.
+
+    Translating a text with the composed table is the same as translating
+    it with first table and then with second table. Tables may have
+    different alphabets, letters missing from a table remain unchanged by
+    that table (or are deleted by a stripping table), so the composed
+    table covers letters of both alphabets.
+
+    :param first    : table which is applied first.
+    :param second   : table which is applied second.
+    :return         : composed table, letters which map to themselves
+                      are left out unless the composed table strips.
+    :rtype          : TranslationTable
+    """
+    strip_first: bool = isinstance(first, StrippingTranslationTable)
+    strip: bool = strip_first or isinstance(second, StrippingTranslationTable)
+    # letters outside of a stripping first table never reach second table.
+    letters: Set[int] = set(first) if strip_first else set(first).union(second)
+    composed: Dict[int, Optional[int]] = dict()
+    for letter in letters:
+        translated: Optional[int] = _lookup(first, letter)
+        if translated is not None:
+            translated = _lookup(second, translated)
+        if translated != letter or strip:
+            composed[letter] = translated
+    if strip:
+        return StrippingTranslationTable(composed)
+    return compact_table(TranslationTable(composed))
+
+
+def _lookup(table: TABLE_TYPE, letter: int) -> Optional[int]:
+    """
+    Translate one letter with a table, same as str.translate does.
+
+    :param table    : compiled translation table.
+    :param letter   : code point of letter.
+    :return         : translated code point, None if letter is deleted.
+    :rtype          : int
+    """
+    try:
+        return table[letter]
+    except KeyError:
+        return letter
+
+
+def translate(text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE:
+    """
+    Translate a string or binary data with a compiled translation table.
+
+    Letters which aren't in the table remain unchanged, binary data
+    is translated with bytes.translate and keeps its type. Compact
+    tables are expanded (see expanded_table) if the text is longer
+    than the table.
+
+    :param text     : string or binary data to be translated.
+    :param table    : compiled translation table.
+    :return         : translated text.
+    :rtype          : str, bytes or bytearray
+    """
+    if isinstance(text, str):
+        if isinstance(table, CompactTranslationTable) and len(text) > len(table):
+            return text.translate(expanded_table(table))
+        return text.translate(table)
+    if table.bytes_delete:
+        return text.translate(table.bytes_table, table.bytes_delete)
+    return text.translate(table.bytes_table)
+
+
+def expanded_table(table: "CompactTranslationTable") -> Dict[int, int]:
+    """
+    Return the expanded dictionary of a compact table.
+
+    Expansions are kept in EXPANSION_CACHE, which holds the tables only
+    by weak references and is limited in number of entries and memory,
+    so expanding doesn't keep tables, or more than EXPANSION_CACHE_BYTES
+    of dictionaries, alive.
+
+    :param table    : compact translation table.
+    :return         : dictionary which has every pair of the table.
+    :rtype          : dict
+    """
+    entry: Any = EXPANSION_CACHE.get(id(table))
+    if entry is None or entry[0]() is not table:
+        # ids are reused after a table is freed, so the reference is checked.
+        entry = (weakref.ref(table), table.expand())
+        EXPANSION_CACHE.put(id(table), entry)
+    return entry[1]
+
+
+def _expansion_size(entry: Tuple[Any, Dict[int, int]]) -> int:
+    """
+    Estimate memory used by an expanded table in bytes.
+
+    :param entry    : weak reference to table and its expanded dictionary.
+    :return         : approximate size of dictionary in bytes.
+    :rtype          : int
+    """
+    return estimate_size(entry[1])
+
+
+# expanded compact tables by id of table, see expanded_table.
+EXPANSION_CACHE: LRUCache = LRUCache(
+    EXPANSION_CACHE_SIZE, EXPANSION_CACHE_BYTES, _expansion_size
+)
+
+
+def translate_many(
+    texts: Iterable[TEXT_TYPE],
+    table: TABLE_TYPE,
+    apply_table: Callable[[TEXT_TYPE, TABLE_TYPE], TEXT_TYPE] = translate,
+) -> List[TEXT_TYPE]:
+    """
+    Translate many strings (or binary data) with one table.
+
+    Translation tables translate every letter on its own and keep length
+    of text, so texts of the same type are joined, translated in one call
+    and sliced back. Tables which delete letters change the length, their
+    texts are translated one by one.
+
+    :param texts        : strings or binary data to be translated.
+    :param table        : compiled translation table.
+    :param apply_table  : function for translating text with table.
+    :return             : translated texts in the same order.
+    :rtype              : list
+    """
+    texts = list(texts)
+    kinds: Set[type] = set(map(type, texts))
+    if len(texts) < 2 or len(kinds) != 1 or table.deletes():
+        return [apply_table(text, table) for text in texts]
+    translated: TEXT_TYPE = apply_table(kinds.pop()().join(texts), table)
+    pieces: List[TEXT_TYPE] = list()
+    start: int = 0
+    for text in texts:
+        pieces.append(translated[start:start + len(text)])
+        start += len(text)
+    return pieces
+
+
+def translate_into(
+    source: BUFFER_TYPE, destination: BUFFER_TYPE, table: TABLE_TYPE
+) -> int:
+    """
+    Translate binary data into a preallocated buffer.
+
+    Data is translated in chunks of CHUNK_SIZE bytes, so no copy of
+    the whole data is ever created. source and destination may be the
+    same buffer for translating in place. Tables which delete bytes
+    write less bytes than source.
+
+    :param source       : bytes-like data to be translated.
+    :param destination  : writable buffer at least as large as source.
+    :param table        : compiled translation table.
+    :raise ValueError   : if destination is smaller than source.
+    :return             : number of bytes written into destination.
+    :rtype              : int
+    """
+    source_view: memoryview = memoryview(source).cast("B")
+    destination_view: memoryview = memoryview(destination).cast("B")
+    length: int = len(source_view)
+    if len(destination_view) < length:
+        raise ValueError("ERROR: destination buffer is smaller than source.")
+    bytes_table: bytes = table.bytes_table
+    bytes_delete: bytes = table.bytes_delete
+    # deleted bytes make written data shorter, so writing never passes reading.
+    written: int = 0
+    for start in range(0, length, CHUNK_SIZE):
+        end: int = min(start + CHUNK_SIZE, length)
+        chunk: bytes = source_view[start:end].tobytes().translate(
+            bytes_table, bytes_delete
+        )
+        destination_view[written:written + len(chunk)] = chunk
+        written += len(chunk)
+    return written
+
+
+def reference_translate(text: str, table: TABLE_TYPE) -> str:
+    """
+    Translate a string letter by letter with a compiled translation table.
+
+    This is the reference implementation of translate function, it is
+    slow and only kept for testing and validating the fast engine.
+
+    :param text     : string to be translated.
+    :param table    : compiled translation table.
+    :return         : translated text.
+    :rtype          : str
+    """
+    # blank string.
+    translated: str = ""
+
+    # type annotations
+    translated_letter: str
+
+    # select each letter in the text and only if it is also provided in table
+    # replace it with new letter.
+    for letter in text:
+        if table.deletes(ord(letter)):
+            # letter is deleted.
+            continue
+        if ord(letter) in table:
+            # get the translated letter for this letter from table.
+            translated_letter = chr(table[ord(letter)])
+        else:
+            # if the letter in the text isn't in table, it remains unchanged.
+            translated_letter = letter
+        # add new letter to translated string.
+        translated += translated_letter
+
+    return translated
@@ -0,0 +1,97 @@
+# Stubs for mersad.util.translation_engine (Python 3)
+#
+# NOTE: This dynamically typed stub was automatically generated by stubgen.
+
+# Python Standard Library
+from array import array
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+# Mersad Library
+from mersad.util.table_cache import LRUCache
+
+TEXT_TYPE = Union[str, bytes, bytearray]
+BUFFER_TYPE = Union[bytes, bytearray, memoryview]
+CHUNK_SIZE: int
+COMPACT_THRESHOLD: int
+MINIMUM_RUN: int
+EXPANSION_CACHE_SIZE: int
+EXPANSION_CACHE_BYTES: int
+
+class TranslationTable(Dict[int, Optional[int]]):
+    _bytes_table: Optional[bytes] = ...
+    _bytes_delete: Optional[bytes] = ...
+    def __init__(self, *args: Any) -> None: ...
+    @property
+    def bytes_table(self) -> bytes: ...
+    @property
+    def bytes_delete(self) -> bytes: ...
+    def deletes(self, letter: Optional[int] = ...) -> bool: ...
+    def __reduce__(self) -> Tuple[Any, ...]: ...
+
+class CompactTranslationTable(TranslationTable):
+    _starts: List[int] = ...
+    _runs: List[array[int]] = ...
+    _length: int = ...
+    def __init__(self, *args: Any) -> None: ...
+    @classmethod
+    def from_runs(
+        cls, pairs: Dict[int, int], starts: List[int], runs: List[array[int]]
+    ) -> CompactTranslationTable: ...
+    def __missing__(self, key: int) -> int: ...
+    def __contains__(self, key: object) -> bool: ...
+    def __iter__(self) -> Iterator[int]: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __ne__(self, other: object) -> bool: ...
+    def __repr__(self) -> str: ...
+    def __sizeof__(self) -> int: ...
+    def get(self, key: int, default: Any = ...) -> Any: ...
+    def keys(self) -> Iterable[int]: ...  # type: ignore
+    def values(self) -> Iterable[int]: ...  # type: ignore
+    def items(self) -> Iterable[Tuple[int, int]]: ...  # type: ignore
+    def expand(self) -> Dict[int, int]: ...
+
+class StrippingTranslationTable(TranslationTable):
+    def __missing__(self, key: int) -> None: ...
+    def deletes(self, letter: Optional[int] = ...) -> bool: ...
+
+TABLE_TYPE = TranslationTable
+
+def _restore_table(cls: type, pairs: Dict[int, int]) -> TABLE_TYPE: ...
+def compact_table(table: TABLE_TYPE) -> TABLE_TYPE: ...
+def compile_table(mapping: Dict[str, str]) -> TABLE_TYPE: ...
+def compile_sequences(plain: str, translated: Sequence[str]) -> TABLE_TYPE: ...
+def invert_table(table: TABLE_TYPE) -> TABLE_TYPE: ...
+def case_preserving_table(table: TABLE_TYPE) -> TABLE_TYPE: ...
+def apply_table_options(
+    table: TABLE_TYPE, table_key: Tuple[Any, ...], **kwargs: Any
+) -> TABLE_TYPE: ...
+def normalizing_table(
+    table: TABLE_TYPE, fold_case: bool, strip_unknown: bool
+) -> TABLE_TYPE: ...
+def compose_table(first: TABLE_TYPE, second: TABLE_TYPE) -> TABLE_TYPE: ...
+def _lookup(table: TABLE_TYPE, letter: int) -> Optional[int]: ...
+def translate(text: TEXT_TYPE, table: TABLE_TYPE) -> TEXT_TYPE: ...
+def expanded_table(table: CompactTranslationTable) -> Dict[int, int]: ...
+def _expansion_size(entry: Tuple[Any, Dict[int, int]]) -> int: ...
+
+EXPANSION_CACHE: LRUCache
+
+def translate_many(
+    texts: Iterable[TEXT_TYPE],
+    table: TABLE_TYPE,
+    apply_table: Callable[[TEXT_TYPE, TABLE_TYPE], TEXT_TYPE] = ...,
+) -> List[TEXT_TYPE]: ...
+def translate_into(
+    source: BUFFER_TYPE, destination: BUFFER_TYPE, table: TABLE_TYPE
+) -> int: ...
+def reference_translate(text: str, table: TABLE_TYPE) -> str: ...
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark memory of resident agents.
+
+Usage: PYTHONPATH=. python3 script/benchmark_agent_memory.py [agents]
+
+Creates the given number of Shift cipher agents (default 1,000,000),
+each one with its own key, once as full agents and once as compact
+agents, and prints the memory allocated per agent measured by tracemalloc.
+"""
+
+# Python Standard Library
+import gc
+import sys
+import tracemalloc
+
+# Mersad Library
+from mersad.classical.shift_cipher import ShiftCipher
+from mersad.util.base_class import CompactAgent
+
+AGENTS = 1000000
+
+
+def full_agents(count):
+    return [ShiftCipher(key=i) for i in range(count)]
+
+
+def compact_agents(count):
+    return [CompactAgent(ShiftCipher, key=i) for i in range(count)]
+
+
+def measure(create, count):
+    gc.collect()
+    tracemalloc.start()
+    agents = create(count)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del agents
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else AGENTS
+    # create shared defaults before measuring.
+    CompactAgent(ShiftCipher, key=0).encrypt("warm up")
+    print(
+        "{:>8} {:>10} {:>14} {:>12}".format(
+            "agent", "count", "total (MiB)", "bytes/agent"
+        )
+    )
+    for name, create in (("full", full_agents), ("compact", compact_agents)):
+        size = measure(create, count)
+        print(
+            "{:>8} {:>10} {:>14.1f} {:>12.1f}".format(
+                name, count, size / 2 ** 20, size / count
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
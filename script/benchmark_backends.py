@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+"""
+Calibrate automatic selection of translation backends.
+
+Usage: PYTHONPATH=. python3 script/benchmark_backends.py
+
+Times every translation backend on ASCII strings, other strings and
+binary data of 16 up to 64k letters and prints the minimum text length
+from which each backend is selected (None means never). Copy the result
+into THRESHOLDS of mersad/util/translation_backend.py to change defaults.
+"""
+
+from mersad.util import translation_backend
+
+
+def main():
+    print("{:>8} {:>8} {:>12}".format("backend", "kind", "threshold"))
+    for (name, kind), threshold in translation_backend.calibrate().items():
+        print("{:>8} {:>8} {:>12}".format(name, kind, str(threshold)))
+
+
+if __name__ == "__main__":
+    main()
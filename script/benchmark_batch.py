@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark batch encryption of many small messages.
+
+Usage: PYTHONPATH=. python3 script/benchmark_batch.py [messages]
+
+Encrypts a batch of short messages (10k by default) with one agent,
+message by message with encrypt() and at once with encrypt_many(), and
+prints the time per message and messages per second of each way.
+"""
+
+# Python Standard Library
+import random
+import string
+import sys
+import timeit
+
+# Mersad Library
+from mersad.classical.affine_cipher import AffineCipher
+from mersad.classical.shift_cipher import ShiftCipher
+
+MESSAGES = 10000
+REPEAT = 5
+
+
+def messages(count):
+    generator = random.Random(0)
+    letters = string.ascii_letters + " .,"
+    return [
+        "".join(generator.choice(letters) for _ in range(generator.randint(20, 200)))
+        for _ in range(count)
+    ]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else MESSAGES
+    batch = messages(count)
+    print(
+        "{:>8} {:>14} {:>12} {:>14}".format("cipher", "method", "us / msg", "msg / s")
+    )
+    for agent in (ShiftCipher(key=173), AffineCipher(key=125)):
+        ways = {
+            "encrypt": lambda: [agent.encrypt(message) for message in batch],
+            "encrypt_many": lambda: agent.encrypt_many(batch),
+        }
+        for name, run in ways.items():
+            seconds = min(timeit.repeat(run, number=1, repeat=REPEAT))
+            print(
+                "{:>8} {:>14} {:>12.2f} {:>14.0f}".format(
+                    type(agent).__name__[:-6].lower(),
+                    name,
+                    seconds * 1e6 / count,
+                    count / seconds,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark table construction of monoalphabetic ciphers.
+
+Usage: PYTHONPATH=. python3 script/benchmark_table_build.py
+
+Builds encryption tables of Shift, Affine, Atbash and Mixalph ciphers
+for alphabets of 1k up to 100k letters (bypassing the table cache) and
+prints the build time and time per letter, which should stay roughly
+constant if building a table takes linear time.
+"""
+
+# Python Standard Library
+import random
+import timeit
+
+# Mersad Library
+from mersad.classical.affine_cipher import _build_affine_cipher_table
+from mersad.classical.atbash_cipher import _build_atbash_cipher_table
+from mersad.classical.mixalph_cipher import _build_mixalph_cipher_table
+from mersad.classical.shift_cipher import _build_shift_cipher_table
+
+SIZES = [1000, 10000, 20000, 50000, 100000]
+REPEAT = 5
+
+
+def alphabet(size):
+    # letters outside of the basic multilingual plane, so there is no surrogate.
+    return "".join(map(chr, range(0x20000, 0x20000 + size)))
+
+
+def shuffled(text):
+    letters = list(text)
+    random.Random(0).shuffle(letters)
+    return "".join(letters)
+
+
+def builders(sequence):
+    key = shuffled(sequence)
+    return {
+        "shift": lambda: _build_shift_cipher_table(sequence, 173, False, 0, False),
+        # key a = 1 is coprime with every length.
+        "affine": lambda: _build_affine_cipher_table(
+            sequence, len(sequence) + 7, False, 0, False
+        ),
+        "atbash": lambda: _build_atbash_cipher_table(sequence, False, 0),
+        "mixalph": lambda: _build_mixalph_cipher_table(
+            key, sequence, False, 0, False
+        ),
+    }
+
+
+def main():
+    print(
+        "{:>8} {:>8} {:>12} {:>14}".format(
+            "cipher", "letters", "build (ms)", "ns / letter"
+        )
+    )
+    for size in SIZES:
+        for name, build in builders(alphabet(size)).items():
+            seconds = min(timeit.repeat(build, number=1, repeat=REPEAT))
+            print(
+                "{:>8} {:>8} {:>12.2f} {:>14.1f}".format(
+                    name, size, seconds * 1e3, seconds * 1e9 / size
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
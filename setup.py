@@ -145,6 +145,11 @@ package_data = {
 # dependencies
 install_requires = ["ErfanIO"]
 
+# optional dependencies
+extras_require = {
+    "numpy": ["numpy"]
+}
+
 # command line programs
 entry_points = {
     "console_scripts": [
@@ -172,5 +177,6 @@ setup(
         platforms="Posix; Windows; MacOS X",
         classifiers=classifiers,
         python_requires=">=3.6",
-        install_requires=install_requires
+        install_requires=install_requires,
+        extras_require=extras_require
 )